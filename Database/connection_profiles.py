@@ -0,0 +1,50 @@
+import os
+
+# SQLite 連線設定檔：journal_mode / synchronous / mmap_size / cache_size / temp_store / busy_timeout
+CONNECTION_PROFILES = {
+    # SQLite 預設值：rollback journal，每次提交完整 fsync
+    "compatible": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "mmap_size": 0,
+        "cache_size": -2000,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,
+    },
+    # WAL 並維持完整 fsync，提交只需寫入 WAL 一次
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "mmap_size": 64 * 1024 * 1024,
+        "cache_size": -8000,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # WAL + NORMAL：斷電時可能遺失最後幾筆提交，但不會損毀資料庫
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 128 * 1024 * 1024,
+        "cache_size": -16000,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
+
+DEFAULT_PROFILE = "durable"
+
+
+# 環境變數優先，其次是設定檔中的值
+def resolve_profile_name(profile_name=None):
+    name = os.getenv("PASSWORD_MANAGER_DB_PROFILE") or profile_name or DEFAULT_PROFILE
+    return name if name in CONNECTION_PROFILES else DEFAULT_PROFILE
+
+
+def apply_connection_profile(conn, profile_name):
+    profile = CONNECTION_PROFILES[profile_name]
+    conn.execute(f"PRAGMA journal_mode = {profile['journal_mode']}")
+    conn.execute(f"PRAGMA synchronous = {profile['synchronous']}")
+    conn.execute(f"PRAGMA mmap_size = {int(profile['mmap_size'])}")
+    conn.execute(f"PRAGMA cache_size = {int(profile['cache_size'])}")
+    conn.execute(f"PRAGMA temp_store = {profile['temp_store']}")
+    conn.execute(f"PRAGMA busy_timeout = {int(profile['busy_timeout'])}")
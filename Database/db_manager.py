@@ -1,14 +1,58 @@
 import sqlite3
 import os
-from utils.password_encryption import encrypt_password, decrypt_password
+from itertools import islice
+from utils.password_encryption import (create_cipher, decrypt_with_cipher,
+                                       encrypt_entry, decrypt_entry,
+                                       generate_vault_key, wrap_vault_key, unwrap_vault_key,
+                                       create_vault_cipher)
 from utils.path_helper import get_database_path
+from utils.crypto_executor import CryptoExecutor
+from utils.name_search_index import NameSearchIndex
+from utils.entry_cache import EntryCache
+from utils.instrumentation import increment, instrument_methods
+from Database.migrations import migrate
+from Database.connection_profiles import resolve_profile_name, apply_connection_profile
+
+# 相鄰條目 order_index 的間距，拖曳排序時插在兩者之間，只需更新被移動的那一筆
+# 每次插入都把間距減半，2**32 可在同一處連續插入 32 次才需要重新編排；十萬筆時最大值仍遠小於 2**63
+ORDER_GAP = 2 ** 32
+
+# 讀取條目時需要的欄位：record 為新格式，account/password/notes 為尚未升級的舊格式
+ENTRY_COLUMNS = "rowid, name, record, account, password, notes, category"
+
+
+# 條目無法以目前的金鑰解密；不回傳空白內容，避免被快取或在編輯後覆寫原本的資料
+class EntryDecryptError(ValueError):
+    def __init__(self, name):
+        super().__init__(f"條目「{name}」無法解密")
+        self.name = name
+
+
+# 資料金鑰無法解開或遷移失敗，或尚未登入就讀寫條目；一律中止，不以明文寫入或回傳密文
+class VaultKeyError(RuntimeError):
+    pass
+
 
 class DBManager:
-    def __init__(self):
+    def __init__(self, crypto_executor=None, profile=None, entry_cache=None):
         self.conn = None
         self.cursor = None
         self.master_password = None
         self._cached_salt = None  # 緩存 salt 避免重複查詢
+        self._session_cipher = None  # 登入期間共用的加密器，避免每個欄位重新推導金鑰
+        self._vault_key = None  # 解開後的資料金鑰，變更主密碼時重新包裝用
+        self._pending_vault_key = None  # 金鑰輪替進行中時的新資料金鑰
+        # 整個金庫的加解密交給引擎平行處理（預設執行緒池）
+        self.crypto_executor = crypto_executor or CryptoExecutor.from_env()
+        # 已解密條目的快取，重複開啟同一筆時不必再查詢與解密
+        self.entry_cache = entry_cache or EntryCache.from_env()
+        # 條目內容或工作階段改變時遞增，背景預先解密的結果若已過時就丟棄
+        self._entry_version = 0
+        # 連線設定檔，PASSWORD_MANAGER_DB_PROFILE 優先於設定值
+        self.profile = resolve_profile_name(profile)
+        # 名稱搜尋索引在第一次搜尋時建立，之後隨本連線的寫入同步更新
+        self.name_index = NameSearchIndex()
+        self._name_index_version = None
         self.setup_connection()
         
     # 設置資料庫連接並初始化資料庫
@@ -18,27 +62,13 @@ class DBManager:
         db_path = get_database_path()
 
         self.conn = sqlite3.connect(db_path)
+        apply_connection_profile(self.conn, self.profile)
         self.cursor = self.conn.cursor()
         self.setup_db()
     
-    # 設置資料庫表結構
+    # 設置資料庫表結構，依 user_version 套用尚未執行的遷移
     def setup_db(self):
-        # 建立主密碼表
-        self.cursor.execute('''CREATE TABLE IF NOT EXISTS master_password (
-                            id INTEGER PRIMARY KEY, 
-                            password TEXT NOT NULL,
-                            salt BLOB NOT NULL)''')
-        # 建立密碼存儲表
-        self.cursor.execute('''CREATE TABLE IF NOT EXISTS passwords (
-                            id INTEGER NOT NULL UNIQUE, 
-                            name TEXT NOT NULL, 
-                            account TEXT, 
-                            password TEXT, 
-                            notes TEXT,
-                            order_index INTEGER,
-                            category TEXT)''')
-        
-        self.conn.commit()
+        migrate(self.conn)
     
     def has_master_password(self):
         self.cursor.execute("SELECT 1 FROM master_password LIMIT 1")
@@ -49,6 +79,7 @@ class DBManager:
                             (hashed_password, salt))
         self.conn.commit()
         self._cached_salt = salt
+        self.clear_session()
     
     def get_master_password(self):
         self.cursor.execute("SELECT password, salt FROM master_password LIMIT 1")
@@ -58,16 +89,214 @@ class DBManager:
             return result[0], result[1]
         return None, None
     
-    def update_master_password(self, hashed_password, salt):
-        self.cursor.execute("UPDATE master_password SET password = ?, salt = ? WHERE id = 1", 
-                            (hashed_password, salt))
+    # 變更主密碼：只需用新密碼重新包裝資料金鑰，不必重新加密所有條目
+    def update_master_password(self, hashed_password, salt, new_password):
+        if self._vault_key is None:
+            return False
+
+        new_master_cipher = create_cipher(new_password, salt)
+        wrapped_key = wrap_vault_key(self._vault_key, new_master_cipher)
+        self.cursor.execute("UPDATE master_password SET password = ?, salt = ?, wrapped_key = ? WHERE id = 1", 
+                            (hashed_password, salt, wrapped_key))
+        # 輪替尚未完成時，新資料金鑰也要改用新密碼包裝，兩者在同一個交易中寫入
+        if self._pending_vault_key is not None:
+            self.cursor.execute("UPDATE rekey_journal SET new_wrapped_key = ? WHERE id = 1",
+                                (wrap_vault_key(self._pending_vault_key, new_master_cipher),))
         self.conn.commit()
         self._cached_salt = salt
+        self.master_password = new_password
+        return True
     
+    # 資料金鑰無法解開或遷移失敗時清除工作階段並拋出 VaultKeyError，登入必須中止
     def set_current_master_password(self, password):
         self.master_password = password
         if self._cached_salt is None:
             self.get_master_password()
+        self._session_cipher = None
+        self._vault_key = None
+        self._pending_vault_key = None
+        self.entry_cache.clear()
+        self._entry_version += 1
+
+        salt = self.get_master_salt()
+        if not salt:
+            raise VaultKeyError("尚未設定主密碼")
+
+        # 登入時推導一次金鑰並解開資料金鑰，整個工作階段共用
+        master_cipher = create_cipher(password, salt)
+        wrapped_key = self.get_wrapped_vault_key()
+        if wrapped_key:
+            try:
+                self._set_vault_key(unwrap_vault_key(wrapped_key, master_cipher),
+                                    self._load_pending_vault_key(master_cipher))
+            except Exception as e:
+                self.clear_session()
+                raise VaultKeyError(f"資料金鑰解開失敗: {e}") from e
+        else:
+            self._migrate_to_vault_key(master_cipher)
+
+    # 在目前的執行緒建立獨立連線，沿用既有工作階段的金鑰（背景工作用）
+    @classmethod
+    def from_session(cls, db_manager):
+        session = cls(profile=db_manager.profile)
+        session.master_password = db_manager.master_password
+        session._cached_salt = db_manager._cached_salt
+        if db_manager._vault_key is not None:
+            session._set_vault_key(db_manager._vault_key, db_manager._pending_vault_key)
+        return session
+
+    # 登出時清除主密碼與工作階段金鑰
+    def clear_session(self):
+        self.master_password = None
+        self._session_cipher = None
+        self._vault_key = None
+        self._pending_vault_key = None
+        self.name_index.clear()
+        self.entry_cache.clear()
+        self._entry_version += 1
+
+    def _get_session_cipher(self):
+        return self._session_cipher
+
+    def _set_vault_key(self, vault_key, pending_vault_key=None):
+        self._vault_key = vault_key
+        self._pending_vault_key = pending_vault_key
+        self._session_cipher = create_vault_cipher(self._get_session_keys())
+
+    # 交給加密器的金鑰：輪替進行中時為 (新金鑰, 舊金鑰)
+    def _get_session_keys(self):
+        if self._pending_vault_key is not None:
+            return (self._pending_vault_key, self._vault_key)
+        return self._vault_key
+
+    def get_wrapped_vault_key(self):
+        self.cursor.execute("SELECT wrapped_key FROM master_password LIMIT 1")
+        result = self.cursor.fetchone()
+        return result[0] if result else None
+
+    # 一次性遷移：舊版條目直接以主密碼金鑰加密，改為以新的資料金鑰重新加密
+    # 無法以目前主密碼解密的條目（例如重設密碼中斷後仍以舊 salt 加密）保留原本的舊格式欄位，不覆寫成空白
+    # 回傳無法遷移的條目名稱；寫入失敗時清除工作階段並拋出 VaultKeyError
+    def _migrate_to_vault_key(self, master_cipher):
+        vault_key = generate_vault_key()
+
+        self.cursor.execute("SELECT rowid, name, account, password, notes FROM passwords")
+        rowids = []
+        fields_list = []
+        failed_names = []
+        for rowid, name, account, password, notes in self.cursor.fetchall():
+            encrypted_fields = (account, password, notes)
+            fields = tuple(decrypt_with_cipher(field, master_cipher) for field in encrypted_fields)
+            # 非空的密文解密後必定非空，解出空字串表示解密失敗
+            if all(bool(plain) == bool(encrypted) for plain, encrypted in zip(fields, encrypted_fields)):
+                rowids.append(rowid)
+                fields_list.append(fields)
+            else:
+                failed_names.append(name)
+
+        # 暫時以資料金鑰作為工作階段加密器，直接寫成新的 record 格式
+        self._set_vault_key(vault_key)
+        updates = [encoded + (rowid,) for encoded, rowid in zip(self._encode_entries(fields_list), rowids)]
+
+        # 條目與資料金鑰在同一個交易中寫入，中途失敗不會留下混用金鑰的資料
+        try:
+            self.cursor.executemany("UPDATE passwords SET record = ?, account = ?, password = ?, notes = ? WHERE rowid = ?",
+                                    updates)
+            self.cursor.execute("UPDATE master_password SET wrapped_key = ? WHERE id = 1",
+                                (wrap_vault_key(vault_key, master_cipher),))
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            self.clear_session()
+            raise VaultKeyError(f"資料金鑰遷移失敗: {e}") from e
+
+        if failed_names:
+            print(f"資料金鑰遷移: {len(failed_names)} 筆條目無法以目前的主密碼解密，保留原本的加密內容: "
+                  f"{', '.join(failed_names)}")
+        return failed_names
+
+    # 資料金鑰輪替：產生新金鑰並寫入進度記錄，之後由 rotate_key_batch 分批重新加密
+    # 輪替期間新舊金鑰同時有效，任何時候中斷都能正常讀取，下次登入再繼續
+    def begin_key_rotation(self):
+        if self._vault_key is None or not self.master_password:
+            return False
+        if self.has_pending_key_rotation():
+            return True
+
+        new_vault_key = generate_vault_key()
+        master_cipher = create_cipher(self.master_password, self.get_master_salt())
+        self.cursor.execute("SELECT COUNT(*) FROM passwords")
+        total = self.cursor.fetchone()[0]
+        self.cursor.execute("INSERT INTO rekey_journal (id, new_wrapped_key, total) VALUES (1, ?, ?)",
+                            (wrap_vault_key(new_vault_key, master_cipher), total))
+        self.conn.commit()
+        self._set_vault_key(self._vault_key, new_vault_key)
+        self._entry_version += 1
+        return True
+
+    def has_pending_key_rotation(self):
+        self.cursor.execute("SELECT 1 FROM rekey_journal WHERE id = 1")
+        return self.cursor.fetchone() is not None
+
+    def _load_pending_vault_key(self, master_cipher):
+        self.cursor.execute("SELECT new_wrapped_key FROM rekey_journal WHERE id = 1")
+        result = self.cursor.fetchone()
+        return unwrap_vault_key(result[0], master_cipher) if result else None
+
+    # 以新金鑰重新加密 last_rowid 之後的一批條目，條目與進度在同一個交易中提交
+    # 回傳 (已完成筆數, 總筆數, 是否全部完成)；沒有進行中的輪替時回傳 None
+    def rotate_key_batch(self, batch_size=1024):
+        self.cursor.execute("SELECT last_rowid, done, total FROM rekey_journal WHERE id = 1")
+        journal = self.cursor.fetchone()
+        if journal is None:
+            return None
+        if self._pending_vault_key is None:
+            raise RuntimeError("尚未載入新的資料金鑰")
+
+        last_rowid, done, total = journal
+        self.cursor.execute(f"SELECT {ENTRY_COLUMNS} FROM passwords WHERE rowid > ? ORDER BY rowid ASC LIMIT ?",
+                            (last_rowid, batch_size))
+        rows = self.cursor.fetchall()
+        if not rows:
+            self._finish_key_rotation()
+            return done, max(done, total), True
+
+        # 解密與加密都交給加解密引擎分段平行處理，加密時使用新金鑰
+        # 任何一筆無法解密時拋出 EntryDecryptError 中止，避免以空白內容覆蓋原本的資料
+        fields_list = [entry[1:4] for entry in self._decrypt_entry_rows(rows, upgrade=False)]
+        updates = [encoded + (row[0],) for encoded, row in zip(self._encode_entries(fields_list), rows)]
+        try:
+            self.cursor.executemany("UPDATE passwords SET record = ?, account = ?, password = ?, notes = ? WHERE rowid = ?",
+                                    updates)
+            self.cursor.execute("UPDATE rekey_journal SET last_rowid = ?, done = done + ? WHERE id = 1",
+                                (rows[-1][0], len(rows)))
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        done += len(rows)
+        return done, max(done, total), False
+
+    # 全部條目完成後，新金鑰取代舊金鑰並刪除進度記錄
+    def _finish_key_rotation(self):
+        self.cursor.execute("SELECT new_wrapped_key FROM rekey_journal WHERE id = 1")
+        new_wrapped_key = self.cursor.fetchone()[0]
+        try:
+            self.cursor.execute("UPDATE master_password SET wrapped_key = ? WHERE id = 1", (new_wrapped_key,))
+            self.cursor.execute("DELETE FROM rekey_journal")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        self._set_vault_key(self._pending_vault_key)
+        self._entry_version += 1
+
+    # 背景連線完成輪替後，主連線改用新金鑰
+    def finish_key_rotation_session(self):
+        if self._pending_vault_key is not None and not self.has_pending_key_rotation():
+            self._set_vault_key(self._pending_vault_key)
+            self._entry_version += 1
     
     def get_master_salt(self):
         if self._cached_salt is not None:
@@ -80,78 +309,151 @@ class DBManager:
             return result[0]
         return None
     
-    # 將資料庫撈出的條目列表批次解密
-    def _decrypt_entry_rows(self, rows):
+    # 將資料庫撈出的條目列表批次解密，順便升級舊格式的條目
+    # 任何一筆無法解密時拋出 EntryDecryptError，不以空白內容代替；尚未登入時拋出 VaultKeyError
+    def _decrypt_entry_rows(self, rows, upgrade=True):
+        if self._vault_key is None:
+            raise VaultKeyError("尚未載入資料金鑰")
+
+        # 新格式的條目交給加解密引擎平行解密，結果順序與 rows 相同
+        record_tokens = [row[2] for row in rows if row[2]]
+        decrypted_records = iter(self.crypto_executor.decrypt_entries(self._get_session_keys(), record_tokens))
+
+        increment("db.entry_decrypts", len(rows))
         decrypted_entries = []
-        for name, account, password, notes, category in rows:
-            decrypted_account, decrypted_password, decrypted_notes = self._decrypt_entry_fields(
-                account, password, notes)
-            decrypted_entries.append((name, decrypted_account, decrypted_password, decrypted_notes, category))
+        upgrades = []
+        for rowid, name, record, account, password, notes, category in rows:
+            if record:
+                fields = next(decrypted_records)
+            else:
+                fields = self._decrypt_entry_fields(account, password, notes)
+                if self._is_upgradable(fields, (account, password, notes)):
+                    upgrades.append(self._encode_entry(*fields) + (rowid,))
+                else:
+                    fields = None
+            if fields is None:
+                increment("db.decrypt_failures")
+                raise EntryDecryptError(name)
+            decrypted_entries.append((name, *fields, category))
+
+        if upgrade:
+            self._upgrade_legacy_rows(upgrades)
         return decrypted_entries
 
-    
-    # 統一的解密方法
+    # 舊格式：三個欄位各自加密
     def _decrypt_entry_fields(self, encrypted_account, encrypted_password, encrypted_notes):
-        if not self.master_password:
-            return encrypted_account, encrypted_password, encrypted_notes
-        
-        salt = self.get_master_salt()
-        if not salt:
-            return encrypted_account, encrypted_password, encrypted_notes
-        
+        cipher = self._get_session_cipher()
         try:
-            decrypted_account = decrypt_password(encrypted_account, self.master_password, salt)
-            decrypted_password = decrypt_password(encrypted_password, self.master_password, salt)
-            decrypted_notes = decrypt_password(encrypted_notes, self.master_password, salt)
+            decrypted_account = decrypt_with_cipher(encrypted_account, cipher)
+            decrypted_password = decrypt_with_cipher(encrypted_password, cipher)
+            decrypted_notes = decrypt_with_cipher(encrypted_notes, cipher)
             return decrypted_account, decrypted_password, decrypted_notes
         except Exception:
             return encrypted_account, encrypted_password, encrypted_notes
-    
-    # 統一的加密方法
-    def _encrypt_entry_fields(self, account, password, notes):
-        if not self.master_password:
-            return account, password, notes
-        
-        salt = self.get_master_salt()
-        if not salt:
-            return account, password, notes
-        
-        encrypted_account = encrypt_password(account, self.master_password, salt)
-        encrypted_password = encrypt_password(password, self.master_password, salt)
-        encrypted_notes = encrypt_password(notes, self.master_password, salt)
-        return encrypted_account, encrypted_password, encrypted_notes
+
+    # 統一的加密方法，回傳 (record, account, password, notes) 供寫入
+    # 新格式：帳號、密碼、備註序列化後只加密一次；尚未載入資料金鑰時拋出 VaultKeyError，絕不寫入明文
+    def _encode_entry(self, account, password, notes):
+        cipher = self._get_session_cipher()
+        if cipher is None:
+            raise VaultKeyError("尚未載入資料金鑰")
+        return encrypt_entry(account, password, notes, cipher), None, None, None
+
+    # 批次版本，交給加解密引擎平行加密
+    def _encode_entries(self, fields_list):
+        if self._vault_key is None:
+            raise VaultKeyError("尚未載入資料金鑰")
+        return [(record, None, None, None)
+                for record in self.crypto_executor.encrypt_entries(self._get_session_keys(), fields_list)]
+
+    # 只有每個非空欄位都成功解密時才升級，避免把解不開的資料覆寫成空字串
+    def _is_upgradable(self, decrypted_fields, encrypted_fields):
+        return all(bool(plain) == bool(encrypted) for plain, encrypted in zip(decrypted_fields, encrypted_fields))
+
+    def _upgrade_legacy_rows(self, upgrades):
+        if not upgrades:
+            return
+        self.cursor.executemany("UPDATE passwords SET record = ?, account = ?, password = ?, notes = ? WHERE rowid = ?",
+                                upgrades)
+        self.conn.commit()
     
     def get_all_names(self):
         self.cursor.execute("SELECT name FROM passwords ORDER BY order_index ASC")
         return [row[0] for row in self.cursor.fetchall()]
     
+    # 條目不存在時回傳 None，無法解密時拋出 EntryDecryptError 且不放進快取
     def get_password_entry(self, name):
-        self.cursor.execute("SELECT account, password, notes, category FROM passwords WHERE name = ?", (name,))
+        self.entry_cache.purge_expired()
+        cached = self.entry_cache.get(name)
+        if cached is not None:
+            return cached
+
+        self.cursor.execute(f"SELECT {ENTRY_COLUMNS} FROM passwords WHERE name = ?", (name,))
         entry = self.cursor.fetchone()
         
         if not entry:
             return None
         
-        encrypted_account, encrypted_password, encrypted_notes, category = entry
-        decrypted_account, decrypted_password, decrypted_notes = self._decrypt_entry_fields(
-            encrypted_account, encrypted_password, encrypted_notes)
-        
-        return (decrypted_account, decrypted_password, decrypted_notes, category)
+        _, account, password, notes, category = self._decrypt_entry_rows([entry])[0]
+        result = (account, password, notes, category)
+        self.entry_cache.put(entry[0], name, result)
+        return result
     
+    # 預先解密：在主執行緒取出尚未快取的新格式條目，回傳 (資料金鑰, 條目版本, rows) 交給背景執行緒
+    # rows 為 [(rowid, name, record, category), ...]；沒有需要解密的條目時回傳 None
+    def get_prefetch_job(self, names):
+        if self._vault_key is None:
+            return None
+        names = [name for name in dict.fromkeys(names) if name and not self.entry_cache.contains(name)]
+        if not names:
+            return None
+        placeholders = ", ".join("?" * len(names))
+        self.cursor.execute(f"SELECT rowid, name, record, category FROM passwords "
+                            f"WHERE name IN ({placeholders}) AND record IS NOT NULL", names)
+        rows = self.cursor.fetchall()
+        return (self._get_session_keys(), self._entry_version, rows) if rows else None
+
+    # 把背景解密的結果放進快取；期間條目被修改或已登出時丟棄，回傳放入的筆數
+    def cache_prefetched_entries(self, entry_version, entries):
+        if entry_version != self._entry_version or self._vault_key is None:
+            return 0
+        cached = 0
+        for entry_id, name, value in entries:
+            if not self.entry_cache.contains(name):
+                self.entry_cache.put(entry_id, name, value)
+                cached += 1
+        return cached
+
     # 獲取所有密碼條目，按順序排列
     def get_all_entries(self):
-        self.cursor.execute("SELECT name, account, password, notes, category FROM passwords ORDER BY order_index ASC")
-        rows = self.cursor.fetchall()
-        return self._decrypt_entry_rows(rows) if self.master_password else rows
+        self.cursor.execute(f"SELECT {ENTRY_COLUMNS} FROM passwords ORDER BY order_index ASC")
+        return self._decrypt_entry_rows(self.cursor.fetchall())
     
     def get_entries_by_category(self, category):
         if category == "全部" or not category:
             return self.get_all_entries()
         
-        self.cursor.execute("""SELECT name, account, password, notes, category FROM passwords WHERE category = ? ORDER BY order_index ASC""", 
+        self.cursor.execute(f"SELECT {ENTRY_COLUMNS} FROM passwords WHERE category = ? ORDER BY order_index ASC", 
                             (category,))
-        rows = self.cursor.fetchall()
-        return self._decrypt_entry_rows(rows) if self.master_password else rows
+        return self._decrypt_entry_rows(self.cursor.fetchall())
+
+    # 以獨立游標分段讀取並解密，一次只在記憶體中保留一段資料（串流匯出用）
+    def iter_entries(self, category=None, chunk_size=500):
+        cursor = self.conn.cursor()
+        try:
+            if category == "全部" or not category:
+                cursor.execute(f"SELECT {ENTRY_COLUMNS} FROM passwords ORDER BY order_index ASC")
+            else:
+                cursor.execute(f"SELECT {ENTRY_COLUMNS} FROM passwords WHERE category = ? ORDER BY order_index ASC",
+                               (category,))
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                # 讀取途中不回寫升級，避免在游標尚未讀完時修改資料表
+                yield from self._decrypt_entry_rows(rows, upgrade=False)
+        finally:
+            cursor.close()
 
     # 獲取所有不為空的分類
     def get_all_categories(self):
@@ -163,53 +465,171 @@ class DBManager:
         result = self.cursor.fetchone()
         return result[0] if result else None
     
+    # 名稱已存在時回傳 False
     def add_password_entry(self, name, account, password, notes, category=None):
-        encrypted_account, encrypted_password, encrypted_notes = self._encrypt_entry_fields(account, password, notes)
-        
-        # 獲取新的 ID 和順序索引
-        self.cursor.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM passwords")
-        new_id = self.cursor.fetchone()[0]
+        record, stored_account, stored_password, stored_notes = self._encode_entry(account, password, notes)
         
-        self.cursor.execute("SELECT COALESCE(MAX(order_index), -1) + 1 FROM passwords")
+        # 獲取新的順序索引，id 由 SQLite 自動配發且之後不再變動
+        self.cursor.execute("SELECT COALESCE(MAX(order_index), ?) + ? FROM passwords", (-ORDER_GAP, ORDER_GAP))
         new_order_index = self.cursor.fetchone()[0]
         
-        self.cursor.execute("""INSERT INTO passwords (id, name, account, password, notes, order_index, category) VALUES (?, ?, ?, ?, ?, ?, ?)""", 
-                            (new_id, name, encrypted_account, encrypted_password, encrypted_notes, new_order_index, category))
+        try:
+            self.cursor.execute("""INSERT INTO passwords (name, record, account, password, notes, order_index, category) VALUES (?, ?, ?, ?, ?, ?, ?)""", 
+                                (name, record, stored_account, stored_password, stored_notes, new_order_index, category))
+        except sqlite3.IntegrityError:
+            self.conn.rollback()
+            return False
         self.conn.commit()
+        self.name_index.add(name, new_order_index, category)
+        return True
     
+    # 批次新增條目：順序索引只計算一次，分段以 executemany 寫入
+    # atomic=True 時全部在同一個交易中，取消即全部回復，任何一段失敗時全部回復並拋出原本的例外
+    # atomic=False 時每段各自提交，失敗的段落回復後略過並繼續下一段，錯誤訊息加入 errors；
+    # 未提供 errors 時在其餘段落完成後拋出第一個錯誤
+    # progress_callback(已處理筆數, 是否已提交) 在每段寫入後呼叫，should_cancel() 在每段寫入前檢查
+    # 回傳實際寫入的筆數
+    def add_password_entries_bulk(self, entries, chunk_size=500, atomic=True,
+                                  progress_callback=None, should_cancel=None, errors=None):
+        self.cursor.execute("SELECT COALESCE(MAX(order_index), ?) + ? FROM passwords", (-ORDER_GAP, ORDER_GAP))
+        next_order_index = self.cursor.fetchone()[0]
+        # 大量寫入後整個重建比逐筆更新索引便宜，下次搜尋時重建
+        self.name_index.clear()
+
+        inserted = 0
+        processed = 0
+        first_error = None
+        iterator = iter(entries)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            if should_cancel and should_cancel():
+                # 取消時捨棄尚未提交的部分
+                self.conn.rollback()
+                return 0 if atomic else inserted
+
+            chunk_start = processed
+            processed += len(chunk)
+            try:
+                self._insert_entry_chunk(chunk, next_order_index + chunk_start * ORDER_GAP)
+                if not atomic:
+                    self.conn.commit()
+            except Exception as e:
+                self.conn.rollback()
+                if atomic:
+                    raise
+                # 只捨棄失敗的這一段，之後的段落照常寫入
+                first_error = first_error or e
+                if errors is not None:
+                    errors.append(f"第 {chunk_start + 1}-{processed} 筆：{e}")
+                if progress_callback:
+                    progress_callback(processed, False)
+                continue
+
+            inserted += len(chunk)
+            if progress_callback:
+                progress_callback(processed, not atomic)
+
+        if atomic:
+            try:
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+            if progress_callback:
+                progress_callback(processed, True)
+        if first_error is not None and errors is None:
+            raise first_error
+        return inserted
+
+    def _insert_entry_chunk(self, chunk, next_order_index):
+        encoded = self._encode_entries([(account, password, notes) for _, account, password, notes, _ in chunk])
+        params = [(name, *encoded_fields, next_order_index + i * ORDER_GAP, category)
+                  for i, ((name, _, _, _, category), encoded_fields) in enumerate(zip(chunk, encoded))]
+        self.cursor.executemany("""INSERT INTO passwords (name, record, account, password, notes, order_index, category) VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                                params)
+
+    # 新名稱與其他條目重複時回傳 False
     def update_password_entry(self, old_name, new_name, account, password, notes, category=None):
-        encrypted_account, encrypted_password, encrypted_notes = self._encrypt_entry_fields(
-            account, password, notes)
+        record, stored_account, stored_password, stored_notes = self._encode_entry(account, password, notes)
         
-        self.cursor.execute("""UPDATE passwords SET name = ?, account = ?, password = ?, notes = ?, category = ? WHERE name = ?""", 
-                            (new_name, encrypted_account, encrypted_password, encrypted_notes, category, old_name))
+        try:
+            self.cursor.execute("""UPDATE passwords SET name = ?, record = ?, account = ?, password = ?, notes = ?, category = ? WHERE name = ?""", 
+                                (new_name, record, stored_account, stored_password, stored_notes, category, old_name))
+        except sqlite3.IntegrityError:
+            self.conn.rollback()
+            return False
         self.conn.commit()
+        self.entry_cache.invalidate(old_name)
+        self._entry_version += 1
+        self.name_index.rename(old_name, new_name, category)
+        return True
     
+    # id 為固定的代理鍵，刪除後不重新編號，只需一個走索引的 DELETE
     def delete_password_entry(self, name):
         self.cursor.execute("DELETE FROM passwords WHERE name = ?", (name,))
         self.conn.commit()
-        self.reorder_password_ids()
-    
-    # 重新排序 ID
-    def reorder_password_ids(self):
-        self.cursor.execute("SELECT rowid, name FROM passwords ORDER BY order_index ASC")
-        rows = self.cursor.fetchall()
-        for new_id, (rowid, name) in enumerate(rows, start=1):
-            self.cursor.execute("UPDATE passwords SET id = ? WHERE rowid = ?", (new_id, rowid))
-        self.conn.commit()
-    
-    # 批次更新順序索引
-    def update_order_indices(self, name_order_dict):
-        for name, order_index in name_order_dict.items():
-            self.cursor.execute("UPDATE passwords SET order_index = ? WHERE name = ?", 
-                                (order_index, name))
+        self.entry_cache.invalidate(name)
+        self._entry_version += 1
+        self.name_index.remove(name)
+
+    # 拖曳排序：把條目放到畫面上相鄰的 prev_name 之後、next_name 之前，只更新這一筆
+    # 以 prev 在全部條目中的下一筆為上界，分類檢視與「全部」檢視的順序保持一致
+    # 間距用完時回傳 False 且不寫入，由呼叫端在背景執行 rebalance_order_indices 後再移動一次
+    def move_entry(self, name, prev_name=None, next_name=None):
+        if not prev_name and not next_name:
+            # 列表中只有這一筆，順序不變
+            return True
+        new_order_index = self._find_order_slot(name, prev_name, next_name)
+        if new_order_index is None:
+            return False
+
+        self.cursor.execute("UPDATE passwords SET order_index = ? WHERE name = ?", (new_order_index, name))
         self.conn.commit()
-    
-    # 更新單個條目的順序索引
-    def update_order_index(self, name, order_index):
-        self.cursor.execute("UPDATE passwords SET order_index = ? WHERE name = ?", 
-                            (order_index, name))
+        self.name_index.move(name, new_order_index)
+        return True
+
+    def _find_order_slot(self, name, prev_name, next_name):
+        lower = self._get_order_index(prev_name) if prev_name else None
+        upper = self._get_order_index(next_name) if next_name else None
+
+        if lower is not None:
+            self.cursor.execute("SELECT MIN(order_index) FROM passwords WHERE order_index > ? AND name != ?",
+                                (lower, name))
+            upper = self.cursor.fetchone()[0]
+        elif upper is not None:
+            self.cursor.execute("SELECT MAX(order_index) FROM passwords WHERE order_index < ? AND name != ?",
+                                (upper, name))
+            lower = self.cursor.fetchone()[0]
+        else:
+            return None
+
+        if lower is None:
+            return upper - ORDER_GAP
+        if upper is None:
+            return lower + ORDER_GAP
+        middle = (lower + upper) // 2
+        return middle if lower < middle < upper else None
+
+    # 回傳條目的分頁鍵 (order_index, id)，條目不存在時回傳 None
+    def get_order_key(self, name):
+        self.cursor.execute("SELECT order_index, id FROM passwords WHERE name = ?", (name,))
+        return self.cursor.fetchone()
+
+    def _get_order_index(self, name):
+        self.cursor.execute("SELECT order_index FROM passwords WHERE name = ?", (name,))
+        result = self.cursor.fetchone()
+        return result[0] if result else None
+
+    # 依目前順序重新以固定間距編排 order_index；條目多時需時較久，由 RebalanceWorker 在背景執行
+    def rebalance_order_indices(self):
+        self.cursor.execute("SELECT id FROM passwords ORDER BY order_index ASC, id ASC")
+        ids = [row[0] for row in self.cursor.fetchall()]
+        self.cursor.executemany("UPDATE passwords SET order_index = ? WHERE id = ?",
+                                [(i * ORDER_GAP, entry_id) for i, entry_id in enumerate(ids)])
         self.conn.commit()
+        self.name_index.clear()
 
     # 根據分類回傳名稱清單
     def get_names_by_category(self, category):
@@ -219,6 +639,48 @@ class DBManager:
             self.cursor.execute("SELECT name FROM passwords WHERE category = ? ORDER BY order_index ASC", (category,))
         return [row[0] for row in self.cursor.fetchall()]
 
+    # 依 (order_index, id) 鍵集分頁讀取名稱，after 為上一頁最後一筆的 (order_index, id)
+    # 回傳 [(id, name, order_index), ...]，不論讀到第幾頁查詢成本都相同
+    def get_names_page(self, category=None, after=None, limit=200):
+        conditions = []
+        params = []
+        if category and category != "全部":
+            conditions.append("category = ?")
+            params.append(category)
+        if after is not None:
+            conditions.append("(order_index, id) > (?, ?)")
+            params.extend(after)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        self.cursor.execute(f"SELECT id, name, order_index FROM passwords {where} "
+                            f"ORDER BY order_index ASC, id ASC LIMIT ?", (*params, limit))
+        return self.cursor.fetchall()
+
+    # 以記憶體索引搜尋名稱，回傳依 order_index 排序的名稱清單
+    # 其他連線（例如背景匯入）寫入後 data_version 會改變，此時重建索引
+    def search_names(self, query, category=None):
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if not self.name_index.is_built() or data_version != self._name_index_version:
+            self.cursor.execute("SELECT name, order_index, category FROM passwords ORDER BY order_index ASC")
+            self.name_index.build(self.cursor.fetchall())
+            self._name_index_version = data_version
+        return self.name_index.search(query, category)
+
+    # 在安全時機（登出、匯入完成、關閉前）把 WAL 內容寫回資料庫檔案
+    def checkpoint(self, mode="PASSIVE"):
+        if not self.conn or mode not in ("PASSIVE", "FULL", "RESTART", "TRUNCATE"):
+            return
+        try:
+            self.conn.execute(f"PRAGMA wal_checkpoint({mode})")
+        except sqlite3.Error as e:
+            print(f"資料庫檢查點失敗: {e}")
+
     def close(self):
+        self.entry_cache.clear()
+        self.crypto_executor.shutdown()
         if self.conn:
-            self.conn.close()
\ No newline at end of file
+            self.checkpoint()
+            self.conn.close()
+
+
+# 設定 PASSWORD_MANAGER_DIAGNOSTICS=1 時記錄每個公開方法的耗時
+instrument_methods(DBManager, "db")
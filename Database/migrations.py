@@ -0,0 +1,130 @@
+# 資料庫結構遷移：版本記錄在 PRAGMA user_version，每個遷移在自己的交易中執行
+
+# 與 db_manager.ORDER_GAP 相同，遷移不依賴 DBManager 以免循環匯入
+ORDER_GAP = 2 ** 32
+
+# v1：原始資料表，並補上舊版資料庫缺少的欄位
+def _create_base_tables(cursor):
+    # 建立主密碼表
+    cursor.execute('''CREATE TABLE IF NOT EXISTS master_password (
+                    id INTEGER PRIMARY KEY,
+                    password TEXT NOT NULL,
+                    salt BLOB NOT NULL,
+                    wrapped_key TEXT)''')
+    # 建立密碼存儲表
+    cursor.execute('''CREATE TABLE IF NOT EXISTS passwords (
+                    id INTEGER NOT NULL UNIQUE,
+                    name TEXT NOT NULL,
+                    account TEXT,
+                    password TEXT,
+                    notes TEXT,
+                    order_index INTEGER,
+                    category TEXT,
+                    record TEXT)''')
+
+    # 舊版資料庫沒有資料金鑰欄位
+    if "wrapped_key" not in _get_columns(cursor, "master_password"):
+        cursor.execute("ALTER TABLE master_password ADD COLUMN wrapped_key TEXT")
+
+    # 舊版資料庫沒有整筆加密的 record 欄位
+    if "record" not in _get_columns(cursor, "passwords"):
+        cursor.execute("ALTER TABLE passwords ADD COLUMN record TEXT")
+
+
+# v2：改用 INTEGER PRIMARY KEY，名稱唯一，並為常用查詢建立索引
+def _add_primary_key_and_indexes(cursor):
+    _rename_duplicate_names(cursor)
+
+    cursor.execute('''CREATE TABLE passwords_new (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    record TEXT,
+                    account TEXT,
+                    password TEXT,
+                    notes TEXT,
+                    order_index INTEGER,
+                    category TEXT)''')
+    cursor.execute('''INSERT INTO passwords_new (id, name, record, account, password, notes, order_index, category)
+                    SELECT id, name, record, account, password, notes, order_index, category FROM passwords''')
+    cursor.execute("DROP TABLE passwords")
+    cursor.execute("ALTER TABLE passwords_new RENAME TO passwords")
+
+    cursor.execute("CREATE UNIQUE INDEX idx_passwords_name ON passwords (name)")
+    cursor.execute("CREATE INDEX idx_passwords_category_order ON passwords (category, order_index)")
+    cursor.execute("CREATE INDEX idx_passwords_order ON passwords (order_index)")
+
+
+# 舊版允許重複名稱，建立唯一索引前為後出現的項目加上編號
+def _rename_duplicate_names(cursor):
+    cursor.execute("SELECT rowid, name FROM passwords ORDER BY order_index ASC, rowid ASC")
+    rows = cursor.fetchall()
+    used_names = {name for _, name in rows}
+    seen = set()
+    renames = []
+    for rowid, name in rows:
+        if name not in seen:
+            seen.add(name)
+            continue
+        suffix = 2
+        while f"{name} ({suffix})" in used_names:
+            suffix += 1
+        new_name = f"{name} ({suffix})"
+        used_names.add(new_name)
+        renames.append((new_name, rowid))
+    cursor.executemany("UPDATE passwords SET name = ? WHERE rowid = ?", renames)
+
+
+# v3：舊版 order_index 為連續整數，改為固定間距以便拖曳時只更新一筆
+def _spread_order_indices(cursor):
+    cursor.execute("SELECT id FROM passwords ORDER BY order_index ASC, id ASC")
+    ids = [row[0] for row in cursor.fetchall()]
+    cursor.executemany("UPDATE passwords SET order_index = ? WHERE id = ?",
+                       [(i * ORDER_GAP, entry_id) for i, entry_id in enumerate(ids)])
+
+
+# v4：資料金鑰輪替的進度記錄，中斷後下次登入從 last_rowid 之後繼續
+def _add_rekey_journal(cursor):
+    cursor.execute('''CREATE TABLE rekey_journal (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    new_wrapped_key TEXT NOT NULL,
+                    last_rowid INTEGER NOT NULL DEFAULT 0,
+                    done INTEGER NOT NULL DEFAULT 0,
+                    total INTEGER NOT NULL DEFAULT 0)''')
+
+
+def _get_columns(cursor, table):
+    cursor.execute(f"PRAGMA table_info({table})")
+    return [row[1] for row in cursor.fetchall()]
+
+
+# v5：間距由 1024 加大為 2**32，已遷移過的資料庫重新分配一次
+MIGRATIONS = [
+    _create_base_tables,
+    _add_primary_key_and_indexes,
+    _spread_order_indices,
+    _add_rekey_journal,
+    _spread_order_indices,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def get_schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+# 依序套用尚未執行的遷移，失敗時回復該次遷移並拋出例外
+def migrate(conn):
+    version = get_schema_version(conn)
+    for target_version in range(version + 1, SCHEMA_VERSION + 1):
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN")
+            MIGRATIONS[target_version - 1](cursor)
+            cursor.execute(f"PRAGMA user_version = {target_version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
@@ -1,8 +1,12 @@
 from PyQt6.QtWidgets import QMainWindow, QApplication
 from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import QTimer
 
 from Database.db_manager import DBManager
 from utils.path_helper import resource_path
+from utils.svg_icon_add import IconHelper
+from utils.svg_icon_set import SvgIconManager
+from utils import instrumentation
 from app.main_password_widget import MainPasswordWidget
 from preferences.settings_manager import SettingsManager
 from system.auto_logout_manager import AutoLogoutManager
@@ -21,8 +25,12 @@ class PasswordManager(QMainWindow):
         self.setWindowTitle("密碼管理器")
         self.setGeometry(100, 100, 600, 500)
 
-        self.db_manager = DBManager()
         self.settings_manager = SettingsManager()
+        self.db_manager = DBManager(profile=self.settings_manager.get_setting("db_profile"))
+        # 診斷模式下一併記錄各快取的命中率
+        instrumentation.register_source("entry_cache", self.db_manager.entry_cache.stats)
+        instrumentation.register_source("icon_cache", SvgIconManager.stats)
+        instrumentation.register_source("theme_cache", self.settings_manager.theme_settings.stylesheet_cache.stats)
         self.auto_logout_manager = AutoLogoutManager(self)
         self.tray_manager = SystemTrayManager(self)
         self.close_dialog_manager = CloseDialogManager(self, self.settings_manager)
@@ -33,6 +41,9 @@ class PasswordManager(QMainWindow):
         self.auto_logout_manager.logout_requested.connect(self.controller.handle_auto_logout)
         self.tray_manager.settings_requested.connect(self.controller.open_settings)
 
+        # 先以上次偵測到的系統主題啟動監看，第一次套用主題時才不會先建立另一個主題的快取
+        self.theme_watcher = self.settings_manager.start_system_theme_watcher(
+            self, on_changed=self.tray_manager.update_tray_theme)
         self.settings_manager.apply_theme(self)
         self.main_password_widget = MainPasswordWidget(self)
         self.setCentralWidget(self.main_password_widget)
@@ -42,7 +53,10 @@ class PasswordManager(QMainWindow):
 
         self.center_window()
 
-        self.event_filter = ActivityEventFilter(self.on_user_activity)
+        # 登入畫面顯示後再預先繪製登入後會用到的圖示
+        QTimer.singleShot(0, lambda: IconHelper.prewarm(self))
+
+        self.event_filter = ActivityEventFilter(self.auto_logout_manager.record_activity)
         QApplication.instance().installEventFilter(self.event_filter)
 
     def center_window(self):
@@ -52,9 +66,6 @@ class PasswordManager(QMainWindow):
         y = (screen.height() - size.height()) // 2
         self.move(x, y)
 
-    def on_user_activity(self):
-        self.auto_logout_manager.reset_timer()
-
     def on_settings_updated(self):
         self.auto_logout_manager.update_settings()
 
@@ -69,6 +80,8 @@ class PasswordManager(QMainWindow):
             event.accept()
             if is_tray_available:
                 self.tray_manager.hide_tray_icon()
+            # 設定延遲寫入，關閉前把尚未寫入的變更存檔
+            self.settings_manager.flush()
             try:
                 self.db_manager.close()
             except Exception as e:
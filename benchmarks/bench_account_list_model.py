@@ -0,0 +1,54 @@
+# 名稱列表第一頁顯示所需時間隨條目數量的變化，分頁讀取時應與總數無關
+# 執行方式（於專案根目錄）：python -m benchmarks.bench_account_list_model
+import os
+import sys
+import tempfile
+import time
+
+ENTRY_COUNTS = [1000, 10000, 100000]
+
+
+def main():
+    tmp_dir = tempfile.mkdtemp(prefix="pm_bench_")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+    from PyQt6.QtWidgets import QApplication, QListView
+    from benchmarks.vault_generator import create_vault
+    from modules.main.account.account_list_model import AccountListModel
+
+    app = QApplication(sys.argv)
+    db_manager = create_vault(os.path.join(tmp_dir, "list.db"), 0)
+
+    print(f"{'entries':>8} {'first paint':>12} {'category':>10} {'rows loaded':>12}")
+    inserted = 0
+    for count in ENTRY_COUNTS:
+        db_manager.add_password_entries_bulk(
+            (f"site-{i}", "", "", "", "工作" if i % 2 else "個人") for i in range(inserted, count))
+        inserted = count
+
+        view = QListView()
+        view.setUniformItemSizes(True)
+        view.resize(400, 600)
+        model = AccountListModel(db_manager)
+        view.setModel(model)
+        view.show()
+
+        start = time.perf_counter()
+        model.load("全部")
+        app.processEvents()
+        all_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        model.load("工作")
+        app.processEvents()
+        category_elapsed = time.perf_counter() - start
+
+        print(f"{count:>8} {all_elapsed * 1000:>10.1f}ms {category_elapsed * 1000:>8.1f}ms {model.rowCount():>12}")
+        view.close()
+
+    db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
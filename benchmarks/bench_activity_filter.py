@@ -0,0 +1,81 @@
+# 應用程式層級活動事件過濾器的單一事件成本：舊版每個滑鼠移動都重新啟動登出計時器，新版只記錄時間戳記
+# 執行方式（於專案根目錄）：python -m benchmarks.bench_activity_filter
+import os
+import sys
+import time
+
+EVENTS = 20000
+
+
+def main():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+    from PyQt6.QtCore import QEvent, QObject, QPointF, Qt, QTimer
+    from PyQt6.QtGui import QMouseEvent
+    from PyQt6.QtWidgets import QApplication, QWidget
+    from modules.main.main_window.activity_event_filter import ActivityEventFilter
+    from system.auto_logout_manager import AutoLogoutManager
+
+    app = QApplication(sys.argv)
+    widget = QWidget()
+    widget.show()
+
+    # 舊版：每次都建立事件類型的 tuple，並經由 reset_timer 重新啟動 15 分鐘的單次計時器
+    class LegacyActivityEventFilter(QObject):
+        def __init__(self, callback):
+            super().__init__()
+            self.callback = callback
+
+        def eventFilter(self, obj, event):
+            if event.type() in (
+                QEvent.Type.MouseMove,
+                QEvent.Type.MouseButtonPress,
+                QEvent.Type.MouseButtonRelease,
+                QEvent.Type.KeyPress,
+                QEvent.Type.Wheel,
+                QEvent.Type.FocusIn,
+            ):
+                self.callback()
+            return super().eventFilter(obj, event)
+
+    legacy_timer = QTimer()
+    legacy_timer.setSingleShot(True)
+    legacy_restarts = [0]
+
+    def legacy_reset_timer():
+        legacy_restarts[0] += 1
+        legacy_timer.start(15 * 60 * 1000)
+
+    manager = AutoLogoutManager()
+    manager.logout_timeout = 15
+    manager.is_enabled = True
+    manager.start_monitoring()
+
+    event = QMouseEvent(QEvent.Type.MouseMove, QPointF(10, 10), QPointF(10, 10), Qt.MouseButton.NoButton,
+                        Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier)
+
+    def measure(event_filter):
+        if event_filter is not None:
+            app.installEventFilter(event_filter)
+        start = time.perf_counter()
+        for _ in range(EVENTS):
+            app.sendEvent(widget, event)
+        elapsed = (time.perf_counter() - start) / EVENTS * 1_000_000
+        if event_filter is not None:
+            app.removeEventFilter(event_filter)
+        return elapsed
+
+    base = measure(None)
+    legacy = measure(LegacyActivityEventFilter(legacy_reset_timer))
+    current = measure(ActivityEventFilter(manager.record_activity))
+
+    print(f"{EVENTS} 個滑鼠移動事件，每個事件的平均耗時：")
+    print(f"  無過濾器            {base:>7.2f}µs")
+    print(f"  舊版（重設計時器）  {legacy:>7.2f}µs（過濾器成本 {legacy - base:.2f}µs，重設計時器 {legacy_restarts[0]} 次）")
+    print(f"  新版（記錄時間戳記）{current:>7.2f}µs（過濾器成本 {current - base:.2f}µs，重設計時器 0 次）")
+    widget.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# 比較各連線設定檔的寫入延遲與讀取吞吐量
+# 執行方式（於專案根目錄）：python -m benchmarks.bench_connection_profiles
+import os
+import sys
+import tempfile
+import time
+
+WRITE_COUNT = 200
+VAULT_SIZE = 5000
+READ_ROUNDS = 200
+
+
+def percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def main():
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+    from Database.connection_profiles import CONNECTION_PROFILES
+
+    print(f"{'profile':>11} {'write avg':>10} {'write p95':>10} {'reads/s':>10}")
+    for profile in CONNECTION_PROFILES:
+        tmp_dir = tempfile.mkdtemp(prefix="pm_bench_")
+        os.environ["PASSWORD_MANAGER_DB_PROFILE"] = profile
+
+        from benchmarks.vault_generator import create_vault
+        db_manager = create_vault(os.path.join(tmp_dir, "bench.db"), 0)
+        db_manager.add_password_entries_bulk(
+            (f"site-{i}", "user", "pw", "", "工作" if i % 2 else None) for i in range(VAULT_SIZE))
+
+        # 寫入延遲：每次新增都會提交一次
+        latencies = []
+        for i in range(WRITE_COUNT):
+            start = time.perf_counter()
+            db_manager.add_password_entry(f"new-{i}", "user", "pw", "", None)
+            latencies.append(time.perf_counter() - start)
+
+        # 讀取吞吐量：反覆載入名稱清單與單筆查詢
+        start = time.perf_counter()
+        for i in range(READ_ROUNDS):
+            db_manager.get_names_by_category("工作")
+            db_manager.get_password_entry(f"site-{i}")
+        reads_per_second = READ_ROUNDS * 2 / (time.perf_counter() - start)
+
+        avg = sum(latencies) / len(latencies)
+        print(f"{profile:>11} {avg * 1000:>8.2f}ms {percentile(latencies, 0.95) * 1000:>8.2f}ms {reads_per_second:>10.0f}")
+        db_manager.close()
+
+    os.environ.pop("PASSWORD_MANAGER_DB_PROFILE", None)
+
+
+if __name__ == "__main__":
+    main()
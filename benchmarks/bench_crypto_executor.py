@@ -0,0 +1,60 @@
+# 比較不同加解密引擎設定下整個金庫的解密與加密耗時
+# 執行方式（於專案根目錄）：python -m benchmarks.bench_crypto_executor
+import os
+import sys
+import tempfile
+import time
+
+ENTRY_COUNT = 10000
+REPEAT = 3
+
+
+def best_of(func):
+    best = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    tmp_dir = tempfile.mkdtemp(prefix="pm_bench_")
+    os.environ["PASSWORD_MANAGER_DB"] = os.path.join(tmp_dir, "bench.db")
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+    from Database.db_manager import DBManager
+    from utils.crypto_executor import CryptoExecutor
+    from utils.password_encryption import hash_password
+
+    db_manager = DBManager(CryptoExecutor(max_workers=1))
+    db_manager.set_master_password(hash_password("bench"), os.urandom(16))
+    db_manager.set_current_master_password("bench")
+    db_manager.add_password_entries_bulk(
+        (f"site-{i}", f"user{i}@example.com", f"pw-{i}", f"note {i}" * 5, None) for i in range(ENTRY_COUNT))
+    fields_list = [(f"user{i}@example.com", f"pw-{i}", f"note {i}" * 5) for i in range(ENTRY_COUNT)]
+
+    workers = max(2, os.cpu_count() or 1)
+    configs = [("serial", CryptoExecutor(max_workers=1)),
+               (f"thread x{workers}", CryptoExecutor("thread", workers)),
+               (f"process x{workers}", CryptoExecutor("process", workers))]
+
+    print(f"{ENTRY_COUNT} 筆條目，取 {REPEAT} 次最佳值")
+    print(f"{'executor':>14} {'get_all_entries':>16} {'encrypt':>10} {'speedup':>8}")
+    baseline = None
+    for label, executor in configs:
+        db_manager.crypto_executor = executor
+        # 先暖機，避免把建立執行緒/行程池的成本算進去
+        executor.encrypt_entries(db_manager._vault_key, fields_list[:executor.chunk_size * 2])
+        decrypt_time = best_of(db_manager.get_all_entries)
+        encrypt_time = best_of(lambda: executor.encrypt_entries(db_manager._vault_key, fields_list))
+        baseline = baseline or decrypt_time
+        print(f"{label:>14} {decrypt_time:>15.3f}s {encrypt_time:>9.3f}s {baseline / decrypt_time:>7.2f}x")
+        executor.shutdown()
+
+    db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
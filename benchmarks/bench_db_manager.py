@@ -0,0 +1,207 @@
+# DBManager 各公開方法在 1k/10k/100k 條目下的耗時，金庫由 vault_generator 產生
+# 結果依 commit 存放在 benchmarks/results/db_manager/<commit>.json，並與上一次的結果比較，
+# 常用路徑比上一次慢超過 25% 且至少慢 1ms 時以非零狀態結束
+# --baseline 改存為 baseline.json，作為沒有其他 commit 結果時的比較基準，並記錄量測時的 commit
+# 執行方式（於專案根目錄）：python -m benchmarks.bench_db_manager [--sizes 1000,10000] [--no-save] [--baseline]
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ENTRY_COUNTS = [1000, 10000, 100000]
+IMPORT_ROWS = 1000
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", "db_manager")
+BASELINE_NAME = "baseline"
+
+REGRESSION_RATIO = 1.25
+REGRESSION_MIN_MS = 1.0
+
+# 登入、列表、搜尋、查看與編輯時每次都會經過的路徑
+HOT_PATHS = {
+    "set_current_master_password", "get_names_page", "get_names_page deep", "search_names build",
+    "search_names typing", "get_password_entry cold", "get_password_entry warm", "get_prefetch_job",
+    "add_password_entry", "update_password_entry", "delete_password_entry", "move_entry", "get_all_categories",
+}
+
+
+def _root():
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+# 回傳每次呼叫的中位數耗時（ms）；before 在每次呼叫前執行且不計時
+def measure(func, repeat, before=None):
+    samples = []
+    for i in range(repeat):
+        if before:
+            before(i)
+        start = time.perf_counter()
+        func(i)
+        samples.append((time.perf_counter() - start) * 1000)
+    return sorted(samples)[len(samples) // 2]
+
+
+def bench_size(count, tmp_dir):
+    from PyQt6.QtCore import QThreadPool
+    from benchmarks.vault_generator import MASTER_PASSWORD, create_vault, generate_entries, write_import_csv
+    from utils.import_export_manager import ImportExportManager
+    from utils.import_worker import ImportWorker
+    from utils.password_encryption import hash_password
+
+    results = {}
+    rng = random.Random(count)
+    db_manager = create_vault(os.path.join(tmp_dir, f"vault-{count}.db"), 0)
+    entries = generate_entries(count)
+
+    start = time.perf_counter()
+    db_manager.add_password_entries_bulk(entries)
+    results["add_password_entries_bulk"] = (time.perf_counter() - start) * 1000
+
+    names = [entry[0] for entry in entries]
+    sample = [rng.choice(names) for _ in range(100)]
+    # 大量解密的方法在 100k 時只量一次
+    heavy_repeat = 3 if count <= 10000 else 1
+
+    results["set_current_master_password"] = measure(
+        lambda i: db_manager.set_current_master_password(MASTER_PASSWORD), 3)
+    results["get_all_names"] = measure(lambda i: db_manager.get_all_names(), 5)
+    results["get_names_by_category"] = measure(lambda i: db_manager.get_names_by_category("工作"), 5)
+    results["get_all_categories"] = measure(lambda i: db_manager.get_all_categories(), 20)
+    results["get_entry_category"] = measure(lambda i: db_manager.get_entry_category(sample[i]), 100)
+
+    results["get_names_page"] = measure(lambda i: db_manager.get_names_page(), 50)
+    middle = db_manager.get_names_page(limit=count // 2)[-1]
+    results["get_names_page deep"] = measure(
+        lambda i: db_manager.get_names_page(after=(middle[2], middle[0])), 50)
+
+    results["search_names build"] = measure(
+        lambda i: db_manager.search_names("mail"), 3, before=lambda i: db_manager.name_index.clear())
+    typed = ["m", "ma", "mai", "mail", "mail-", "mail-c"]
+    results["search_names typing"] = measure(lambda i: db_manager.search_names(typed[i % len(typed)]), 60)
+
+    results["get_password_entry cold"] = measure(
+        lambda i: db_manager.get_password_entry(sample[i]), 100, before=lambda i: db_manager.entry_cache.clear())
+    results["get_password_entry warm"] = measure(lambda i: db_manager.get_password_entry(sample[i % 10]), 100,
+                                                 before=lambda i: db_manager.get_password_entry(sample[i % 10]))
+    results["get_prefetch_job"] = measure(lambda i: db_manager.get_prefetch_job(sample[i:i + 3]), 50,
+                                          before=lambda i: db_manager.entry_cache.clear())
+
+    results["get_all_entries"] = measure(lambda i: db_manager.get_all_entries(), heavy_repeat)
+    results["get_entries_by_category"] = measure(lambda i: db_manager.get_entries_by_category("工作"), heavy_repeat)
+    results["iter_entries"] = measure(lambda i: sum(1 for _ in db_manager.iter_entries()), heavy_repeat)
+
+    results["add_password_entry"] = measure(
+        lambda i: db_manager.add_password_entry(f"new-{i}", "user", "pw", "notes", "工作"), 50)
+    results["update_password_entry"] = measure(
+        lambda i: db_manager.update_password_entry(f"new-{i}", f"new-{i}", "user2", "pw2", "notes2", "個人"), 50)
+    results["delete_password_entry"] = measure(lambda i: db_manager.delete_password_entry(f"new-{i}"), 50)
+
+    results["move_entry"] = measure(
+        lambda i: db_manager.move_entry(sample[i], prev_name=sample[i + 1]), 50)
+    results["rebalance_order_indices"] = measure(lambda i: db_manager.rebalance_order_indices(), heavy_repeat)
+
+    hashed_password = hash_password(MASTER_PASSWORD)
+    results["update_master_password"] = measure(
+        lambda i: db_manager.update_master_password(hashed_password, os.urandom(16), MASTER_PASSWORD), 3)
+
+    def rotate(i):
+        db_manager.begin_key_rotation()
+        while not db_manager.rotate_key_batch()[2]:
+            pass
+    results["rotate_key all"] = measure(rotate, 1)
+
+    manager = ImportExportManager(None, db_manager, None, QThreadPool.globalInstance())
+    csv_path = os.path.join(tmp_dir, f"export-{count}.csv")
+    xlsx_path = os.path.join(tmp_dir, f"export-{count}.xlsx")
+    results["export csv"] = measure(lambda i: manager._write_csv(csv_path, db_manager.iter_entries()), heavy_repeat)
+    results["export xlsx"] = measure(lambda i: manager._write_xlsx(xlsx_path, db_manager.iter_entries()), 1)
+
+    import_path = os.path.join(tmp_dir, f"import-{count}.csv")
+    write_import_csv(import_path, generate_entries(IMPORT_ROWS, seed=count + 1))
+    results[f"import csv {IMPORT_ROWS} rows"] = measure(lambda i: ImportWorker(import_path, db_manager).run(), 1)
+
+    results["checkpoint"] = measure(lambda i: db_manager.checkpoint(), 3)
+    db_manager.close()
+    return {name: round(elapsed, 3) for name, elapsed in results.items()}
+
+
+# 只有程式碼的修改才標記為 dirty，benchmarks/ 本身的變更不影響量測結果
+def get_commit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=_root(),
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no", "--", ".", ":!benchmarks"],
+                               cwd=_root(), capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+# 回傳其他 commit 中最新的一份結果（含 baseline.json）
+def load_previous(commit):
+    if not os.path.isdir(RESULTS_DIR):
+        return None
+    previous = []
+    for file_name in os.listdir(RESULTS_DIR):
+        if not file_name.endswith(".json"):
+            continue
+        with open(os.path.join(RESULTS_DIR, file_name), encoding="utf-8") as f:
+            result = json.load(f)
+        if result.get("commit") != commit:
+            previous.append(result)
+    return max(previous, key=lambda result: result["timestamp"]) if previous else None
+
+
+def main():
+    sys.path.insert(0, _root())
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sizes = ENTRY_COUNTS
+    if "--sizes" in sys.argv:
+        sizes = [int(size) for size in sys.argv[sys.argv.index("--sizes") + 1].split(",")]
+
+    from PyQt6.QtCore import QCoreApplication
+    app = QCoreApplication(sys.argv)
+
+    tmp_dir = tempfile.mkdtemp(prefix="pm_bench_")
+    results = {str(count): bench_size(count, tmp_dir) for count in sizes}
+    commit = get_commit()
+    previous = load_previous(commit)
+
+    regressions = []
+    print(f"{'method':<28}" + "".join(f"{count:>14}" for count in results))
+    for name in next(iter(results.values())):
+        row = f"{name:<28}"
+        for count, timings in results.items():
+            row += f"{timings[name]:>12.3f}ms"
+            expected = (previous or {}).get("results", {}).get(count, {}).get(name)
+            if (name in HOT_PATHS and expected is not None
+                    and timings[name] > expected * REGRESSION_RATIO and timings[name] - expected > REGRESSION_MIN_MS):
+                regressions.append((count, name, expected, timings[name]))
+        print(row)
+
+    if "--no-save" not in sys.argv:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        result = {"commit": commit, "timestamp": time.time(), "python": sys.version.split()[0]}
+        if "--baseline" in sys.argv:
+            result_path = os.path.join(RESULTS_DIR, f"{BASELINE_NAME}.json")
+            result["note"] = f"比較基準，量測自 commit {commit} 的程式碼（不含 benchmarks/ 的變更）"
+        else:
+            result_path = os.path.join(RESULTS_DIR, f"{commit}.json")
+        result["results"] = results
+        with open(result_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"結果已存至 {result_path}")
+
+    if previous:
+        print(f"與 {previous['commit']} 比較：")
+        for count, name, expected, elapsed in regressions:
+            print(f"[REGRESSION] {count} 筆 {name}: {expected:.3f}ms -> {elapsed:.3f}ms")
+        if not regressions:
+            print("[OK] 常用路徑沒有變慢")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
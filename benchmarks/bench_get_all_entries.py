@@ -0,0 +1,51 @@
+# get_all_entries 解密耗時隨條目數量的變化
+# 執行方式（於專案根目錄）：python -m benchmarks.bench_get_all_entries
+import os
+import sys
+import tempfile
+import time
+
+ENTRY_COUNTS = [100, 500, 1000, 2000, 5000]
+
+
+def build_vault(db_manager, count):
+    db_manager.cursor.execute("DELETE FROM passwords")
+    db_manager.conn.commit()
+    for i in range(count):
+        db_manager.add_password_entry(f"site-{i}", f"user{i}@example.com", f"pw-{i}", f"note {i}", None)
+
+
+def main():
+    tmp_dir = tempfile.mkdtemp(prefix="pm_bench_")
+    os.environ["PASSWORD_MANAGER_DB"] = os.path.join(tmp_dir, "bench.db")
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+    from Database.db_manager import DBManager
+    from utils.password_encryption import hash_password, generate_key_from_password
+
+    db_manager = DBManager()
+    db_manager.set_master_password(hash_password("bench"), os.urandom(16))
+    db_manager.set_current_master_password("bench")
+
+    print(f"{'entries':>8} {'get_all_entries':>16} {'per entry':>12}")
+    for count in ENTRY_COUNTS:
+        build_vault(db_manager, count)
+        start = time.perf_counter()
+        entries = db_manager.get_all_entries()
+        elapsed = time.perf_counter() - start
+        assert len(entries) == count
+        print(f"{count:>8} {elapsed:>15.3f}s {elapsed / count * 1000:>10.3f}ms")
+
+    # 舊做法：每個欄位都重新推導一次 PBKDF2 金鑰
+    salt = db_manager.get_master_salt()
+    start = time.perf_counter()
+    generate_key_from_password("bench", salt)
+    per_field = time.perf_counter() - start
+    print(f"\n舊做法每個欄位約 {per_field * 1000:.1f}ms，"
+          f"{ENTRY_COUNTS[-1]} 筆 x 3 欄位約需 {per_field * 3 * ENTRY_COUNTS[-1]:.1f}s")
+
+    db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
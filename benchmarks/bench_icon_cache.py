@@ -0,0 +1,63 @@
+# 圖示快取前後的耗時：啟動時預先繪製、登入後建立選單圖示、切換密碼顯示圖示
+# 執行方式（於專案根目錄）：python -m benchmarks.bench_icon_cache
+import os
+import sys
+import time
+
+LOGIN_ROUNDS = 20
+TOGGLES = 200
+
+
+def main():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+    from PyQt6.QtCore import QSize
+    from PyQt6.QtWidgets import QApplication, QWidget
+    from utils.svg_icon_add import IconHelper, PREWARM_ICONS
+    from utils.svg_icon_set import SvgIconManager
+
+    app = QApplication(sys.argv)
+    widget = QWidget()
+
+    def build_menu_icons():
+        for icon_name, size in PREWARM_ICONS:
+            SvgIconManager.create_icon(icon_name, color=None, size=size, widget=widget)
+
+    def toggle_eye(round_index):
+        if round_index % 2:
+            IconHelper.get_eye_show_icon(widget, QSize(20, 20))
+        else:
+            IconHelper.get_eye_hide_icon(widget, QSize(20, 20))
+
+    def measure(func, rounds, cached):
+        start = time.perf_counter()
+        for i in range(rounds):
+            if not cached:
+                SvgIconManager.clear_cache()
+            func(i) if func is toggle_eye else func()
+        return (time.perf_counter() - start) / rounds * 1000
+
+    SvgIconManager.clear_cache()
+    start = time.perf_counter()
+    IconHelper.prewarm(widget)
+    prewarm_elapsed = (time.perf_counter() - start) * 1000
+
+    menu_cold = measure(build_menu_icons, LOGIN_ROUNDS, cached=False)
+    SvgIconManager.clear_cache()
+    IconHelper.prewarm(widget)
+    menu_warm = measure(build_menu_icons, LOGIN_ROUNDS, cached=True)
+    toggle_cold = measure(toggle_eye, TOGGLES, cached=False)
+    toggle_warm = measure(toggle_eye, TOGGLES, cached=True)
+
+    print(f"啟動時預先繪製 {len(PREWARM_ICONS)} 個圖示: {prewarm_elapsed:.2f}ms（登入畫面顯示後執行）")
+    print(f"{'':<20} {'無快取':>10} {'有快取':>10} {'節省':>10}")
+    print(f"{'每次登入建立選單':<18} {menu_cold:>9.3f}ms {menu_warm:>9.3f}ms {menu_cold - menu_warm:>9.3f}ms")
+    print(f"{'每次切換密碼顯示':<18} {toggle_cold:>9.3f}ms {toggle_warm:>9.3f}ms {toggle_cold - toggle_warm:>9.3f}ms")
+    print(f"快取命中 {SvgIconManager.hits} 次，繪製 {SvgIconManager.misses} 次")
+    widget.deleteLater()
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
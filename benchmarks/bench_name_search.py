@@ -0,0 +1,68 @@
+# 名稱搜尋延遲：逐字輸入時每次查詢的耗時，與舊做法（QListWidget 每次按鍵逐項 setHidden）比較
+# 執行方式（於專案根目錄）：python -m benchmarks.bench_name_search
+import os
+import random
+import sys
+import time
+
+ENTRY_COUNTS = [1000, 10000, 100000]
+WORDS = ["google", "github", "mail", "bank", "shop", "cloud", "work", "home", "game", "music",
+         "news", "forum", "wifi", "server", "router", "銀行", "信箱", "購物", "遊戲", "公司"]
+QUERY = "github-12"
+
+
+def make_names(count):
+    rng = random.Random(count)
+    return [f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{i}" for i in range(count)]
+
+
+def time_keystrokes(search):
+    timings = []
+    for end in range(1, len(QUERY) + 1):
+        start = time.perf_counter()
+        search(QUERY[:end])
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+    from PyQt6.QtWidgets import QApplication, QListWidget
+    from utils.name_search_index import NameSearchIndex
+
+    app = QApplication(sys.argv)
+
+    print(f"{'entries':>8} {'build':>9} {'first key':>10} {'next keys':>10} {'old per key':>12}")
+    for count in ENTRY_COUNTS:
+        names = make_names(count)
+        rows = [(name, i * 1024, "工作" if i % 2 else "個人") for i, name in enumerate(names)]
+
+        index = NameSearchIndex()
+        start = time.perf_counter()
+        index.build(rows)
+        build_elapsed = time.perf_counter() - start
+        # 第一次查詢包含串接字串的成本，之後的按鍵多半只是縮小上一次的結果
+        timings = time_keystrokes(index.search)
+
+        # 舊做法：全部名稱都放在 QListWidget，每次按鍵逐項比對並 setHidden
+        list_widget = QListWidget()
+        list_widget.addItems(names)
+
+        def filter_list_items(search_text):
+            for i in range(list_widget.count()):
+                item = list_widget.item(i)
+                item.setHidden(search_text not in item.text().lower())
+
+        old_timings = time_keystrokes(filter_list_items)
+        list_widget.deleteLater()
+        app.processEvents()
+
+        print(f"{count:>8} {build_elapsed * 1000:>7.1f}ms {timings[0] * 1000:>8.1f}ms "
+              f"{sum(timings[1:]) / len(timings[1:]) * 1000:>8.2f}ms "
+              f"{sum(old_timings) / len(old_timings) * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# 無視窗（offscreen）啟動 PasswordManager，量測各階段耗時並與 startup_baseline.json 比較，退步時以非零狀態結束
+# 階段：匯入、SettingsManager 載入、DBManager 開啟、套用主題、系統托盤、登入畫面首次繪製、
+#       登入（verify_master_password）、登入後名稱列表首次繪製
+# 每次量測都在新的行程中進行，條目數量不同的金庫只產生一次
+# 執行方式（於專案根目錄）：python -m benchmarks.bench_startup [--sizes 1000,10000] [--output result.json]
+# 重新記錄基準：python -m benchmarks.bench_startup --update-baseline
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.vault_generator import MASTER_PASSWORD
+
+ENTRY_COUNTS = [1000, 10000, 100000]
+ROUNDS = 3
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_baseline.json")
+
+# 比基準慢超過 25% 且至少慢 5ms 才視為退步，避免短階段的雜訊
+REGRESSION_RATIO = 1.25
+REGRESSION_MIN_MS = 5.0
+
+PHASES = ["imports", "settings_load", "db_open", "theme_apply", "tray_setup",
+          "login_screen", "verify_master_password", "first_list_paint"]
+
+
+def _root():
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+# 子行程：在同一個行程內從匯入開始啟動一次，結果以 JSON 印出
+def run_child():
+    import time
+    start = time.perf_counter()
+    timings = {}
+
+    from PyQt6.QtCore import QEvent, QObject
+    from PyQt6.QtWidgets import QApplication, QMessageBox
+
+    app = QApplication(sys.argv)
+    phase_start = time.perf_counter()
+    sys.path.insert(0, _root())
+    import app.main_windows as main_windows
+    from Database.db_manager import DBManager
+    from preferences.settings_manager import SettingsManager
+    timings["imports"] = (time.perf_counter() - phase_start) * 1000
+
+    # 只記錄第一次呼叫，之後背景工作建立的連線等不列入
+    def timed(owner, attr, phase):
+        original = getattr(owner, attr)
+
+        def wrapper(*args, **kwargs):
+            if phase in timings:
+                return original(*args, **kwargs)
+            phase_start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                timings[phase] = (time.perf_counter() - phase_start) * 1000
+        setattr(owner, attr, wrapper)
+
+    timed(SettingsManager, "__init__", "settings_load")
+    timed(DBManager, "__init__", "db_open")
+    timed(SettingsManager, "apply_theme", "theme_apply")
+    timed(main_windows.SystemTrayManager, "__init__", "tray_setup")
+
+    # 無視窗環境沒有人能按下訊息框，直接回傳
+    for name in ("information", "warning", "critical"):
+        setattr(QMessageBox, name, staticmethod(lambda *args, **kwargs: QMessageBox.StandardButton.Ok))
+
+    painted = {}
+
+    class PaintWatcher(QObject):
+        def __init__(self, key, widget, ready=lambda: True):
+            super().__init__()
+            self.key = key
+            self.ready = ready
+            widget.installEventFilter(self)
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint and self.key not in painted and self.ready():
+                painted[self.key] = time.perf_counter()
+            return False
+
+    window = main_windows.PasswordManager()
+    login_watcher = PaintWatcher("login_screen", window.main_password_widget)
+    window.show()
+    while "login_screen" not in painted:
+        app.processEvents()
+    timings["login_screen"] = (painted["login_screen"] - start) * 1000
+
+    widget = window.main_password_widget
+    widget.password_input.setText(MASTER_PASSWORD)
+    phase_start = time.perf_counter()
+    widget.controller.verify_master_password()
+    timings["verify_master_password"] = (time.perf_counter() - phase_start) * 1000
+
+    name_list = window.name_list_widget.name_list
+    list_watcher = PaintWatcher("first_list_paint", name_list.viewport(),
+                                lambda: name_list.model() is not None and name_list.model().rowCount() > 0)
+    deadline = time.perf_counter() + 60
+    while "first_list_paint" not in painted and time.perf_counter() < deadline:
+        app.processEvents()
+    timings["first_list_paint"] = (painted.get("first_list_paint", deadline) - phase_start) * 1000
+
+    print(json.dumps(timings))
+    window.db_manager.close()
+    # 系統主題偵測的背景執行緒可能仍在執行，直接結束行程
+    os._exit(0)
+
+
+def measure(db_path, home):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", HOME=home, PASSWORD_MANAGER_DB=db_path,
+               PASSWORD_MANAGER_SETTINGS=os.path.join(home, "settings.json"))
+    result = subprocess.run([sys.executable, "-m", "benchmarks.bench_startup", "--child"],
+                            cwd=_root(), env=env, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline):
+    regressions = []
+    for count, phases in results.items():
+        for phase, elapsed in phases.items():
+            expected = baseline.get(count, {}).get(phase)
+            if expected is None:
+                continue
+            if elapsed > expected * REGRESSION_RATIO and elapsed - expected > REGRESSION_MIN_MS:
+                regressions.append((count, phase, expected, elapsed))
+    return regressions
+
+
+def parse_args(argv):
+    options = {"sizes": ENTRY_COUNTS, "output": None, "update": False}
+    for i, arg in enumerate(argv):
+        if arg == "--sizes":
+            options["sizes"] = [int(size) for size in argv[i + 1].split(",")]
+        elif arg == "--output":
+            options["output"] = argv[i + 1]
+        elif arg == "--update-baseline":
+            options["update"] = True
+    return options
+
+
+def main():
+    if "--child" in sys.argv:
+        run_child()
+        return
+
+    options = parse_args(sys.argv[1:])
+    tmp_dir = tempfile.mkdtemp(prefix="pm_bench_")
+    home = os.path.join(tmp_dir, "home")
+    os.makedirs(home)
+
+    results = {}
+    for count in options["sizes"]:
+        db_path = os.path.join(tmp_dir, f"vault-{count}.db")
+        subprocess.run([sys.executable, "-c",
+                        f"from benchmarks.vault_generator import create_vault; create_vault({db_path!r}, {count}).close()"],
+                       cwd=_root(), env=dict(os.environ, HOME=home), check=True, capture_output=True)
+        # 第一次啟動會建立設定檔與主題快取，不列入結果
+        measure(db_path, home)
+        runs = [measure(db_path, home) for _ in range(ROUNDS)]
+        results[str(count)] = {phase: round(sorted(run[phase] for run in runs)[ROUNDS // 2], 2)
+                               for phase in PHASES}
+
+    print(f"{'phase':<24}" + "".join(f"{count + ' 筆':>12}" for count in results))
+    for phase in PHASES:
+        print(f"{phase:<24}" + "".join(f"{phases[phase]:>10.1f}ms" for phases in results.values()))
+
+    if options["output"]:
+        with open(options["output"], "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if options["update"]:
+        baseline = {}
+        if os.path.exists(BASELINE_FILE):
+            with open(BASELINE_FILE, encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(BASELINE_FILE, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2)
+            f.write("\n")
+        print(f"已更新基準: {BASELINE_FILE}")
+        return
+
+    if not os.path.exists(BASELINE_FILE):
+        print("沒有基準可比較，請先以 --update-baseline 記錄")
+        return
+
+    with open(BASELINE_FILE, encoding="utf-8") as f:
+        regressions = compare(results, json.load(f))
+    for count, phase, expected, elapsed in regressions:
+        print(f"[REGRESSION] {count} 筆 {phase}: {expected:.1f}ms -> {elapsed:.1f}ms")
+    if not regressions:
+        print("[OK] 沒有階段比基準慢")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
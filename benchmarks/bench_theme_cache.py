@@ -0,0 +1,90 @@
+# 主題樣式表快取前後套用主題的耗時，每次量測都在新的行程中進行，包含匯入 qt_material 的時間
+# 冷啟動：快取目錄為空；熱啟動：快取已存在；直接套用：舊版每次呼叫 qt_material.apply_stylesheet
+# 執行方式（於專案根目錄）：python -m benchmarks.bench_theme_cache
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROUNDS = 5
+THEME_FILES = ["light_blue.xml", "dark_blue.xml"]
+
+CHILD = r'''
+import os, sys, time
+sys.path.insert(0, {root!r})
+from PyQt6.QtWidgets import QApplication, QWidget
+app = QApplication(sys.argv)
+widget = QWidget()
+# 主程式啟動時已載入路徑設定，不計入套用主題的時間
+import utils.path_helper
+start = time.perf_counter()
+if {mode!r} == "direct":
+    from qt_material import apply_stylesheet
+    apply_stylesheet(widget, theme={theme_file!r})
+else:
+    from utils.theme_stylesheet_cache import ThemeStylesheetCache
+    ThemeStylesheetCache({cache_dir!r}).apply(widget, {theme_file!r})
+print((time.perf_counter() - start) * 1000)
+'''
+
+
+def run_child(root, mode, theme_file, cache_dir, home):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", HOME=home)
+    code = CHILD.format(root=root, mode=mode, theme_file=theme_file, cache_dir=cache_dir)
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    home = tempfile.mkdtemp(prefix="pm_bench_")
+
+    print(f"{'主題':<16} {'直接套用':>10} {'冷啟動':>10} {'熱啟動':>10}")
+    for theme_file in THEME_FILES:
+        direct, cold, warm = [], [], []
+        for i in range(ROUNDS):
+            cache_dir = os.path.join(home, f"cache-{theme_file}-{i}")
+            direct.append(run_child(root, "direct", theme_file, cache_dir, home))
+            cold.append(run_child(root, "cache", theme_file, cache_dir, home))
+            warm.append(run_child(root, "cache", theme_file, cache_dir, home))
+        median = lambda values: sorted(values)[len(values) // 2]
+        print(f"{theme_file:<16} {median(direct):>8.1f}ms {median(cold):>8.1f}ms {median(warm):>8.1f}ms")
+
+    measure_switching(root, home)
+
+
+# 設定頁面中切換主題：同一個行程內輪流套用淺色與深色主題
+def measure_switching(root, home):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ["HOME"] = home
+    sys.path.insert(0, root)
+
+    from PyQt6.QtWidgets import QApplication, QWidget
+    from qt_material import apply_stylesheet
+    from utils.theme_stylesheet_cache import ThemeStylesheetCache
+
+    # 直接套用時 qt_material 對 QWidget 設定 Fusion 樣式會失敗並記錄警告，與量測無關
+    logging.disable(logging.WARNING)
+    app = QApplication(sys.argv)
+    widget = QWidget()
+    cache = ThemeStylesheetCache(os.path.join(home, "cache-switch"))
+    for theme_file in THEME_FILES:
+        cache.apply(widget, theme_file)
+
+    def measure(apply):
+        start = time.perf_counter()
+        for i in range(ROUNDS * 2):
+            apply(THEME_FILES[i % 2])
+        return (time.perf_counter() - start) / (ROUNDS * 2) * 1000
+
+    direct = measure(lambda theme_file: apply_stylesheet(widget, theme=theme_file))
+    cached = measure(lambda theme_file: cache.apply(widget, theme_file))
+    print(f"設定頁面切換主題: 直接套用 {direct:.1f}ms，使用快取 {cached:.1f}ms")
+    widget.deleteLater()
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# 產生測試用的合成金庫：可設定條目數量、分類分布、備註長度與中英文名稱比例，同一個 seed 產生相同內容
+# 執行方式（於專案根目錄）：python -m benchmarks.vault_generator --count 10000 --output vault.db
+import csv
+import os
+import random
+import sys
+
+MASTER_PASSWORD = "benchmark-password"
+
+# 分類與權重，None 表示未分類
+DEFAULT_CATEGORIES = {"工作": 4, "個人": 3, "購物": 2, "金融": 1, None: 2}
+
+ASCII_WORDS = ["mail", "cloud", "bank", "shop", "forum", "git", "news", "music", "video", "travel",
+               "game", "photo", "drive", "chat", "docs", "pay", "wiki", "maps", "store", "learn"]
+CJK_WORDS = ["郵件", "雲端", "銀行", "購物", "論壇", "新聞", "音樂", "影音", "旅遊", "遊戲",
+             "相簿", "硬碟", "聊天", "文件", "支付", "百科", "地圖", "商店", "學習", "公司"]
+NOTE_CHARS = "abcdefghijklmnopqrstuvwxyz0123456789 備註內容測試資料"
+
+
+# 回傳 [(name, account, password, notes, category), ...]，名稱保證唯一
+def generate_entries(count, categories=None, note_size=32, cjk_ratio=0.3, seed=0):
+    rng = random.Random(seed)
+    categories = categories or DEFAULT_CATEGORIES
+    category_names = list(categories)
+    category_weights = list(categories.values())
+
+    entries = []
+    for i in range(count):
+        words = CJK_WORDS if rng.random() < cjk_ratio else ASCII_WORDS
+        name = f"{rng.choice(words)}-{rng.choice(words)}-{i}"
+        account = f"user{rng.randrange(100000)}@example.com"
+        password = "".join(rng.choice("abcdefghijkmnpqrstuvwxyzABCDEFGHJKLMNPQRSTUVWXYZ23456789!@#$%")
+                           for _ in range(16))
+        notes = "".join(rng.choice(NOTE_CHARS) for _ in range(rng.randint(0, note_size * 2))) if note_size else ""
+        category = rng.choices(category_names, category_weights)[0]
+        entries.append((name, account, password, notes, category))
+    return entries
+
+
+# 建立已設定主密碼並已登入的金庫，回傳 DBManager；呼叫前需將專案根目錄加入 sys.path
+def create_vault(db_path, count, **options):
+    os.environ["PASSWORD_MANAGER_DB"] = db_path
+
+    from Database.db_manager import DBManager
+    from utils.password_encryption import hash_password
+
+    db_manager = DBManager()
+    if not db_manager.has_master_password():
+        db_manager.set_master_password(hash_password(MASTER_PASSWORD), os.urandom(16))
+    db_manager.set_current_master_password(MASTER_PASSWORD)
+    db_manager.add_password_entries_bulk(generate_entries(count, **options))
+    return db_manager
+
+
+# 寫出可供 ImportWorker 匯入的 CSV，欄位與匯出格式相同
+def write_import_csv(file_path, entries):
+    with open(file_path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["名稱", "帳號", "密碼", "備註", "類別"])
+        for name, account, password, notes, category in entries:
+            writer.writerow([name, account, password, notes, category or ""])
+
+
+def main():
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+    args = sys.argv[1:]
+
+    def option(flag, default, convert):
+        return convert(args[args.index(flag) + 1]) if flag in args else default
+
+    count = option("--count", 1000, int)
+    db_path = option("--output", os.path.abspath("vault.db"), os.path.abspath)
+    db_manager = create_vault(db_path, count,
+                              note_size=option("--note-size", 32, int),
+                              cjk_ratio=option("--cjk-ratio", 0.3, float),
+                              seed=option("--seed", 0, int))
+    db_manager.close()
+    print(f"已產生 {count} 筆條目: {db_path}（主密碼 {MASTER_PASSWORD}）")
+
+
+if __name__ == "__main__":
+    main()
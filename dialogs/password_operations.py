@@ -1,9 +1,22 @@
 from PyQt6.QtWidgets import QMessageBox
 from dialogs.edit_password import EditPasswordDialog
+from Database.db_manager import EntryDecryptError
+
+# 讀取資料：條目無法解密時顯示錯誤並回傳 None，不開啟查看或編輯視窗，避免以空白內容覆寫原本的資料
+def load_password_entry(parent, db_manager, name):
+    try:
+        return db_manager.get_password_entry(name)
+    except EntryDecryptError as e:
+        QMessageBox.warning(parent, "錯誤", f"{e}，可能是以其他主密碼加密或資料已損毀")
+        return None
+
 
 # 編輯資料
 def edit_password_entry(parent, db_manager, name):
-    account, password, notes, category = db_manager.get_password_entry(name)
+    entry = load_password_entry(parent, db_manager, name)
+    if entry is None:
+        return None
+    account, password, notes, category = entry
     dialog = EditPasswordDialog(parent, name, account, password, notes, category)
 
     if dialog.exec():
@@ -13,7 +26,9 @@ def edit_password_entry(parent, db_manager, name):
         new_notes = dialog.new_notes
         new_category = dialog.new_category
 
-        db_manager.update_password_entry(name, new_name, new_account, new_password, new_notes, new_category)
+        if not db_manager.update_password_entry(name, new_name, new_account, new_password, new_notes, new_category):
+            QMessageBox.warning(parent, "訊息", f"名稱「{new_name}」已存在")
+            return None
         return new_name
 
     return None
@@ -1,5 +1,5 @@
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QLineEdit, 
-                            QPushButton, QLabel, QHBoxLayout, QMessageBox)
+                            QPushButton, QLabel, QHBoxLayout, QMessageBox, QCheckBox)
 
 from utils.svg_icon_set import PasswordVisibilityController
 
@@ -8,9 +8,10 @@ class ResetPasswordDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("登入密碼重設")
-        self.setFixedSize(300, 250)
+        self.setFixedSize(300, 280)
         self.current_password = None
         self.new_password = None
+        self.rotate_data_key = False
         self.init_ui()
 
     def init_ui(self):
@@ -40,6 +41,10 @@ class ResetPasswordDialog(QDialog):
         self.confirm_pwd_visibility_controller = PasswordVisibilityController(self.confirm_password_input, self)
         layout.addWidget(self.confirm_password_input)
 
+        # 只變更密碼時資料金鑰不變；勾選後會產生新的資料金鑰並重新加密所有資料
+        self.rotate_key_checkbox = QCheckBox("同時更換資料金鑰並重新加密所有資料")
+        layout.addWidget(self.rotate_key_checkbox)
+
         button_layout = QHBoxLayout()
 
         self.submit_button = QPushButton("更改")
@@ -59,6 +64,7 @@ class ResetPasswordDialog(QDialog):
         if self.new_password_input.text() == self.confirm_password_input.text():
             self.current_password = self.current_password_input.text()
             self.new_password = self.new_password_input.text()
+            self.rotate_data_key = self.rotate_key_checkbox.isChecked()
             self.accept()
         else:
             QMessageBox.warning(self, "訊息", "密碼不一致")
\ No newline at end of file
@@ -4,7 +4,7 @@ from PyQt6.QtWidgets import (QDialog, QFormLayout, QPushButton,
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QCursor
 
-from .password_operations import edit_password_entry, delete_password_entry
+from .password_operations import load_password_entry, edit_password_entry, delete_password_entry
 
 # 查看密碼項目對話框
 class ViewPasswordDialog(QDialog):
@@ -93,7 +93,9 @@ class ViewPasswordDialog(QDialog):
             self.name_input.setText(new_name)
 
             # 重新讀取資料
-            entry = self.parent_widget.db_manager.get_password_entry(self.name)
+            entry = load_password_entry(self, self.parent_widget.db_manager, self.name)
+            if entry is None:
+                return
             account, password, notes, category = entry
             self.account_input.setText(account)
             self.password_input.setText(password)
@@ -1,7 +1,16 @@
+from PyQt6.QtWidgets import QMessageBox
+from PyQt6.QtCore import QTimer
 from dialogs.add_password import AddNameDialog
 from dialogs.view_password import ViewPasswordDialog
-from dialogs.password_operations import edit_password_entry, delete_password_entry
+from dialogs.password_operations import load_password_entry, edit_password_entry, delete_password_entry
 from utils.import_export_manager import ImportExportManager
+from utils.entry_prefetcher import EntryPrefetcher
+from utils.rebalance_worker import RebalanceWorker
+from utils import instrumentation
+from .account_list_model import AccountListModel
+
+SEARCH_DEBOUNCE_MS = 150
+HOVER_PREFETCH_DELAY_MS = 80
 
 class AccountListHandler:
     def __init__(self, ui_widget):
@@ -9,7 +18,26 @@ class AccountListHandler:
         self.parent = ui_widget.parent
         self.db_manager = self.parent.db_manager
         self.settings_manager = self.parent.settings_manager
-        self.import_export_manager = ImportExportManager(self.parent, self.db_manager, self.settings_manager)
+        self.import_export_manager = ImportExportManager(self.parent, self.db_manager, self.settings_manager,
+                                                         self.ui.thread_pool)
+        self.list_model = AccountListModel(self.db_manager, parent=self.ui)
+        self.ui.set_list_model(self.list_model)
+        # 輸入停頓後才搜尋，連續輸入時不重複查詢
+        self.search_timer = QTimer(self.ui)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_search)
+        # 選取或滑鼠停在項目上時，在背景預先解密該條目與相鄰條目
+        self.prefetcher = EntryPrefetcher(self.db_manager, self.ui.thread_pool, parent=self.ui)
+        instrumentation.register_source("prefetcher", self.prefetcher.stats)
+        self.hover_row = -1
+        self.hover_timer = QTimer(self.ui)
+        self.hover_timer.setSingleShot(True)
+        self.hover_timer.setInterval(HOVER_PREFETCH_DELAY_MS)
+        self.hover_timer.timeout.connect(lambda: self.prefetcher.schedule_around(self.list_model, self.hover_row))
+        # 排序間距用完時在背景重新編排，期間拖曳的條目等編排完成後再寫入
+        self.rebalance_worker = None
+        self.pending_moves = []
         self.connect_signals()
 
     def connect_signals(self):
@@ -17,9 +45,12 @@ class AccountListHandler:
         self.ui.clear_action.triggered.connect(self.ui.search_box.clear)
         self.ui.category_combo.currentTextChanged.connect(self.load_names_by_category)
         self.ui.add_button.clicked.connect(self.add_name)
-        self.ui.name_list.itemDoubleClicked.connect(self.view_account_password)
+        self.ui.name_list.doubleClicked.connect(lambda index: self.view_account_password(index.data()))
         self.ui.name_list.customContextMenuRequested.connect(self.show_context_menu)
-        self.ui.name_list.model().rowsMoved.connect(self.update_order_in_database)
+        self.list_model.rowsMoved.connect(self.update_order_in_database)
+        self.ui.name_list.selectionModel().currentChanged.connect(
+            lambda current, previous: self.prefetcher.schedule_around(self.list_model, current.row()))
+        self.ui.name_list.entered.connect(self.prefetch_hovered)
         self.ui.logout_action.triggered.connect(self.logout)
         self.ui.import_action.triggered.connect(self.import_from_file)
         self.ui.export_action.triggered.connect(self.export_to_csv)
@@ -29,27 +60,44 @@ class AccountListHandler:
     def load_names(self):
         self.load_names_by_category(self.ui.category_combo.currentText())
 
+    # 只重設模型，名稱由列表捲動時分頁讀取
     def load_names_by_category(self, category):
-        self.ui.clear_list()
-        names = self.db_manager.get_all_names() if category == "全部" else self.db_manager.get_names_by_category(category)
-        for name in names:
-            self.ui.add_list_item(name)
+        self.list_model.load(category, self.ui.search_box.text())
 
     def reload_categories(self):
         self.ui.update_category_combo(self.settings_manager.get_categories(), self.ui.category_combo.currentText())
 
     def filter_names(self):
-        self.ui.filter_list_items(self.ui.search_box.text())
+        search_text = self.ui.search_box.text()
+        self.ui.update_clear_action(search_text)
+        if search_text:
+            self.search_timer.start()
+        else:
+            # 清除搜尋時立即回到完整列表
+            self.search_timer.stop()
+            self.apply_search()
+
+    def apply_search(self):
+        self.list_model.load(search_text=self.ui.search_box.text())
 
     def add_name(self):
         dialog = AddNameDialog(self.parent)
         if dialog.exec():
-            self.db_manager.add_password_entry(dialog.name, dialog.account, dialog.password, dialog.notes, dialog.category)
+            if not self.db_manager.add_password_entry(dialog.name, dialog.account, dialog.password, dialog.notes, dialog.category):
+                QMessageBox.warning(self.parent, "訊息", f"名稱「{dialog.name}」已存在")
+                return
             self.load_names_by_category(self.ui.category_combo.currentText())
 
-    def view_account_password(self, item):
-        name = item.text()
-        account, password, notes, category = self.db_manager.get_password_entry(name)
+    def prefetch_hovered(self, index):
+        self.hover_row = index.row()
+        self.hover_timer.start()
+
+    def view_account_password(self, name):
+        self.prefetcher.record_open(name)
+        entry = load_password_entry(self.parent, self.db_manager, name)
+        if entry is None:
+            return
+        account, password, notes, category = entry
         dialog = ViewPasswordDialog(self.parent, name, account, password, notes, category)
         dialog.password_updated.connect(self.load_names)
         dialog.exec()
@@ -58,32 +106,73 @@ class AccountListHandler:
         result = self.ui.create_context_menu(position)
         if not result:
             return
-        context_menu, view_action, edit_action, delete_action, item = result
-        view_action.triggered.connect(lambda: self.view_account_password(item))
-        edit_action.triggered.connect(lambda: self.handle_edit(item))
-        delete_action.triggered.connect(lambda: self.handle_delete(item))
+        context_menu, view_action, edit_action, delete_action, name = result
+        view_action.triggered.connect(lambda: self.view_account_password(name))
+        edit_action.triggered.connect(lambda: self.handle_edit(name))
+        delete_action.triggered.connect(lambda: self.handle_delete(name))
         context_menu.exec(self.ui.name_list.mapToGlobal(position))
 
-    def handle_edit(self, item):
-        if edit_password_entry(self.parent, self.db_manager, item.text()):
+    def handle_edit(self, name):
+        if edit_password_entry(self.parent, self.db_manager, name):
             self.load_names()
 
-    def handle_delete(self, item):
-        if delete_password_entry(self.parent, self.db_manager, item.text()):
+    def handle_delete(self, name):
+        if delete_password_entry(self.parent, self.db_manager, name):
             self.load_names()
 
-    def update_order_in_database(self):
-        self.db_manager.update_order_indices(self.ui.get_item_order())
+    # 只把被拖曳的那一筆放到新位置的前後條目之間
+    def update_order_in_database(self, parent, start, end, destination, row):
+        new_row = row if row < start else row - (end - start + 1)
+        name, prev_name, next_name = self.ui.get_item_neighbours(new_row)
+        if not name:
+            return
+        if self.rebalance_worker is not None or not self.db_manager.move_entry(name, prev_name, next_name):
+            self.pending_moves.append(name)
+            self.start_rebalance()
+
+    def start_rebalance(self):
+        if self.rebalance_worker is not None:
+            return
+        worker = RebalanceWorker(self.db_manager)
+        worker.signals.finished.connect(self.on_rebalance_finished)
+        self.rebalance_worker = worker
+        self.ui.thread_pool.start(worker)
+
+    # 依列表目前的位置寫入編排期間拖曳的條目
+    def on_rebalance_finished(self, success, message):
+        self.rebalance_worker = None
+        pending_moves, self.pending_moves = self.pending_moves, []
+        # 已登出時列表已關閉，不再寫入
+        if self.db_manager.master_password is None:
+            return
+        if not success:
+            print(f"重新編排順序失敗: {message}")
+            return
+        # 編排在另一個連線完成，記憶體中的搜尋索引與分頁鍵都已過期
+        self.db_manager.name_index.clear()
+        self.list_model.mark_order_changed()
+        for name in dict.fromkeys(pending_moves):
+            row = self.list_model.row_of(name)
+            if row < 0:
+                continue
+            _, prev_name, next_name = self.ui.get_item_neighbours(row)
+            if not self.db_manager.move_entry(name, prev_name, next_name):
+                print(f"無法更新「{name}」的順序")
 
     def logout(self):
         if self.ui.show_logout_confirmation():
+            self.prefetcher.cancel()
+            # 匯入工作持有自己的連線與金鑰，必須在清除工作階段前停止
+            ImportExportManager.cancel_all_imports()
+            self.db_manager.clear_session()
+            self.db_manager.checkpoint()
             self.parent.setMenuBar(None)
             from app.main_password_widget import MainPasswordWidget
             self.parent.setCentralWidget(MainPasswordWidget(self.parent))
 
     def import_from_file(self):
-        self.import_export_manager.import_from_file()
-        self.load_names()
+        # 匯入在背景執行，每批資料提交後重新整理列表
+        self.import_export_manager.import_from_file(on_entries_changed=self.load_names)
 
     def export_to_csv(self):
         self.import_export_manager.export_to_csv()
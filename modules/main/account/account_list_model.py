@@ -0,0 +1,128 @@
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+# 名稱列表的資料模型：只保留已讀取的頁面，捲動到底時再以鍵集分頁向資料庫要下一頁
+# 有搜尋字串時改為顯示記憶體索引的搜尋結果，同樣分頁加入列表
+class AccountListModel(QAbstractListModel):
+    def __init__(self, db_manager, page_size=200, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.page_size = page_size
+        self.category = "全部"
+        self.search_text = ""
+        self._names = []
+        self._last_key = None
+        self._last_key_stale = False
+        self._exhausted = False
+        self._search_results = None
+
+    # 切換分類或搜尋條件時重設模型，第一頁由檢視透過 fetchMore 讀取
+    def load(self, category=None, search_text=None):
+        self.beginResetModel()
+        if category is not None:
+            self.category = category
+        if search_text is not None:
+            self.search_text = search_text
+        self._names = []
+        self._last_key = None
+        self._last_key_stale = False
+        self._exhausted = False
+        self._search_results = (self.db_manager.search_names(self.search_text, self.category)
+                                if self.search_text else None)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._names):
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._names[index.row()]
+        return None
+
+    def name_at(self, row):
+        return self._names[row] if 0 <= row < len(self._names) else None
+
+    # 名稱目前所在的列，尚未讀取或不在列表中時回傳 -1
+    def row_of(self, name):
+        try:
+            return self._names.index(name)
+        except ValueError:
+            return -1
+
+    # 資料庫重新編排 order_index 後，已讀取頁面的分頁鍵須在下一次 fetchMore 時重新讀取
+    def mark_order_changed(self):
+        self._last_key_stale = True
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        if self._search_results is not None:
+            self._fetch_search_results()
+            return
+        if self._last_key_stale:
+            self._refresh_last_key()
+        rows = self.db_manager.get_names_page(self.category, self._last_key, self.page_size)
+        if len(rows) < self.page_size:
+            self._exhausted = True
+        if not rows:
+            return
+        self._last_key = (rows[-1][2], rows[-1][0])
+        start = len(self._names)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._names.extend(row[1] for row in rows)
+        self.endInsertRows()
+
+    # 拖曳後最後一列可能已換成別的條目，或被移動的條目已寫入新的 order_index，
+    # 改以目前最後一列在資料庫中的鍵接續分頁，避免同一筆在下一頁重複出現
+    def _refresh_last_key(self):
+        self._last_key_stale = False
+        if not self._names:
+            return
+        key = self.db_manager.get_order_key(self._names[-1])
+        if key is not None:
+            self._last_key = tuple(key)
+
+    def _fetch_search_results(self):
+        start = len(self._names)
+        page = self._search_results[start:start + self.page_size]
+        if start + len(page) >= len(self._search_results):
+            self._exhausted = True
+        if not page:
+            return
+        self.beginInsertRows(QModelIndex(), start, start + len(page) - 1)
+        self._names.extend(page)
+        self.endInsertRows()
+
+    # 拖曳排序
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled
+        return (Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsDragEnabled)
+
+    def supportedDropActions(self):
+        return Qt.DropAction.MoveAction
+
+    # 只移動記憶體中的列並發出 rowsMoved，資料庫由 AccountListHandler 更新
+    def moveRows(self, source_parent, source_row, count, destination_parent, destination_child):
+        if source_parent.isValid() or destination_parent.isValid():
+            return False
+        if count <= 0 or source_row < 0 or source_row + count > len(self._names):
+            return False
+        if source_row <= destination_child <= source_row + count:
+            return False
+        if not self.beginMoveRows(source_parent, source_row, source_row + count - 1,
+                                  destination_parent, destination_child):
+            return False
+        moved = self._names[source_row:source_row + count]
+        del self._names[source_row:source_row + count]
+        insert_at = destination_child if destination_child < source_row else destination_child - count
+        self._names[insert_at:insert_at] = moved
+        # 資料庫在 rowsMoved 的處理中才更新，分頁鍵等到下一次 fetchMore 再重新讀取
+        self._last_key_stale = True
+        self.endMoveRows()
+        return True
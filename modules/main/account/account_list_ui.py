@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLineEdit, QPushButton, 
-                            QListWidget, QHBoxLayout, QAbstractItemView, QMessageBox,
-                            QListWidgetItem, QMenuBar, QMenu, QComboBox, QStyle)
+                            QListView, QHBoxLayout, QAbstractItemView, QMessageBox,
+                            QMenuBar, QMenu, QComboBox, QStyle)
 from PyQt6.QtCore import Qt, QTimer, QThreadPool, QSize
 from PyQt6.QtGui import QFont, QAction
 
@@ -42,10 +42,13 @@ class AccountListUI(QWidget):
         self.add_button = QPushButton("新增資料")
         # 設定外框邊距
         self.setContentsMargins(10, 0, 10, 10)
-        # 名稱列表
-        self.name_list = QListWidget()
+        # 名稱列表，資料模型由 AccountListHandler 設定
+        self.name_list = QListView()
+        self.name_list.setUniformItemSizes(True)
+        self.name_list.setMouseTracking(True)  # 滑過項目時預先解密
         self.name_list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.name_list.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
+        self.name_list.setDefaultDropAction(Qt.DropAction.MoveAction)
         self.name_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
     
     def setup_layout(self):
@@ -95,9 +98,12 @@ class AccountListUI(QWidget):
         self.about_action = QAction(about_icon, "關於", self)
         self.help_menu.addAction(self.about_action)
     
+    def set_list_model(self, model):
+        self.name_list.setModel(model)
+    
     def create_context_menu(self, position):
-        item = self.name_list.itemAt(position)
-        if item is None:
+        index = self.name_list.indexAt(position)
+        if not index.isValid():
             return None
             
         context_menu = QMenu(self)
@@ -110,7 +116,7 @@ class AccountListUI(QWidget):
         context_menu.addAction(edit_action)
         context_menu.addAction(delete_action)
         
-        return context_menu, view_action, edit_action, delete_action, item
+        return context_menu, view_action, edit_action, delete_action, index.data()
     
     def show_logout_confirmation(self):
         reply = QMessageBox(self)
@@ -132,14 +138,6 @@ class AccountListUI(QWidget):
             "© 2024 版權所有"
         )
     
-    def clear_list(self):
-        self.name_list.clear()
-    
-    def add_list_item(self, name):
-        item = QListWidgetItem(name)
-        self.name_list.addItem(item)
-        return item
-    
     def update_category_combo(self, categories, current_text=None):
         self.category_combo.clear()
         self.category_combo.addItem("全部")
@@ -151,20 +149,13 @@ class AccountListUI(QWidget):
             if index != -1:
                 self.category_combo.setCurrentIndex(index)
     
-    def filter_list_items(self, search_text):
+    def update_clear_action(self, search_text):
         self.clear_action.setVisible(bool(search_text))
-        search_text = search_text.lower()
-        
-        for index in range(self.name_list.count()):
-            item = self.name_list.item(index)
-            item.setHidden(search_text not in item.text().lower())
     
-    def get_item_order(self):
-        name_order_dict = {}
-        for i in range(self.name_list.count()):
-            name = self.name_list.item(i).text()
-            name_order_dict[name] = i
-        return name_order_dict
+    # 回傳指定列與其上下相鄰項目的名稱
+    def get_item_neighbours(self, row):
+        model = self.name_list.model()
+        return model.name_at(row), model.name_at(row - 1), model.name_at(row + 1)
     
     def on_ui_ready(self):
         pass
\ No newline at end of file
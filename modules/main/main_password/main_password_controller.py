@@ -3,12 +3,24 @@ from dialogs.set_password import SetPasswordDialog
 from dialogs.reset_password import ResetPasswordDialog
 from app.account_list_widget import NameListWidget
 from utils.password_encryption import hash_password, verify_password
+from utils.key_rotation_manager import KeyRotationManager
+from Database.db_manager import VaultKeyError
 import os
 
 class MainPasswordController:
     def __init__(self, widget, db_manager):
         self.widget = widget
         self.db_manager = db_manager
+        self.key_rotation_manager = KeyRotationManager(widget, db_manager)
+
+    # 解開資料金鑰；失敗時顯示錯誤並回傳 False，呼叫端必須中止登入
+    def start_session(self, password):
+        try:
+            self.db_manager.set_current_master_password(password)
+        except VaultKeyError as e:
+            QMessageBox.critical(self.widget, "錯誤", f"{e}\n為避免資料以明文寫入，已中止登入")
+            return False
+        return True
 
     def set_master_password(self):
         dialog = SetPasswordDialog(self.widget)
@@ -17,7 +29,8 @@ class MainPasswordController:
             salt = os.urandom(16)
             hashed_password = hash_password(new_password)
             self.db_manager.set_master_password(hashed_password, salt)
-            self.db_manager.set_current_master_password(new_password)
+            if not self.start_session(new_password):
+                return
             QMessageBox.information(self.widget, "訊息", "登入密碼已設定")
             self.widget.reload_password_input_page()
 
@@ -31,12 +44,19 @@ class MainPasswordController:
         stored_password, _ = self.db_manager.get_master_password()
 
         if verify_password(entered_password, stored_password):
-            self.db_manager.set_current_master_password(entered_password)
+            if not self.start_session(entered_password):
+                return
             QMessageBox.information(self.widget, "訊息", "登入成功")
             self.widget.parent.setCentralWidget(NameListWidget(self.widget.parent))
             self.widget.parent.name_list_widget = self.widget.parent.centralWidget()
 
             self.widget.parent.controller.login_success() # 更新登入狀態 (main_window_controller.py)
+
+            # 上次更換資料金鑰時中斷，登入後從中斷處繼續
+            if self.db_manager.has_pending_key_rotation():
+                main_window = self.widget.parent
+                main_window.key_rotation_manager = KeyRotationManager(main_window, self.db_manager)
+                main_window.key_rotation_manager.start()
         else:
             QMessageBox.warning(self.widget, "訊息", "密碼錯誤")
 
@@ -53,17 +73,24 @@ class MainPasswordController:
                 return
 
             if verify_password(current_password, stored_password):
-                self.db_manager.set_current_master_password(current_password)
-                all_entries = self.db_manager.get_all_entries()
+                if not self.start_session(current_password):
+                    return
 
+                # 只需重新包裝資料金鑰，條目內容不必重新加密
                 hashed_new_password = hash_password(new_password)
                 new_salt = os.urandom(16)
-                self.db_manager.update_master_password(hashed_new_password, new_salt)
-                self.db_manager.set_current_master_password(new_password)
+                updated = self.db_manager.update_master_password(hashed_new_password, new_salt, new_password)
 
-                for name, account, password, notes, category in all_entries:
-                    self.db_manager.update_password_entry(name, name, account, password, notes, category)
+                if not updated:
+                    self.db_manager.clear_session()
+                    QMessageBox.warning(self.widget, "訊息", "登入密碼重設失敗")
+                    return
 
                 QMessageBox.information(self.widget, "訊息", "登入密碼已重設")
+                # 重設後仍停留在登入畫面，重新加密結束後才清除工作階段金鑰
+                if dialog.rotate_data_key and self.db_manager.begin_key_rotation():
+                    self.key_rotation_manager.start(on_finished=self.db_manager.clear_session)
+                else:
+                    self.db_manager.clear_session()
             else:
                 QMessageBox.warning(self.widget, "訊息", "當前密碼錯誤")
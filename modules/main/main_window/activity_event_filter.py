@@ -1,18 +1,21 @@
 from PyQt6.QtCore import QObject, QEvent
 
 class ActivityEventFilter(QObject):
+    # 整個 QApplication 的事件都會經過這裡，集合只建立一次，回呼只記錄時間戳記
+    ACTIVITY_EVENTS = frozenset((
+        QEvent.Type.MouseMove,
+        QEvent.Type.MouseButtonPress,
+        QEvent.Type.MouseButtonRelease,
+        QEvent.Type.KeyPress,
+        QEvent.Type.Wheel,
+        QEvent.Type.FocusIn,
+    ))
+
     def __init__(self, callback):
         super().__init__()
         self.callback = callback
 
     def eventFilter(self, obj, event):
-        if event.type() in (
-            QEvent.Type.MouseMove,
-            QEvent.Type.MouseButtonPress,
-            QEvent.Type.MouseButtonRelease,
-            QEvent.Type.KeyPress,
-            QEvent.Type.Wheel,
-            QEvent.Type.FocusIn,
-        ):
+        if event.type() in self.ACTIVITY_EVENTS:
             self.callback()
-        return super().eventFilter(obj, event)
+        return False
@@ -1,5 +1,6 @@
 from app import main_password_widget
 from preferences.settings_widget import SettingsWidget
+from utils.import_export_manager import ImportExportManager
 
 class MainWindowController:
     def __init__(self, window):
@@ -18,6 +19,10 @@ class MainWindowController:
 
     def handle_auto_logout(self):
         self.is_loging_in = False
+        # 匯入工作持有自己的連線與金鑰，必須在清除工作階段前停止
+        ImportExportManager.cancel_all_imports()
+        self.window.db_manager.clear_session()
+        self.window.db_manager.checkpoint()
 
         self.window.setMenuBar(None)
         self.window.main_password_widget = main_password_widget.MainPasswordWidget(self.window)
@@ -22,5 +22,6 @@ class TrayController:
 
     def quit_from_tray(self):
         self.tray_manager.hide_tray_icon()
+        self.window.settings_manager.flush()
         self.window.db_manager.close()
         QApplication.quit()
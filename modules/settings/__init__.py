@@ -1,5 +1,6 @@
 from .category.category_dialog import CategoryDialog
 from .system.system_dialog import SystemDialog
+from .diagnostics.diagnostics_dialog import DiagnosticsDialog
 
 from .system.theme_settings import ThemeSettings
 from .category.category_settings import CategorySettings
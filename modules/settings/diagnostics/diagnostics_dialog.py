@@ -0,0 +1,76 @@
+import json
+
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
+                             QTableWidgetItem, QHeaderView, QPlainTextEdit, QMessageBox)
+from PyQt6.QtCore import Qt
+
+from utils import instrumentation
+
+TIMER_COLUMNS = ["名稱", "次數", "總計 (ms)", "平均 (µs)", "p50 (µs)", "p95 (µs)", "p99 (µs)", "最大 (µs)"]
+
+
+# 隱藏的診斷分頁：顯示各操作的呼叫次數、耗時分布與快取統計，只供排查效能問題使用
+class DiagnosticsDialog(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._init_ui()
+        self.refresh()
+
+    def _init_ui(self):
+        layout = QVBoxLayout()
+
+        if not instrumentation.ENABLED:
+            hint = QLabel("診斷未啟用。請設定環境變數 PASSWORD_MANAGER_DIAGNOSTICS=1 後重新啟動程式。")
+            hint.setWordWrap(True)
+            layout.addWidget(hint)
+
+        self.timer_table = QTableWidget(0, len(TIMER_COLUMNS))
+        self.timer_table.setHorizontalHeaderLabels(TIMER_COLUMNS)
+        self.timer_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.timer_table.verticalHeader().setVisible(False)
+        self.timer_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.timer_table)
+
+        self.stats_view = QPlainTextEdit()
+        self.stats_view.setReadOnly(True)
+        self.stats_view.setMaximumHeight(150)
+        layout.addWidget(self.stats_view)
+
+        button_layout = QHBoxLayout()
+        button_layout.setAlignment(Qt.AlignmentFlag.AlignRight)
+        for text, slot in (("重新整理", self.refresh), ("清除", self.reset), ("匯出 JSON", self.export_json)):
+            button = QPushButton(text)
+            button.clicked.connect(slot)
+            button.setEnabled(instrumentation.ENABLED)
+            button_layout.addWidget(button)
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def refresh(self):
+        data = instrumentation.snapshot()
+        timers = sorted(data["timers"].items(), key=lambda item: item[1]["total_ms"], reverse=True)
+
+        self.timer_table.setRowCount(len(timers))
+        for row, (name, timer) in enumerate(timers):
+            values = [name, timer["count"], timer["total_ms"], timer["mean_us"],
+                      timer["p50_us"], timer["p95_us"], timer["p99_us"], timer["max_us"]]
+            for column, value in enumerate(values):
+                text = value if isinstance(value, str) else f"{value:,.1f}".rstrip("0").rstrip(".")
+                item = QTableWidgetItem(text)
+                if column:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.timer_table.setItem(row, column, item)
+
+        extra = {"counters": data["counters"], "sources": data["sources"]}
+        self.stats_view.setPlainText(json.dumps(extra, ensure_ascii=False, indent=2))
+
+    def reset(self):
+        instrumentation.reset()
+        self.refresh()
+
+    def export_json(self):
+        path = instrumentation.get_dump_path()
+        if instrumentation.dump(path):
+            QMessageBox.information(self, "訊息", f"診斷資料已匯出至 {path}")
+        else:
+            QMessageBox.warning(self, "錯誤", "診斷資料匯出失敗")
@@ -1,11 +1,14 @@
-from qt_material import apply_stylesheet
-from system.system_theme_detector import detect_system_theme
+from utils.svg_icon_set import SvgIconManager
+from system.system_theme_detector import get_system_theme_watcher
+from utils.theme_stylesheet_cache import ThemeStylesheetCache
+from utils.instrumentation import timed
 from preferences.constants import THEMES
 
 class ThemeSettings:
     def __init__(self, settings_manager):
         self.settings_manager = settings_manager
         self.THEMES = THEMES
+        self.stylesheet_cache = ThemeStylesheetCache()
     
     def get_theme(self):
         return self.settings_manager.settings.get('theme', 'System')
@@ -14,8 +17,9 @@ class ThemeSettings:
         if theme_name is None:
             theme_name = self.get_theme()
         
+        # 系統主題由背景偵測並快取，這裡不會啟動子行程
         if theme_name == "System":
-            return detect_system_theme()
+            return get_system_theme_watcher().current_theme
         return theme_name
     
     def get_theme_file(self, theme_name=None):
@@ -32,10 +36,15 @@ class ThemeSettings:
         effective_theme = self.get_effective_theme(theme_name)
         return effective_theme == "Dark Blue"
     
+    @timed("theme.apply")
     def apply_theme(self, widget, theme_name=None):
         try:
             theme_file = self.get_theme_file(theme_name)
-            apply_stylesheet(widget, theme=theme_file)
+            previous_icon_color = SvgIconManager.get_theme_color(widget)
+            self.stylesheet_cache.apply(widget, theme_file)
+            # 圖示顏色改變時，只移除舊顏色的快取圖示
+            if SvgIconManager.get_theme_color(widget) != previous_icon_color:
+                SvgIconManager.invalidate_color(previous_icon_color)
             return True
         except Exception as e:
             print(f"套用主題錯誤 {e}")
@@ -57,6 +66,23 @@ class ThemeSettings:
         # 儲存設定
         return self.settings_manager.save_settings()
     
+    # 啟動系統主題監看：先沿用上次偵測到的結果，背景偵測完成或系統主題改變時重新套用
+    def start_system_theme_watcher(self, widget, on_changed=None):
+        watcher = get_system_theme_watcher()
+        watcher.current_theme = self.settings_manager.settings.get('last_system_theme', watcher.current_theme)
+
+        def handle_change(theme):
+            self.settings_manager.settings['last_system_theme'] = theme
+            self.settings_manager.save_settings()
+            if self.get_theme() == "System":
+                self.apply_theme(widget)
+                if on_changed:
+                    on_changed()
+
+        watcher.theme_changed.connect(handle_change)
+        watcher.start()
+        return watcher
+
     def get_available_themes(self):
         themes = list(self.THEMES.keys())
         # 確保 System 主題在清單中
@@ -22,5 +22,7 @@ DEFAULT_SETTINGS = {
     "theme": "System", 
     "categories": [], 
     "auto_logout_timeout": 0,
-    "close_action": "tray"
+    "close_action": "tray",
+    "db_profile": "durable",
+    "last_system_theme": "Light Blue"
 }
\ No newline at end of file
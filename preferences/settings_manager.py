@@ -1,13 +1,27 @@
+import copy
 import json
 import os
+from PyQt6.QtCore import QCoreApplication, QTimer
 from utils.path_helper import get_settings_path
 from .constants import DEFAULT_SETTINGS
 from modules.settings import ThemeSettings, SystemSettings, CategorySettings
 
+# 連續變更設定時合併成一次寫入
+SAVE_DEBOUNCE_MS = 500
+
 class SettingsManager:
     
     def __init__(self):
         self.settings_path = get_settings_path()
+        self._saved_settings = {}
+        self._dirty_keys = set()
+        # 沒有 Qt 事件迴圈時（例如命令列腳本）無法延遲寫入，改為立即寫入
+        self._save_timer = None
+        if QCoreApplication.instance() is not None:
+            self._save_timer = QTimer()
+            self._save_timer.setSingleShot(True)
+            self._save_timer.setInterval(SAVE_DEBOUNCE_MS)
+            self._save_timer.timeout.connect(self.flush)
         self.settings = self.load_settings()
         
         # 初始化各個設定模組
@@ -22,14 +36,15 @@ class SettingsManager:
                     settings = json.load(f)
                     
                     for key, value in DEFAULT_SETTINGS.items():
-                        settings.setdefault(key, value)
+                        settings.setdefault(key, copy.deepcopy(value))
+                    self._saved_settings = copy.deepcopy(settings)
                     return settings
             except Exception as e:
                 print(f"載入設定錯誤 {e}")
         
         # 若不存在則建立預設設定
-        default = DEFAULT_SETTINGS.copy()
-        self.save_settings(default)
+        default = copy.deepcopy(DEFAULT_SETTINGS)
+        self._write_settings(default)
         return default
     
     # === 主題相關方法 ===
@@ -50,6 +65,9 @@ class SettingsManager:
 
     def set_theme(self, theme_name, widget=None):
         return self.theme_settings.set_theme(theme_name, widget)
+
+    def start_system_theme_watcher(self, widget, on_changed=None):
+        return self.theme_settings.start_system_theme_watcher(widget, on_changed)
     
     # === 分類相關方法 ===
     def get_categories(self):
@@ -79,16 +97,47 @@ class SettingsManager:
         self.settings[key] = value
         return self.save_settings()
     
+    # 只記錄有變更的鍵並排程寫入，實際寫檔由 flush 在停頓後一次完成
     def save_settings(self, settings=None):
         if settings is not None:
             self.settings = settings
 
+        saved = self._saved_settings
+        self._dirty_keys.update(key for key in self.settings.keys() | saved.keys()
+                                if key not in self.settings or key not in saved
+                                or self.settings[key] != saved[key])
+        if not self._dirty_keys:
+            return True
+        if self._save_timer is None:
+            return self.flush()
+        self._save_timer.start()
+        return True
+
+    # 立即寫入尚未儲存的變更；關閉程式前必須呼叫
+    def flush(self):
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        if not self._dirty_keys:
+            return True
+        return self._write_settings(self.settings)
+
+    # 先寫入同目錄的暫存檔再取代原檔，寫到一半中斷也不會留下不完整的設定檔
+    def _write_settings(self, settings):
+        tmp_path = f"{self.settings_path}.tmp"
         try:
             os.makedirs(os.path.dirname(self.settings_path), exist_ok=True)
-            with open(self.settings_path, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, ensure_ascii=False, indent=2)
-            print(f"設定已儲存 {self.settings_path}")
-            return True
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(settings, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.settings_path)
         except Exception as e:
             print(f"儲存設定錯誤 {e}")
-            return False
\ No newline at end of file
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+        self._saved_settings = copy.deepcopy(settings)
+        self._dirty_keys.clear()
+        return True
\ No newline at end of file
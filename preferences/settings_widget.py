@@ -1,9 +1,10 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                             QLabel, QScrollArea, QMessageBox, QTabWidget)
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QFont, QKeySequence, QShortcut
 
-from modules.settings import SystemDialog, CategoryDialog
+from modules.settings import SystemDialog, CategoryDialog, DiagnosticsDialog
+from utils import instrumentation
 
 class SettingsWidget(QWidget):
     def __init__(self, parent):
@@ -14,6 +15,7 @@ class SettingsWidget(QWidget):
         
         self.category_dialog = CategoryDialog(self.settings_manager, self)
         self.system_dialog = SystemDialog(self.settings_manager, self)
+        self.diagnostics_dialog = None
         
         self.init_ui()
         
@@ -31,6 +33,10 @@ class SettingsWidget(QWidget):
         # 使用輔助方法建立可滾動的分頁
         self._add_scrollable_tab(self.system_dialog, "系統設定")
         self._add_scrollable_tab(self.category_dialog, "分類設定")
+        # 診斷分頁預設隱藏：啟用診斷時直接顯示，否則按 Ctrl+Shift+D 才出現
+        if instrumentation.ENABLED:
+            self.show_diagnostics_tab()
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self, activated=self.show_diagnostics_tab)
         
         main_layout.addWidget(self.tab_widget)
 
@@ -58,6 +64,14 @@ class SettingsWidget(QWidget):
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.tab_widget.addTab(scroll_area, title)
 
+    def show_diagnostics_tab(self):
+        if self.diagnostics_dialog is None:
+            self.diagnostics_dialog = DiagnosticsDialog(self)
+            self.tab_widget.addTab(self.diagnostics_dialog, "診斷")
+        else:
+            self.diagnostics_dialog.refresh()
+        self.tab_widget.setCurrentWidget(self.diagnostics_dialog)
+
     # 檢查是否有未儲存的變更
     def has_unsaved_changes(self):
         return (self.category_dialog.has_changes() or self.system_dialog.has_changes())
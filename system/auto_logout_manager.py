@@ -3,41 +3,64 @@ import time
 
 class AutoLogoutManager(QObject):
     logout_requested = pyqtSignal()
-    
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
         self.settings_manager = parent.settings_manager if parent else None
-        
-        # 簡化：只用一個計時器
+
+        # 使用者活動只記錄時間戳記，不重新啟動計時器
+        # 計時器只在預計的登出時間觸發一次，若期間有活動就依閒置時間重新排程，移動滑鼠時不會頻繁重設計時器
         self.logout_timer = QTimer(self)
-        self.logout_timer.timeout.connect(self.auto_logout)
+        self.logout_timer.timeout.connect(self.check_idle)
         self.logout_timer.setSingleShot(True)  # 只觸發一次
-        
+
         self.logout_timeout = 0  # 自動登出時間（分鐘）
         self.is_enabled = False
-        
+        self.is_monitoring = False
+        self.last_activity = time.monotonic()
+
         self.load_settings()
-    
+
     def load_settings(self):
         if self.settings_manager:
             self.logout_timeout = self.settings_manager.get_auto_logout_timeout()
             self.is_enabled = self.logout_timeout > 0
-    
+
     def start_monitoring(self):
-        if self.is_enabled and self.logout_timeout > 0:
-            # 設定計時器，時間到就自動登出
-            self.logout_timer.start(int(self.logout_timeout * 60 * 1000))  # 轉換為毫秒
-    
+        self.is_monitoring = True
+        self.last_activity = time.monotonic()
+        self._schedule_check(self.logout_timeout * 60)
+
     def stop_monitoring(self):
+        self.is_monitoring = False
         self.logout_timer.stop()
-    
-    def reset_timer(self):
-        if self.is_enabled and self.logout_timeout > 0:
-            self.logout_timer.start(int(self.logout_timeout * 60 * 1000))  # 重新計時
-    
+
+    # 由 ActivityEventFilter 在每個滑鼠、鍵盤事件呼叫，必須保持低成本
+    def record_activity(self):
+        self.last_activity = time.monotonic()
+
+    def check_idle(self):
+        if not self.is_enabled:
+            self.logout_timer.stop()
+            return
+        remaining = self.logout_timeout * 60 - (time.monotonic() - self.last_activity)
+        if remaining <= 0:
+            self.auto_logout()
+        else:
+            self._schedule_check(remaining)
+
+    def _schedule_check(self, seconds):
+        if self.is_enabled:
+            self.logout_timer.start(max(1, int(seconds * 1000)))  # 轉換為毫秒
+        else:
+            self.logout_timer.stop()
+
     def auto_logout(self):
         self.logout_requested.emit()
-    
+
+    # 監控中變更登出時間時，依新設定重新排程
     def update_settings(self):
-        self.load_settings()
\ No newline at end of file
+        self.load_settings()
+        if self.is_monitoring:
+            self.check_idle()
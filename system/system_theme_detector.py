@@ -1,5 +1,8 @@
+import os
 import sys
 import subprocess
+import threading
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
 def detect_system_theme():
     try:
@@ -51,3 +54,93 @@ def detect_system_theme():
         print(f"檢測系統主題時發生錯誤: {e}")
 
     return "Light Blue"
+
+
+# 系統主題設定檔，修改時間改變才重新偵測；Windows 讀取登錄檔本身就很快，每次輪詢直接偵測
+def _theme_config_paths():
+    home = os.path.expanduser("~")
+    if sys.platform == "linux":
+        return [os.path.join(home, ".config", "kdeglobals"), os.path.join(home, ".config", "dconf", "user")]
+    if sys.platform == "darwin":
+        return [os.path.join(home, "Library", "Preferences", ".GlobalPreferences.plist")]
+    return []
+
+
+def _config_mtimes(paths):
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return mtimes
+
+
+# 快取系統主題：偵測在背景執行緒進行，之後只在設定檔變動或收到 refresh() 時重新偵測
+class SystemThemeWatcher(QObject):
+    theme_changed = pyqtSignal(str)
+    _detected = pyqtSignal(str)
+
+    def __init__(self, initial_theme="Light Blue", poll_interval_ms=5000, parent=None):
+        super().__init__(parent)
+        self.current_theme = initial_theme
+        self._config_paths = _theme_config_paths()
+        self._mtimes = None
+        self._detecting = False
+        self._detected.connect(self._on_detected)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(poll_interval_ms)
+        self._poll_timer.timeout.connect(self._poll)
+
+    def start(self):
+        self.refresh()
+        self._poll_timer.start()
+
+    def stop(self):
+        self._poll_timer.stop()
+
+    # 強制重新偵測，例如收到系統的配色變更事件時
+    def refresh(self):
+        self._mtimes = _config_mtimes(self._config_paths)
+        self._detect_in_background()
+
+    def _poll(self):
+        if not self._config_paths:
+            self._detect_in_background()
+            return
+        mtimes = _config_mtimes(self._config_paths)
+        if mtimes != self._mtimes:
+            self._mtimes = mtimes
+            self._detect_in_background()
+
+    def _detect_in_background(self):
+        if self._detecting:
+            return
+        self._detecting = True
+        # 使用 daemon 執行緒，關閉程式時不必等待偵測用的子行程逾時
+        threading.Thread(target=self._run_detection, daemon=True).start()
+
+    def _run_detection(self):
+        theme = detect_system_theme()
+        try:
+            self._detected.emit(theme)
+        except RuntimeError:
+            # 程式已關閉，物件已被刪除
+            pass
+
+    def _on_detected(self, theme):
+        self._detecting = False
+        if theme != self.current_theme:
+            self.current_theme = theme
+            self.theme_changed.emit(theme)
+
+
+_watcher = None
+
+
+def get_system_theme_watcher():
+    global _watcher
+    if _watcher is None:
+        _watcher = SystemThemeWatcher()
+    return _watcher
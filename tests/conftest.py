@@ -0,0 +1,36 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+MASTER_PASSWORD = "test-password"
+
+
+# 每個測試使用獨立的暫存資料庫
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "passwords.db")
+    monkeypatch.setenv("PASSWORD_MANAGER_DB", path)
+    return path
+
+
+@pytest.fixture
+def db_manager(db_path):
+    from Database.db_manager import DBManager
+    from utils.password_encryption import hash_password
+
+    manager = DBManager()
+    manager.set_master_password(hash_password(MASTER_PASSWORD), os.urandom(16))
+    manager.set_current_master_password(MASTER_PASSWORD)
+    yield manager
+    manager.close()
+
+
+# 需要建立元件的測試共用同一個 QApplication
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
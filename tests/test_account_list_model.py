@@ -0,0 +1,43 @@
+import pytest
+from PyQt6.QtCore import QModelIndex
+
+from modules.main.account.account_list_model import AccountListModel
+
+
+@pytest.fixture
+def model(qapp, db_manager):
+    for i in range(10):
+        db_manager.add_password_entry(f"n{i}", "", "", "")
+
+    model = AccountListModel(db_manager, page_size=4)
+
+    # 與 AccountListHandler.update_order_in_database 相同：依畫面上的相鄰條目更新資料庫
+    def update_order(parent, start, end, destination, row):
+        new_row = row if row < start else row - (end - start + 1)
+        db_manager.move_entry(model.name_at(new_row), model.name_at(new_row - 1), model.name_at(new_row + 1))
+
+    model.rowsMoved.connect(update_order)
+    model.load("全部")
+    model.fetchMore()
+    return model
+
+
+def _fetch_all(model):
+    while model.canFetchMore():
+        model.fetchMore()
+    return [model.name_at(row) for row in range(model.rowCount())]
+
+
+@pytest.mark.parametrize("source_row, destination_row", [(0, 4), (3, 0), (1, 3)])
+def test_fetch_more_after_move_has_no_duplicates(model, db_manager, source_row, destination_row):
+    assert model.rowCount() == 4
+    assert model.moveRows(QModelIndex(), source_row, 1, QModelIndex(), destination_row)
+
+    names = _fetch_all(model)
+    assert len(names) == len(set(names)) == 10
+    assert names == db_manager.get_names_by_category("全部")
+
+
+def test_move_to_page_end_keeps_moved_row_on_loaded_page(model):
+    model.moveRows(QModelIndex(), 0, 1, QModelIndex(), 4)
+    assert _fetch_all(model) == ["n1", "n2", "n3", "n0", "n4", "n5", "n6", "n7", "n8", "n9"]
@@ -0,0 +1,68 @@
+import pytest
+
+from system import auto_logout_manager as auto_logout_module
+from system.auto_logout_manager import AutoLogoutManager
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(auto_logout_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def manager(qapp, clock):
+    manager = AutoLogoutManager()
+    manager.logout_timeout = 5
+    manager.is_enabled = True
+    manager.logouts = []
+    manager.logout_requested.connect(lambda: manager.logouts.append(True))
+    manager.start_monitoring()
+    yield manager
+    manager.stop_monitoring()
+
+
+def test_start_monitoring_schedules_full_timeout(manager):
+    assert manager.logout_timer.isActive()
+    assert manager.logout_timer.interval() == 5 * 60 * 1000
+
+
+def test_check_idle_logs_out_after_timeout(manager, clock):
+    clock[0] += 5 * 60
+
+    manager.check_idle()
+
+    assert manager.logouts == [True]
+
+
+# 期間有活動時不登出，依最後一次活動重新排程剩餘時間
+def test_check_idle_reschedules_after_activity(manager, clock):
+    clock[0] += 4 * 60
+    manager.record_activity()
+    clock[0] += 60
+
+    manager.check_idle()
+
+    assert manager.logouts == []
+    assert manager.logout_timer.isActive()
+    assert manager.logout_timer.interval() == 4 * 60 * 1000
+
+
+def test_check_idle_schedules_at_least_one_millisecond(manager, clock):
+    clock[0] += 5 * 60 - 0.0001
+
+    manager.check_idle()
+
+    assert manager.logouts == []
+    assert manager.logout_timer.interval() == 1
+
+
+def test_check_idle_stops_timer_when_disabled(manager, clock):
+    manager.is_enabled = False
+    clock[0] += 10 * 60
+
+    manager.check_idle()
+
+    assert manager.logouts == []
+    assert not manager.logout_timer.isActive()
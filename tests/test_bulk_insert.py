@@ -0,0 +1,44 @@
+import sqlite3
+
+import pytest
+
+
+def _entries(*names):
+    return [(name, "user", "secret", "", None) for name in names]
+
+
+@pytest.fixture
+def vault(db_manager):
+    db_manager.add_password_entry("dup", "user", "secret", "")
+    return db_manager
+
+
+def test_non_atomic_skips_only_the_failing_chunk(vault):
+    errors = []
+    inserted = vault.add_password_entries_bulk(_entries("a", "b", "c", "dup", "e", "f"), chunk_size=2,
+                                               atomic=False, errors=errors)
+
+    assert inserted == 4
+    assert len(errors) == 1 and errors[0].startswith("第 3-4 筆")
+    assert vault.get_all_names() == ["dup", "a", "b", "e", "f"]
+
+
+def test_non_atomic_raises_after_remaining_chunks_without_errors_list(vault):
+    with pytest.raises(sqlite3.IntegrityError):
+        vault.add_password_entries_bulk(_entries("a", "dup", "c", "d"), chunk_size=2, atomic=False)
+    assert vault.get_all_names() == ["dup", "c", "d"]
+
+
+def test_atomic_rolls_back_everything_and_raises(vault):
+    with pytest.raises(sqlite3.IntegrityError):
+        vault.add_password_entries_bulk(_entries("a", "b", "dup", "d"), chunk_size=2)
+    assert vault.get_all_names() == ["dup"]
+
+
+def test_cancel_discards_uncommitted_chunks(vault):
+    progress = []
+    inserted = vault.add_password_entries_bulk(_entries("a", "b", "c", "d"), chunk_size=2,
+                                               progress_callback=lambda *args: progress.append(args),
+                                               should_cancel=lambda: len(progress) >= 1)
+    assert inserted == 0
+    assert vault.get_all_names() == ["dup"]
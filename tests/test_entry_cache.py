@@ -0,0 +1,140 @@
+import pytest
+
+from utils import entry_cache as entry_cache_module
+from utils.entry_cache import EntryCache, _entry_size
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(entry_cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_cached_value_and_counts(clock):
+    cache = EntryCache()
+    cache.put(1, "a", ("user", "pw", "", ""))
+
+    assert cache.get("a") == ("user", "pw", "", "")
+    assert cache.get("b") is None
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+# 閒置超過 ttl 的條目視為不存在，讀取時移除
+def test_entries_expire_after_ttl(clock):
+    cache = EntryCache(ttl=10)
+    cache.put(1, "a", ("user", "pw", "", ""))
+
+    clock[0] += 10
+    assert cache.get("a") is not None
+    clock[0] += 10.5
+    assert not cache.contains("a")
+    assert cache.get("a") is None
+    assert cache.stats()['expirations'] == 1
+    assert cache.stats()['entries'] == 0
+
+
+def test_purge_expired_removes_only_idle_entries(clock):
+    cache = EntryCache(ttl=10)
+    cache.put(1, "old", ("user", "pw", "", ""))
+    clock[0] += 8
+    cache.put(2, "new", ("user", "pw", "", ""))
+    clock[0] += 5
+
+    cache.purge_expired()
+
+    assert not cache.contains("old")
+    assert cache.contains("new")
+    assert cache.stats()['bytes'] == _entry_size("new", ("user", "pw", "", ""))
+
+
+# 超過筆數上限時淘汰最久未使用的條目
+def test_max_entries_evicts_least_recently_used(clock):
+    cache = EntryCache(max_entries=2)
+    cache.put(1, "a", ("1",))
+    cache.put(2, "b", ("2",))
+    cache.get("a")
+    cache.put(3, "c", ("3",))
+
+    assert cache.contains("a")
+    assert not cache.contains("b")
+    assert cache.contains("c")
+    assert cache.stats()['evictions'] == 1
+
+
+def test_max_bytes_evicts_until_under_limit(clock):
+    value = ("x" * 40,)
+    size = _entry_size("a", value)
+    cache = EntryCache(max_bytes=size * 2)
+    cache.put(1, "a", value)
+    cache.put(2, "b", value)
+    cache.put(3, "c", value)
+
+    assert [cache.contains(name) for name in "abc"] == [False, True, True]
+    assert cache.stats()['bytes'] <= size * 2
+
+    # 單筆超過上限時不快取
+    cache.put(4, "d", ("x" * size * 3,))
+    assert not cache.contains("d")
+    assert cache.contains("b")
+
+
+def test_disabled_cache_stores_nothing(clock):
+    cache = EntryCache(max_entries=0)
+    cache.put(1, "a", ("user",))
+    assert cache.get("a") is None
+
+
+# 同一 id 改名後重新放入時，舊名稱不可再命中
+def test_put_same_id_under_new_name_replaces_old_name(clock):
+    cache = EntryCache()
+    cache.put(1, "a", ("old",))
+    cache.put(1, "b", ("new",))
+
+    assert cache.get("a") is None
+    assert cache.get("b") == ("new",)
+    assert cache.stats()['entries'] == 1
+
+
+def test_update_invalidates_cached_entry(db_manager):
+    db_manager.add_password_entry("a", "user", "old", "")
+    assert db_manager.get_password_entry("a")[1] == "old"
+    assert db_manager.entry_cache.contains("a")
+
+    db_manager.update_password_entry("a", "a", "user", "new", "")
+
+    assert not db_manager.entry_cache.contains("a")
+    assert db_manager.get_password_entry("a")[1] == "new"
+
+
+def test_rename_invalidates_old_name(db_manager):
+    db_manager.add_password_entry("a", "user", "pw", "")
+    db_manager.get_password_entry("a")
+
+    db_manager.update_password_entry("a", "b", "user", "pw", "")
+
+    assert not db_manager.entry_cache.contains("a")
+    assert db_manager.get_password_entry("a") is None
+    assert db_manager.get_password_entry("b")[1] == "pw"
+
+
+def test_delete_invalidates_cached_entry(db_manager):
+    db_manager.add_password_entry("a", "user", "pw", "")
+    db_manager.get_password_entry("a")
+
+    db_manager.delete_password_entry("a")
+
+    assert not db_manager.entry_cache.contains("a")
+    assert db_manager.get_password_entry("a") is None
+
+
+# 快取內容為明文，登出後不可留在記憶體
+def test_clear_session_empties_cache(db_manager):
+    db_manager.add_password_entry("a", "user", "pw", "")
+    db_manager.get_password_entry("a")
+
+    db_manager.clear_session()
+
+    assert db_manager.entry_cache.stats()['entries'] == 0
+    assert db_manager.entry_cache.stats()['bytes'] == 0
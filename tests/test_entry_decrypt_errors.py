@@ -0,0 +1,40 @@
+import pytest
+from PyQt6.QtWidgets import QMessageBox
+
+from Database.db_manager import EntryDecryptError
+from dialogs import password_operations
+
+
+@pytest.fixture
+def corrupted_entry(db_manager):
+    db_manager.add_password_entry("ok", "user", "secret", "")
+    db_manager.add_password_entry("broken", "user", "secret", "")
+    db_manager.cursor.execute("UPDATE passwords SET record = 'not-a-token' WHERE name = 'broken'")
+    db_manager.conn.commit()
+    return db_manager
+
+
+def test_get_password_entry_raises_and_does_not_cache(corrupted_entry):
+    with pytest.raises(EntryDecryptError):
+        corrupted_entry.get_password_entry("broken")
+    assert not corrupted_entry.entry_cache.contains("broken")
+    assert corrupted_entry.get_password_entry("ok") == ("user", "secret", "", None)
+
+
+def test_bulk_reads_raise_instead_of_returning_blanks(corrupted_entry):
+    with pytest.raises(EntryDecryptError):
+        corrupted_entry.get_all_entries()
+    with pytest.raises(EntryDecryptError):
+        list(corrupted_entry.iter_entries())
+
+
+def test_edit_is_blocked_for_undecryptable_entry(corrupted_entry, monkeypatch):
+    warnings = []
+    monkeypatch.setattr(QMessageBox, "warning", lambda *args: warnings.append(args))
+    monkeypatch.setattr(password_operations, "EditPasswordDialog",
+                        lambda *args: pytest.fail("不應開啟編輯視窗"))
+
+    assert password_operations.edit_password_entry(None, corrupted_entry, "broken") is None
+    assert len(warnings) == 1
+    corrupted_entry.cursor.execute("SELECT record FROM passwords WHERE name = 'broken'")
+    assert corrupted_entry.cursor.fetchone()[0] == "not-a-token"
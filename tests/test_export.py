@@ -0,0 +1,48 @@
+import os
+
+import pytest
+from PyQt6.QtWidgets import QFileDialog, QMessageBox
+
+from utils.import_export_manager import ImportExportManager
+
+
+@pytest.fixture
+def export(db_manager, tmp_path, monkeypatch):
+    messages = []
+    monkeypatch.setattr(QMessageBox, "information", lambda *args: messages.append(("information", args[2])))
+    monkeypatch.setattr(QMessageBox, "critical", lambda *args: messages.append(("critical", args[2])))
+
+    def run(file_name):
+        target = str(tmp_path / file_name)
+        monkeypatch.setattr(QFileDialog, "getSaveFileName", lambda *args: (target, ""))
+        ImportExportManager(None, db_manager, None)._export_entries()
+        return target
+
+    db_manager.add_password_entry("a", "user", "secret", "")
+    db_manager.add_password_entry("b", "user", "secret", "")
+    return run, messages
+
+
+@pytest.mark.parametrize("file_name", ["export.csv", "export.xlsx"])
+def test_successful_export_replaces_target(export, tmp_path, file_name):
+    run, messages = export
+    (tmp_path / file_name).write_text("old")
+
+    target = run(file_name)
+
+    assert messages[-1][0] == "information"
+    assert os.path.getsize(target) > len("old")
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_failed_export_keeps_previous_file_and_removes_temp(export, db_manager, tmp_path):
+    run, messages = export
+    (tmp_path / "export.csv").write_text("old")
+    db_manager.cursor.execute("UPDATE passwords SET record = 'not-a-token' WHERE name = 'b'")
+    db_manager.conn.commit()
+
+    run("export.csv")
+
+    assert messages[-1][0] == "critical"
+    assert (tmp_path / "export.csv").read_text() == "old"
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
@@ -0,0 +1,89 @@
+# 以 python -X importtime 在子行程量測啟動時匯入 main 的總耗時與模組數量，不可超過 benchmarks/import_budget.json 的預算
+# 登入畫面不需要的重量級模組（pandas、openpyxl、qt_material、cryptography 等）若在啟動時被載入也視為失敗
+# 重新記錄預算（目前量測值加上餘裕）：python -m tests.test_import_budget --update
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROUNDS = 5
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BUDGET_FILE = os.path.join(ROOT, "benchmarks", "import_budget.json")
+
+# 重新記錄預算時保留的餘裕
+TIME_HEADROOM = 1.5
+MODULE_HEADROOM = 1.1
+
+# 第一次使用時才匯入的模組
+DEFERRED_MODULES = ["pandas", "numpy", "openpyxl", "qt_material", "jinja2",
+                    "bcrypt", "cryptography", "multiprocessing"]
+
+
+# 回傳 (累計耗時 ms, 模組數量, 已匯入的頂層套件)
+def measure_once():
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                            cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    total_us = 0
+    modules = 0
+    packages = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if not fields[0].strip().isdigit():
+            continue  # 標題列
+        modules += 1
+        name = fields[2].strip()
+        packages.add(name.split(".")[0])
+        if name == "main":
+            total_us = int(fields[1])
+    return total_us / 1000, modules, packages
+
+
+# 回傳 (耗時中位數 ms, 最多的模組數量, 已匯入的頂層套件)
+def measure():
+    runs = [measure_once() for _ in range(ROUNDS)]
+    total_ms = sorted(run[0] for run in runs)[ROUNDS // 2]
+    modules = max(run[1] for run in runs)
+    return total_ms, modules, set().union(*(run[2] for run in runs))
+
+
+@pytest.fixture(scope="module")
+def startup():
+    return measure()
+
+
+@pytest.fixture(scope="module")
+def budget():
+    with open(BUDGET_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_deferred_modules_not_imported_at_startup(startup):
+    assert sorted(set(DEFERRED_MODULES) & startup[2]) == []
+
+
+def test_module_count_within_budget(startup, budget):
+    assert startup[1] <= budget["modules"]
+
+
+def test_import_time_within_budget(startup, budget):
+    assert startup[0] <= budget["total_ms"], f"{startup[0]:.1f}ms / {budget['total_ms']}ms"
+
+
+def update_budget():
+    total_ms, modules, _ = measure()
+    budget = {"total_ms": round(total_ms * TIME_HEADROOM), "modules": round(modules * MODULE_HEADROOM)}
+    with open(BUDGET_FILE, "w", encoding="utf-8") as f:
+        json.dump(budget, f, indent=2)
+        f.write("\n")
+    print(f"啟動匯入耗時（中位數）: {total_ms:.1f}ms，模組數量: {modules}")
+    print(f"已更新預算: {budget}")
+
+
+if __name__ == "__main__":
+    if "--update" in sys.argv:
+        update_budget()
@@ -0,0 +1,53 @@
+import threading
+
+import pandas as pd
+import pytest
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtWidgets import QFileDialog, QMessageBox
+
+from utils.import_export_manager import ImportExportManager
+from utils.import_worker import ImportWorker
+
+
+@pytest.fixture
+def started_import(qapp, db_manager, monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+    rows = pd.DataFrame({'名稱': [f"site-{i}" for i in range(2000)], '帳號': "user", '密碼': "pw"})
+
+    # 讓背景工作停在讀檔階段，確保取消時工作已經開始執行
+    def read_file(worker):
+        started.set()
+        release.wait(5)
+        return rows
+
+    monkeypatch.setattr(ImportWorker, "_read_file", read_file)
+    monkeypatch.setattr(QFileDialog, "getOpenFileName", lambda *args: ("import.csv", ""))
+    monkeypatch.setattr(ImportExportManager, "_ask_import_mode", lambda self: False)
+    monkeypatch.setattr(QMessageBox, "information", lambda *args: None)
+    monkeypatch.setattr(QMessageBox, "warning", lambda *args: None)
+
+    calls = []
+    manager = ImportExportManager(None, db_manager, None, QThreadPool())
+    manager.import_from_file(on_entries_changed=lambda: calls.append("changed"))
+    assert started.wait(5)
+    return manager, release, calls
+
+
+def test_cancel_all_imports_stops_worker_before_it_writes(started_import, db_manager, qapp):
+    manager, release, calls = started_import
+    worker = manager.import_worker
+
+    # 工作必須在 cancel_import 等待期間結束，因此先放行再取消
+    threading.Timer(0.05, release.set).start()
+    ImportExportManager.cancel_all_imports()
+
+    assert worker.wait(0)
+    assert manager.import_worker is None
+    assert manager.progress_dialog is None
+    assert manager not in ImportExportManager._active
+    assert db_manager.get_all_names() == []
+
+    # 已排入佇列的訊號不應再觸發列表更新
+    qapp.processEvents()
+    assert calls == []
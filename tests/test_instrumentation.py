@@ -0,0 +1,46 @@
+import pytest
+
+from utils import instrumentation
+from tests.conftest import MASTER_PASSWORD
+
+
+@pytest.fixture
+def counters(monkeypatch):
+    monkeypatch.setattr(instrumentation, "ENABLED", True)
+    instrumentation.reset()
+    yield lambda: instrumentation.snapshot()["counters"]
+    instrumentation.reset()
+
+
+def test_counts_kdf_decrypts_and_cache_lookups(db_manager, counters):
+    db_manager.add_password_entry("a", "user", "secret", "")
+    db_manager.add_password_entry("b", "user", "secret", "")
+    db_manager.set_current_master_password(MASTER_PASSWORD)
+    assert counters()["crypto.kdf_runs"] == 1
+
+    db_manager.get_password_entry("a")
+    db_manager.get_password_entry("a")
+    db_manager.get_all_entries()
+
+    result = counters()
+    assert result["entry_cache.misses"] == 1
+    assert result["entry_cache.hits"] == 1
+    assert result["db.entry_decrypts"] == 3
+    assert "db.decrypt_failures" not in result
+
+
+def test_counts_decrypt_failures(db_manager, counters):
+    db_manager.add_password_entry("broken", "user", "secret", "")
+    db_manager.cursor.execute("UPDATE passwords SET record = 'not-a-token'")
+    db_manager.conn.commit()
+
+    with pytest.raises(ValueError):
+        db_manager.get_password_entry("broken")
+    assert counters()["db.decrypt_failures"] == 1
+
+
+def test_increment_is_noop_when_disabled(monkeypatch):
+    monkeypatch.setattr(instrumentation, "ENABLED", False)
+    instrumentation.reset()
+    instrumentation.increment("crypto.kdf_runs")
+    assert instrumentation.snapshot()["counters"] == {}
@@ -0,0 +1,85 @@
+import sqlite3
+
+import pytest
+
+from Database import migrations
+
+
+# 遷移功能加入前的資料表：id 不是主鍵、名稱可重複、order_index 為連續整數，也沒有 record 與 wrapped_key 欄位
+@pytest.fixture
+def legacy_conn(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "legacy.db"))
+    conn.execute("CREATE TABLE master_password (id INTEGER PRIMARY KEY, password TEXT NOT NULL, salt BLOB NOT NULL)")
+    conn.execute('''CREATE TABLE passwords (
+                    id INTEGER NOT NULL UNIQUE,
+                    name TEXT NOT NULL,
+                    account TEXT,
+                    password TEXT,
+                    notes TEXT,
+                    order_index INTEGER,
+                    category TEXT)''')
+    conn.executemany("INSERT INTO passwords (id, name, account, order_index) VALUES (?, ?, ?, ?)", [
+        (1, "mail", "first", 0),
+        (2, "bank", "bank", 1),
+        (3, "mail", "second", 2),
+        (4, "mail (2)", "existing", 3),
+        (5, "mail", "third", 4),
+    ])
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def _columns(conn, table):
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def test_legacy_database_migrates_to_current_version(legacy_conn):
+    assert migrations.get_schema_version(legacy_conn) == 0
+
+    migrations.migrate(legacy_conn)
+
+    assert migrations.get_schema_version(legacy_conn) == migrations.SCHEMA_VERSION == 5
+    assert "wrapped_key" in _columns(legacy_conn, "master_password")
+    assert "record" in _columns(legacy_conn, "passwords")
+    assert legacy_conn.execute("SELECT name FROM sqlite_master WHERE name = 'rekey_journal'").fetchone()
+
+
+# 重複名稱依原本順序加上編號，已被使用的編號會跳過
+def test_duplicate_names_are_renamed(legacy_conn):
+    migrations.migrate(legacy_conn)
+
+    rows = dict(legacy_conn.execute("SELECT account, name FROM passwords"))
+    assert rows == {
+        "first": "mail",
+        "bank": "bank",
+        "second": "mail (3)",
+        "existing": "mail (2)",
+        "third": "mail (4)",
+    }
+
+
+def test_name_is_unique_after_migration(legacy_conn):
+    migrations.migrate(legacy_conn)
+
+    unique_indexes = [row[1] for row in legacy_conn.execute("PRAGMA index_list(passwords)") if row[2]]
+    assert "idx_passwords_name" in unique_indexes
+    with pytest.raises(sqlite3.IntegrityError):
+        legacy_conn.execute("INSERT INTO passwords (name) VALUES ('bank')")
+
+
+def test_order_index_is_spread_by_gap(legacy_conn):
+    migrations.migrate(legacy_conn)
+
+    rows = legacy_conn.execute("SELECT id, order_index FROM passwords ORDER BY order_index").fetchall()
+    assert rows == [(entry_id, i * migrations.ORDER_GAP) for i, entry_id in enumerate([1, 2, 3, 4, 5])]
+
+
+# 已是最新版本時不會重複執行遷移
+def test_migrate_is_idempotent(legacy_conn):
+    migrations.migrate(legacy_conn)
+    before = legacy_conn.execute("SELECT id, name, order_index FROM passwords ORDER BY id").fetchall()
+
+    migrations.migrate(legacy_conn)
+
+    assert legacy_conn.execute("SELECT id, name, order_index FROM passwords ORDER BY id").fetchall() == before
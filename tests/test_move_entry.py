@@ -0,0 +1,52 @@
+from Database.db_manager import ORDER_GAP
+from utils.rebalance_worker import RebalanceWorker
+
+
+def _order(db_manager):
+    db_manager.cursor.execute("SELECT name, order_index FROM passwords ORDER BY order_index ASC, id ASC")
+    return db_manager.cursor.fetchall()
+
+
+def test_entries_are_spaced_by_order_gap(db_manager):
+    db_manager.add_password_entries_bulk([(f"n{i}", "", "", "", "") for i in range(3)])
+    db_manager.add_password_entry("n3", "", "", "")
+
+    assert [index for _, index in _order(db_manager)] == [0, ORDER_GAP, 2 * ORDER_GAP, 3 * ORDER_GAP]
+
+
+# 列表中只有一筆時沒有相鄰條目，不需要移動也不需要重新編排
+def test_move_without_neighbours_is_noop(db_manager):
+    db_manager.add_password_entry("only", "", "", "")
+
+    assert db_manager.move_entry("only")
+    assert _order(db_manager) == [("only", 0)]
+
+
+def test_move_places_entry_between_neighbours(db_manager):
+    for name in ("a", "b", "c"):
+        db_manager.add_password_entry(name, "", "", "")
+
+    assert db_manager.move_entry("c", prev_name="a", next_name="b")
+    assert [name for name, _ in _order(db_manager)] == ["a", "c", "b"]
+
+
+# 間距用完時不在呼叫端的執行緒重新編排，交給 RebalanceWorker 後再移動
+def test_exhausted_gap_is_left_to_rebalance_worker(db_manager):
+    for name in ("a", "b", "c"):
+        db_manager.add_password_entry(name, "", "", "")
+    db_manager.cursor.execute("UPDATE passwords SET order_index = 1 WHERE name = 'b'")
+    db_manager.conn.commit()
+    before = _order(db_manager)
+
+    assert not db_manager.move_entry("c", prev_name="a", next_name="b")
+    assert _order(db_manager) == before
+
+    results = []
+    worker = RebalanceWorker(db_manager)
+    worker.signals.finished.connect(lambda success, message: results.append(success))
+    worker.run()
+
+    assert results == [True]
+    assert _order(db_manager) == [("a", 0), ("b", ORDER_GAP), ("c", 2 * ORDER_GAP)]
+    assert db_manager.move_entry("c", prev_name="a", next_name="b")
+    assert [name for name, _ in _order(db_manager)] == ["a", "c", "b"]
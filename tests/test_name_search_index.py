@@ -0,0 +1,102 @@
+import pytest
+
+from utils.name_search_index import NameSearchIndex
+
+
+@pytest.fixture
+def index():
+    index = NameSearchIndex()
+    index.build([("Mail-A", 0, "工作"), ("bank", 1, "個人"), ("mail-b", 2, "個人"), ("Ｍａｉｌ-c", 3, "工作")])
+    return index
+
+
+def _count_scans(index, monkeypatch):
+    scans = []
+    scan = index._scan
+    monkeypatch.setattr(index, "_scan", lambda query, category: scans.append(query) or scan(query, category))
+    return scans
+
+
+def test_search_is_normalized_and_keeps_order(index):
+    assert index.search("MAIL") == ["Mail-A", "mail-b", "Ｍａｉｌ-c"]
+    assert index.search("mail", "工作") == ["Mail-A", "Ｍａｉｌ-c"]
+    assert index.search("mail", "全部") == ["Mail-A", "mail-b", "Ｍａｉｌ-c"]
+
+
+# 繼續輸入時只從上一次的結果中篩選，不重新掃描全部名稱
+def test_longer_query_narrows_previous_result(index, monkeypatch):
+    scans = _count_scans(index, monkeypatch)
+
+    assert index.search("ma") == ["Mail-A", "mail-b", "Ｍａｉｌ-c"]
+    assert index.search("mai") == ["Mail-A", "mail-b", "Ｍａｉｌ-c"]
+    assert index.search("mail-b") == ["mail-b"]
+    assert scans == ["ma"]
+
+
+def test_unrelated_query_or_category_scans_again(index, monkeypatch):
+    scans = _count_scans(index, monkeypatch)
+
+    index.search("mail")
+    index.search("bank")
+    index.search("bank", "個人")
+
+    assert scans == ["mail", "bank", "bank"]
+
+
+def test_changes_reset_previous_result(index, monkeypatch):
+    index.search("mail")
+    index.add("mail-d", 4, "工作")
+    scans = _count_scans(index, monkeypatch)
+
+    assert index.search("mail-") == ["Mail-A", "mail-b", "Ｍａｉｌ-c", "mail-d"]
+    assert scans == ["mail-"]
+
+
+def test_rename_and_remove_update_results(index):
+    index.search("mail")
+
+    index.rename("mail-b", "post-b", "個人")
+    assert index.search("mail") == ["Mail-A", "Ｍａｉｌ-c"]
+    assert index.search("post") == ["post-b"]
+
+    index.remove("Mail-A")
+    assert index.search("mail") == ["Ｍａｉｌ-c"]
+
+
+# 不認得的名稱代表索引與資料庫不同步，清除後由 DBManager 重新建立
+def test_unknown_rename_or_move_clears_index(index):
+    index.rename("missing", "other", "")
+    assert not index.is_built()
+
+    index.build([("a", 0, "")])
+    index.move("missing", 5)
+    assert not index.is_built()
+
+
+def test_db_manager_search_follows_rename_and_delete(db_manager):
+    for name in ("mail-a", "mail-b", "bank"):
+        db_manager.add_password_entry(name, "user", "pw", "")
+    assert db_manager.search_names("mail") == ["mail-a", "mail-b"]
+
+    db_manager.update_password_entry("mail-a", "post-a", "user", "pw", "")
+    assert db_manager.search_names("mail") == ["mail-b"]
+    assert db_manager.search_names("post") == ["post-a"]
+
+    db_manager.delete_password_entry("mail-b")
+    assert db_manager.search_names("mail") == []
+
+
+# 其他連線寫入資料庫後（例如背景匯入），下一次搜尋會重新建立索引
+def test_db_manager_rebuilds_after_external_write(db_manager):
+    from Database.db_manager import DBManager
+
+    db_manager.add_password_entry("mail-a", "user", "pw", "")
+    assert db_manager.search_names("mail") == ["mail-a"]
+
+    other = DBManager.from_session(db_manager)
+    try:
+        other.add_password_entry("mail-b", "user", "pw", "")
+    finally:
+        other.close()
+
+    assert db_manager.search_names("mail") == ["mail-a", "mail-b"]
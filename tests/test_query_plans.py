@@ -0,0 +1,50 @@
+import pytest
+
+# (說明, SQL, 參數, 預期使用的索引)
+QUERIES = [
+    ("get_password_entry", "SELECT rowid, name, record FROM passwords WHERE name = ?", ("site-1",),
+     "idx_passwords_name"),
+    ("get_all_names", "SELECT name FROM passwords ORDER BY order_index ASC", (),
+     "idx_passwords_order"),
+    ("get_names_by_category", "SELECT name FROM passwords WHERE category = ? ORDER BY order_index ASC", ("工作",),
+     "idx_passwords_category_order"),
+    ("get_entries_by_category", "SELECT rowid, name, record FROM passwords WHERE category = ? ORDER BY order_index ASC",
+     ("工作",), "idx_passwords_category_order"),
+    ("get_names_page", "SELECT id, name, order_index FROM passwords WHERE (order_index, id) > (?, ?) "
+     "ORDER BY order_index ASC, id ASC LIMIT ?", (1024, 1, 200), "idx_passwords_order"),
+    ("get_names_page 分類", "SELECT id, name, order_index FROM passwords WHERE category = ? "
+     "AND (order_index, id) > (?, ?) ORDER BY order_index ASC, id ASC LIMIT ?", ("工作", 1024, 1, 200),
+     "idx_passwords_category_order"),
+    ("get_order_key", "SELECT order_index, id FROM passwords WHERE name = ?", ("site-1",),
+     "idx_passwords_name"),
+    ("move_entry", "UPDATE passwords SET order_index = ? WHERE name = ?", (1, "site-1"),
+     "idx_passwords_name"),
+    ("move_entry 下一筆", "SELECT MIN(order_index) FROM passwords WHERE order_index > ? AND name != ?",
+     (1024, "site-1"), "idx_passwords_order"),
+    ("move_entry 上一筆", "SELECT MAX(order_index) FROM passwords WHERE order_index < ? AND name != ?",
+     (1024, "site-1"), "idx_passwords_order"),
+    ("delete_password_entry", "DELETE FROM passwords WHERE name = ?", ("site-1",),
+     "idx_passwords_name"),
+]
+
+
+@pytest.fixture(scope="module")
+def vault(tmp_path_factory):
+    from benchmarks.vault_generator import create_vault
+
+    db_manager = create_vault(str(tmp_path_factory.mktemp("plans") / "plans.db"), 0)
+    db_manager.add_password_entries_bulk(
+        (f"site-{i}", "user", "pw", "", "工作" if i % 2 else "個人") for i in range(1000))
+    db_manager.cursor.execute("ANALYZE")
+    yield db_manager
+    db_manager.close()
+
+
+# 常用查詢必須使用索引，且不能另外建立暫存 B-tree 排序
+@pytest.mark.parametrize("label, sql, params, index", QUERIES, ids=[query[0] for query in QUERIES])
+def test_query_uses_index(vault, label, sql, params, index):
+    vault.cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+    plan = " | ".join(row[3] for row in vault.cursor.fetchall())
+
+    assert index in plan, plan
+    assert "TEMP B-TREE" not in plan, plan
@@ -0,0 +1,101 @@
+import json
+
+import pytest
+from PyQt6.QtTest import QTest
+
+from preferences import settings_manager as settings_manager_module
+from preferences.settings_manager import SAVE_DEBOUNCE_MS, SettingsManager
+
+
+@pytest.fixture
+def settings_path(tmp_path, monkeypatch):
+    path = tmp_path / "settings.json"
+    monkeypatch.setenv("PASSWORD_MANAGER_SETTINGS", str(path))
+    return path
+
+
+@pytest.fixture
+def manager(qapp, settings_path):
+    manager = SettingsManager()
+    manager.writes = []
+    write = manager._write_settings
+    manager._write_settings = lambda settings: manager.writes.append(dict(settings)) or write(settings)
+    return manager
+
+
+def _read(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_missing_file_is_created_with_defaults(qapp, settings_path):
+    manager = SettingsManager()
+
+    assert _read(settings_path) == manager.settings
+
+
+# 連續變更只在停頓後寫入一次
+def test_changes_are_debounced_into_one_write(manager, settings_path):
+    manager.set_setting("theme", "Dark Blue")
+    manager.set_setting("auto_logout_timeout", 10)
+
+    assert manager.writes == []
+    assert manager._save_timer.isActive()
+
+    QTest.qWait(SAVE_DEBOUNCE_MS + 200)
+
+    assert len(manager.writes) == 1
+    assert _read(settings_path)["theme"] == "Dark Blue"
+    assert _read(settings_path)["auto_logout_timeout"] == 10
+
+
+def test_flush_writes_pending_changes_immediately(manager, settings_path):
+    manager.set_setting("theme", "Dark Blue")
+
+    assert manager.flush()
+
+    assert len(manager.writes) == 1
+    assert not manager._save_timer.isActive()
+    assert _read(settings_path)["theme"] == "Dark Blue"
+    # 沒有變更時不再寫入
+    assert manager.flush()
+    assert len(manager.writes) == 1
+
+
+def test_unchanged_value_does_not_schedule_write(manager):
+    manager.set_setting("theme", manager.get_setting("theme"))
+
+    assert not manager._save_timer.isActive()
+    assert manager.flush()
+    assert manager.writes == []
+
+
+# 沒有 Qt 事件迴圈時（例如命令列腳本）無法延遲，改為立即寫入
+def test_without_qt_application_saves_immediately(settings_path, monkeypatch):
+    class NoApplication:
+        @staticmethod
+        def instance():
+            return None
+
+    monkeypatch.setattr(settings_manager_module, "QCoreApplication", NoApplication)
+    manager = SettingsManager()
+
+    manager.set_setting("theme", "Dark Blue")
+
+    assert _read(settings_path)["theme"] == "Dark Blue"
+
+
+# 寫入失敗時保留原本的設定檔，不留下暫存檔，變更仍待寫入
+def test_failed_write_keeps_previous_file(manager, settings_path):
+    manager.set_setting("theme", "Dark Blue")
+    manager.flush()
+    before = settings_path.read_text(encoding="utf-8")
+
+    manager.set_setting("theme", object())
+
+    assert not manager.flush()
+    assert settings_path.read_text(encoding="utf-8") == before
+    assert list(settings_path.parent.iterdir()) == [settings_path]
+
+    manager.set_setting("theme", "Light Blue")
+    assert manager.flush()
+    assert _read(settings_path)["theme"] == "Light Blue"
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+from PyQt6.QtWidgets import QWidget
+
+from system.system_theme_detector import get_system_theme_watcher
+
+
+@pytest.fixture
+def settings_manager(qapp, tmp_path, monkeypatch):
+    from preferences.settings_manager import SettingsManager
+
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps({"theme": "System", "last_system_theme": "Dark Blue"}), encoding="utf-8")
+    monkeypatch.setenv("PASSWORD_MANAGER_SETTINGS", str(path))
+
+    # 不在測試中啟動背景偵測，並在測試後還原共用監看器的狀態
+    watcher = get_system_theme_watcher()
+    monkeypatch.setattr(watcher, "current_theme", "Light Blue")
+    monkeypatch.setattr(watcher, "start", lambda: None)
+    yield SettingsManager()
+    watcher.theme_changed.disconnect()
+
+
+# 與 PasswordManager 啟動順序相同：先以上次的系統主題啟動監看，再第一次套用主題
+def test_first_apply_uses_last_system_theme(settings_manager, monkeypatch):
+    applied = []
+    monkeypatch.setattr(settings_manager.theme_settings.stylesheet_cache, "apply",
+                        lambda widget, theme_file: applied.append(theme_file))
+    widget = QWidget()
+
+    watcher = settings_manager.start_system_theme_watcher(widget)
+    settings_manager.apply_theme(widget)
+
+    assert watcher.current_theme == "Dark Blue"
+    assert applied == ["dark_blue.xml"]
+
+
+def test_system_theme_change_is_saved_and_applied(settings_manager, monkeypatch):
+    applied = []
+    monkeypatch.setattr(settings_manager.theme_settings.stylesheet_cache, "apply",
+                        lambda widget, theme_file: applied.append(theme_file))
+    changed = []
+    watcher = settings_manager.start_system_theme_watcher(QWidget(), on_changed=lambda: changed.append(True))
+
+    watcher._on_detected("Light Blue")
+    settings_manager.flush()
+
+    assert applied == ["light_blue.xml"]
+    assert changed == [True]
+    assert settings_manager.settings['last_system_theme'] == "Light Blue"
@@ -0,0 +1,68 @@
+import os
+
+import pytest
+
+from Database.db_manager import DBManager, EntryDecryptError, VaultKeyError
+from utils.password_encryption import create_cipher, encrypt_with_cipher, hash_password
+from tests.conftest import MASTER_PASSWORD
+
+
+def _add_legacy_row(manager, name, fields, cipher):
+    manager.cursor.execute("INSERT INTO passwords (name, account, password, notes, order_index) VALUES (?, ?, ?, ?, ?)",
+                           (name, *(encrypt_with_cipher(field, cipher) for field in fields), len(name)))
+    manager.conn.commit()
+
+
+def test_migration_keeps_rows_that_do_not_decrypt(db_path):
+    manager = DBManager()
+    salt = os.urandom(16)
+    manager.set_master_password(hash_password(MASTER_PASSWORD), salt)
+    _add_legacy_row(manager, "a", ("user", "secret", ""), create_cipher(MASTER_PASSWORD, salt))
+    # 模擬重設密碼中斷：仍以舊 salt 加密的條目
+    _add_legacy_row(manager, "b", ("old-user", "old-secret", "x"), create_cipher(MASTER_PASSWORD, os.urandom(16)))
+    manager.cursor.execute("SELECT account, password, notes FROM passwords WHERE name = 'b'")
+    legacy_b = manager.cursor.fetchone()
+
+    manager.set_current_master_password(MASTER_PASSWORD)
+
+    assert manager.get_wrapped_vault_key()
+    assert manager.get_password_entry("a") == ("user", "secret", "", None)
+    manager.cursor.execute("SELECT record, account, password, notes FROM passwords WHERE name = 'b'")
+    record, *legacy_fields = manager.cursor.fetchone()
+    assert record is None
+    assert tuple(legacy_fields) == legacy_b
+    manager.close()
+
+
+def test_unmigrated_row_reports_decrypt_error(db_path):
+    manager = DBManager()
+    manager.set_master_password(hash_password(MASTER_PASSWORD), os.urandom(16))
+    _add_legacy_row(manager, "b", ("old-user", "old-secret", "x"), create_cipher(MASTER_PASSWORD, os.urandom(16)))
+    manager.set_current_master_password(MASTER_PASSWORD)
+
+    with pytest.raises(EntryDecryptError):
+        manager.get_password_entry("b")
+    manager.close()
+
+
+def test_unwrap_failure_refuses_session(db_manager):
+    db_manager.cursor.execute("UPDATE master_password SET wrapped_key = 'corrupted'")
+    db_manager.conn.commit()
+
+    with pytest.raises(VaultKeyError):
+        db_manager.set_current_master_password(MASTER_PASSWORD)
+    assert db_manager._vault_key is None
+    assert db_manager.master_password is None
+
+
+def test_writes_without_vault_key_never_store_plaintext(db_manager):
+    db_manager.clear_session()
+
+    with pytest.raises(VaultKeyError):
+        db_manager.add_password_entry("a", "user", "secret", "")
+    with pytest.raises(VaultKeyError):
+        db_manager.add_password_entries_bulk([("b", "user", "secret", "", None)])
+    with pytest.raises(VaultKeyError):
+        db_manager.get_all_entries()
+    db_manager.cursor.execute("SELECT COUNT(*) FROM passwords")
+    assert db_manager.cursor.fetchone()[0] == 0
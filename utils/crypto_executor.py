@@ -0,0 +1,76 @@
+import os
+import concurrent.futures
+from utils.password_encryption import create_vault_cipher, encrypt_entry, decrypt_entry
+
+EXECUTOR_KINDS = ("thread", "process")
+
+# 子任務在工作執行緒/行程中執行，只接收可序列化的資料金鑰與字串
+def _decrypt_chunk(vault_key, tokens):
+    cipher = create_vault_cipher(vault_key)
+    results = []
+    for token in tokens:
+        try:
+            results.append(decrypt_entry(token, cipher))
+        except Exception:
+            results.append(None)
+    return results
+
+def _encrypt_chunk(vault_key, fields_list):
+    cipher = create_vault_cipher(vault_key)
+    return [encrypt_entry(account, password, notes, cipher) for account, password, notes in fields_list]
+
+
+# 整個金庫的加解密引擎：大量資料分段交給執行緒池（預設）或行程池，結果維持原本順序
+class CryptoExecutor:
+    def __init__(self, kind="thread", max_workers=None, chunk_size=256):
+        if kind not in EXECUTOR_KINDS:
+            kind = "thread"
+        self.kind = kind
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+        self._executor = None
+
+    # 由環境變數決定執行方式與工作數量
+    @classmethod
+    def from_env(cls):
+        kind = os.getenv("PASSWORD_MANAGER_CRYPTO_EXECUTOR", "thread")
+        try:
+            max_workers = int(os.getenv("PASSWORD_MANAGER_CRYPTO_WORKERS", "0")) or None
+        except ValueError:
+            max_workers = None
+        return cls(kind, max_workers)
+
+    # 解密失敗的項目回傳 None
+    def decrypt_entries(self, vault_key, tokens):
+        return self._run(_decrypt_chunk, vault_key, list(tokens))
+
+    def encrypt_entries(self, vault_key, fields_list):
+        return self._run(_encrypt_chunk, vault_key, list(fields_list))
+
+    def _run(self, func, vault_key, items):
+        # 資料量小或只有一個工作者時直接執行，省去排程成本
+        if len(items) <= self.chunk_size or self.max_workers <= 1:
+            return func(vault_key, items)
+
+        chunks = [items[i:i + self.chunk_size] for i in range(0, len(items), self.chunk_size)]
+        executor = self._get_executor()
+        results = []
+        # map 依提交順序回傳，確保結果與 order_index 排序一致
+        for chunk_result in executor.map(func, [vault_key] * len(chunks), chunks):
+            results.extend(chunk_result)
+        return results
+
+    def _get_executor(self):
+        if self._executor is None:
+            # concurrent.futures 在取用屬性時才載入對應模組，行程池會連帶載入 multiprocessing
+            if self.kind == "process":
+                executor_class = concurrent.futures.ProcessPoolExecutor
+            else:
+                executor_class = concurrent.futures.ThreadPoolExecutor
+            self._executor = executor_class(max_workers=self.max_workers)
+        return self._executor
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
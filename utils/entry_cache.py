@@ -0,0 +1,123 @@
+import os
+import time
+from collections import OrderedDict
+
+from utils.instrumentation import increment
+
+
+def _entry_size(name, value):
+    return len(name.encode("utf-8")) + sum(len(str(field).encode("utf-8")) for field in value if field)
+
+
+# 已解密條目的快取：以條目 id 為鍵，依最近使用順序淘汰，同時限制筆數、位元組數與閒置時間
+# 內容為明文，登出時必須 clear()
+class EntryCache:
+    def __init__(self, max_entries=256, max_bytes=256 * 1024, ttl=300):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()  # id -> (name, value, size, last_access)
+        self._ids_by_name = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # 由環境變數調整上限，0 表示停用快取
+    @classmethod
+    def from_env(cls):
+        def read_int(key, default):
+            try:
+                return int(os.getenv(key, default))
+            except ValueError:
+                return default
+        return cls(read_int("PASSWORD_MANAGER_ENTRY_CACHE_SIZE", 256),
+                   read_int("PASSWORD_MANAGER_ENTRY_CACHE_BYTES", 256 * 1024),
+                   read_int("PASSWORD_MANAGER_ENTRY_CACHE_TTL", 300))
+
+    def get(self, name):
+        entry_id = self._ids_by_name.get(name)
+        if entry_id is None:
+            self.misses += 1
+            increment("entry_cache.misses")
+            return None
+
+        cached_name, value, size, last_access = self._entries[entry_id]
+        now = time.monotonic()
+        if now - last_access > self.ttl:
+            self._remove(entry_id)
+            self.expirations += 1
+            self.misses += 1
+            increment("entry_cache.misses")
+            return None
+
+        self._entries[entry_id] = (cached_name, value, size, now)
+        self._entries.move_to_end(entry_id)
+        self.hits += 1
+        increment("entry_cache.hits")
+        return value
+
+    # 只檢查是否已快取且未過期，不計入命中次數
+    def contains(self, name):
+        entry_id = self._ids_by_name.get(name)
+        if entry_id is None:
+            return False
+        return time.monotonic() - self._entries[entry_id][3] <= self.ttl
+
+    def put(self, entry_id, name, value):
+        if self.max_entries <= 0:
+            return
+        size = _entry_size(name, value)
+        if size > self.max_bytes:
+            return
+
+        self._remove(entry_id)
+        self.invalidate(name)
+        self._entries[entry_id] = (name, value, size, time.monotonic())
+        self._ids_by_name[name] = entry_id
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    # 條目更新或刪除時呼叫，避免回傳舊內容
+    def invalidate(self, name):
+        entry_id = self._ids_by_name.get(name)
+        if entry_id is not None:
+            self._remove(entry_id)
+
+    # 移除所有已閒置超過 ttl 的條目
+    def purge_expired(self):
+        deadline = time.monotonic() - self.ttl
+        expired = [entry_id for entry_id, entry in self._entries.items() if entry[3] < deadline]
+        for entry_id in expired:
+            self._remove(entry_id)
+        self.expirations += len(expired)
+
+    def clear(self):
+        self._entries.clear()
+        self._ids_by_name.clear()
+        self._bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+        }
+
+    def _remove(self, entry_id):
+        entry = self._entries.pop(entry_id, None)
+        if entry is None:
+            return
+        name, _, size, _ = entry
+        if self._ids_by_name.get(name) == entry_id:
+            del self._ids_by_name[name]
+        self._bytes -= size
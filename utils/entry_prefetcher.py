@@ -0,0 +1,101 @@
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from utils.password_encryption import create_vault_cipher, decrypt_entry
+from utils.instrumentation import increment
+
+
+class PrefetchWorkerSignals(QObject):
+    finished = pyqtSignal(int, int, list)  # 排程編號, 條目版本, [(id, name, (account, password, notes, category)), ...]
+
+
+# 只負責解密：密文已在主執行緒讀出，背景執行緒不碰資料庫連線
+class PrefetchWorker(QRunnable):
+    def __init__(self, generation, vault_key, entry_version, rows):
+        super().__init__()
+        self.generation = generation
+        self.vault_key = vault_key
+        self.entry_version = entry_version
+        self.rows = rows
+        self.signals = PrefetchWorkerSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        cipher = create_vault_cipher(self.vault_key)
+        entries = []
+        for entry_id, name, record, category in self.rows:
+            if self._cancelled:
+                return
+            try:
+                account, password, notes = decrypt_entry(record, cipher)
+            except Exception:
+                continue
+            entries.append((entry_id, name, (account, password, notes, category)))
+        increment("prefetch.entries_decrypted", len(entries))
+        if not self._cancelled:
+            self.signals.finished.emit(self.generation, self.entry_version, entries)
+
+
+# 選取或滑過列表項目時，在背景預先解密該條目與相鄰條目，開啟查看對話框時即可直接命中快取
+# 新的排程會取消尚未完成的舊排程
+class EntryPrefetcher(QObject):
+    def __init__(self, db_manager, thread_pool, neighbours=1, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.thread_pool = thread_pool
+        self.neighbours = neighbours
+        self._generation = 0
+        self._worker = None
+        self.scheduled = 0
+        self.cancelled = 0
+        self.prefetched = 0
+        self.opens = 0
+        self.open_hits = 0
+
+    # 預先解密列表中第 row 列與前後各 neighbours 列
+    def schedule_around(self, model, row):
+        self.schedule([model.name_at(i) for i in range(row - self.neighbours, row + self.neighbours + 1)])
+
+    def schedule(self, names):
+        self.cancel()
+        job = self.db_manager.get_prefetch_job(names)
+        if job is None:
+            return
+
+        vault_key, entry_version, rows = job
+        self._generation += 1
+        self._worker = PrefetchWorker(self._generation, vault_key, entry_version, rows)
+        self._worker.signals.finished.connect(self._on_finished)
+        self.scheduled += 1
+        self.thread_pool.start(self._worker)
+
+    def cancel(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+            self.cancelled += 1
+        self._generation += 1
+
+    # 開啟條目前呼叫，統計預先解密的命中率
+    def record_open(self, name):
+        self.opens += 1
+        if self.db_manager.entry_cache.contains(name):
+            self.open_hits += 1
+
+    def stats(self):
+        return {
+            'scheduled': self.scheduled,
+            'cancelled': self.cancelled,
+            'prefetched': self.prefetched,
+            'opens': self.opens,
+            'open_hits': self.open_hits,
+            'hit_rate': self.open_hits / self.opens if self.opens else 0,
+        }
+
+    def _on_finished(self, generation, entry_version, entries):
+        if generation != self._generation:
+            return
+        self._worker = None
+        self.prefetched += self.db_manager.cache_prefetched_entries(entry_version, entries)
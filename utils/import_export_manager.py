@@ -1,13 +1,32 @@
-import pandas as pd
-from PyQt6.QtWidgets import QFileDialog, QMessageBox
+import csv
+import os
+import tempfile
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtWidgets import QFileDialog, QMessageBox, QProgressDialog
+
+from utils.import_worker import ImportWorker
+
+EXPORT_COLUMNS = ['名稱', '帳號', '密碼', '備註', '類別']
 
 class ImportExportManager:
-    def __init__(self, parent, db_manager, settings_manager):
+    # 正在匯入的管理器；匯入工作持有自己的資料庫連線與資料金鑰，登出時必須全部取消
+    _active = set()
+
+    def __init__(self, parent, db_manager, settings_manager, thread_pool=None):
         self.parent = parent
         self.db_manager = db_manager
         self.settings_manager = settings_manager
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self.import_worker = None
+        self.progress_dialog = None
+        self.on_entries_changed = None
         
-    def import_from_file(self):
+    # 匯入在背景執行緒進行，on_entries_changed 會在每批資料提交後及結束時呼叫
+    def import_from_file(self, on_entries_changed=None):
+        if self.import_worker is not None:
+            QMessageBox.information(self.parent, "訊息", "匯入正在進行中")
+            return
+
         file_path, _ = QFileDialog.getOpenFileName(
             self.parent, "選擇檔案", "", 
             "Excel Files CSV Files (*.csv);;(*.xlsx *.xls);;All Files (*)"
@@ -16,100 +35,133 @@ class ImportExportManager:
         if not file_path:
             return
 
-        try:
-            # 讀取檔案
-            if file_path.endswith('.csv'):
-                df = pd.read_csv(file_path, encoding='utf-8-sig')
-            else:
-                df = pd.read_excel(file_path)
+        # 由使用者決定失敗時全部回復或保留已完成的部分
+        atomic = self._ask_import_mode()
+        self.on_entries_changed = on_entries_changed
+
+        worker = ImportWorker(file_path, self.db_manager, atomic=atomic)
+        worker.signals.categories_found.connect(self._add_new_categories)
+        worker.signals.progress.connect(self._update_import_progress)
+        worker.signals.batch_committed.connect(self._notify_entries_changed)
+        worker.signals.finished.connect(self._on_import_finished)
+        worker.signals.failed.connect(self._on_import_failed)
+
+        self.progress_dialog = QProgressDialog("正在讀取檔案...", "取消", 0, 0, self.parent)
+        self.progress_dialog.setWindowTitle("匯入")
+        self.progress_dialog.setMinimumDuration(0)
+        self.progress_dialog.canceled.connect(worker.cancel)
+        self.progress_dialog.show()
+
+        self.import_worker = worker
+        ImportExportManager._active.add(self)
+        self.thread_pool.start(worker)
+
+    # 登出或自動登出時呼叫，在清除工作階段前取消所有匯入
+    @staticmethod
+    def cancel_all_imports():
+        for manager in list(ImportExportManager._active):
+            manager.cancel_import()
+
+    # 取消匯入並等待背景工作結束，之後不會再寫入資料庫，也不會再更新已關閉的列表
+    def cancel_import(self):
+        worker = self.import_worker
+        if worker is None:
+            return
+        worker.cancel()
+        self._finish_import()
+        # 尚未開始執行的工作直接從佇列移除；已開始的會在下一段寫入前停止
+        if not self.thread_pool.tryTake(worker):
+            worker.wait()
+
+    # 自動新增分類
+    def _add_new_categories(self, new_categories):
+        if self.import_worker is None:
+            return
+        # 取得現有分類
+        existing_categories = self.settings_manager.get_categories()
+
+        # 找出需要新增的分類
+        categories_to_add = [
+            cat for cat in dict.fromkeys(new_categories)
+            if cat not in existing_categories and cat and cat != "全部"
+        ]
+
+        # 如果有新分類，則更新設定
+        if categories_to_add:
+            updated_categories = existing_categories + categories_to_add
+            self.settings_manager.set_categories(updated_categories)
+            print(f"已自動新增分類：{', '.join(categories_to_add)}")
+            if hasattr(self.parent, 'reload_categories'):
+                self.parent.reload_categories()
+
+    def _update_import_progress(self, processed, total, eta):
+        if not self.progress_dialog:
+            return
+        self.progress_dialog.setMaximum(total)
+        self.progress_dialog.setValue(processed)
+        self.progress_dialog.setLabelText(f"已匯入 {processed} / {total} 項，預估剩餘 {eta:.0f} 秒")
 
-            # 檢查必要欄位
-            required_columns = ['名稱', '帳號', '密碼']
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            
-            if missing_columns:
-                QMessageBox.warning(self.parent, "匯入錯誤", 
-                                    f"檔案缺少必要欄位：{', '.join(missing_columns)}\n"
-                                    f"請確保檔案包含以下欄位：{', '.join(required_columns)}")
-                return
-
-            # 如果沒有備註或類別欄位，添加空的欄位
-            if '備註' not in df.columns:
-                df['備註'] = ''
-
-            if '類別' not in df.columns:
-                df['類別'] = ''
-            
-            # 自動新增分類
-            if '類別' in df.columns:
-                # 取得現有分類
-                existing_categories = self.settings_manager.get_categories()
-                
-                # 取得匯入檔案中的分類，並過濾空值
-                new_categories = df['類別'].dropna().unique()
-                
-                # 找出需要新增的分類
-                categories_to_add = [
-                    cat for cat in new_categories 
-                    if cat not in existing_categories and cat and cat != "全部"
-                ]
-                
-                # 如果有新分類，則更新設定
-                if categories_to_add:
-                    updated_categories = existing_categories + categories_to_add
-                    self.settings_manager.set_categories(updated_categories)
-                    print(f"已自動新增分類：{', '.join(categories_to_add)}")
-                    if hasattr(self.parent, 'reload_categories'):
-                        self.parent.reload_categories()
-
-            # 獲取現有資料以避免重複
-            existing_entries = self.db_manager.get_all_entries()
-            existing_set = {(entry[0], entry[1], entry[2]) for entry in existing_entries}
-
-            # 初始化計數器
-            success_count = 0
-            duplicate_count = 0
-            fail_count = 0
-
-            # 處理每一行資料
-            for _, row in df.iterrows():
-                name = str(row['名稱']).strip()
-                account = str(row['帳號']).strip()
-                password = str(row['密碼']).strip()
-                notes = str(row['備註']) if not pd.isna(row['備註']) else ''
-                category = str(row['類別']) if not pd.isna(row['類別']) else ''
-
-                # 檢查名稱是否為空
-                if not name:
-                    fail_count += 1
-                    continue
-
-                # 檢查是否重複
-                if (name, account, password) in existing_set:
-                    duplicate_count += 1
-                    continue
-
-                # 嘗試添加資料
-                try:
-                    self.db_manager.add_password_entry(name, account, password, notes, category)
-                    success_count += 1
-                    existing_set.add((name, account, password))
-                except Exception:
-                    fail_count += 1
-
-            # 顯示匯入結果
-            self._show_import_result(success_count, duplicate_count, fail_count)
-        
-        except Exception as e:
-            QMessageBox.critical(self.parent, "匯入錯誤", f"檔案匯入過程中發生錯誤：\n{str(e)}")
+    def _notify_entries_changed(self):
+        if self.import_worker is None:
+            return
+        if self.on_entries_changed:
+            self.on_entries_changed()
+
+    def _finish_import(self):
+        self.import_worker = None
+        ImportExportManager._active.discard(self)
+        if self.progress_dialog:
+            self.progress_dialog.canceled.disconnect()
+            self.progress_dialog.close()
+            self.progress_dialog = None
+
+    # 匯入已取消（例如登出）時，背景工作仍可能送出已排入佇列的訊號，一律忽略
+    def _on_import_finished(self, summary):
+        if self.import_worker is None:
+            return
+        self._notify_entries_changed()
+        self._finish_import()
+        self._show_import_result(summary['success'], summary['duplicate'], summary['fail'],
+                                 summary['rows_per_second'], summary['skipped'] if summary['cancelled'] else None,
+                                 summary['errors'])
+
+    def _on_import_failed(self, title, message):
+        if self.import_worker is None:
+            return
+        self._finish_import()
+        QMessageBox.warning(self.parent, title, message)
+
+    # 詢問匯入中途失敗時的處理方式
+    def _ask_import_mode(self):
+        reply = QMessageBox(self.parent)
+        reply.setWindowTitle("匯入方式")
+        reply.setText("匯入中途發生錯誤時要如何處理？")
+        reply.setIcon(QMessageBox.Icon.Question)
+
+        atomic_button = reply.addButton("全部回復", QMessageBox.ButtonRole.YesRole)
+        reply.addButton("保留已完成部分", QMessageBox.ButtonRole.NoRole)
+        reply.setDefaultButton(atomic_button)
+
+        reply.exec()
+        return reply.clickedButton() == atomic_button
 
     # 顯示匯入結果
-    def _show_import_result(self, success_count, duplicate_count, fail_count):
+    def _show_import_result(self, success_count, duplicate_count, fail_count, rows_per_second=0, skipped_count=None,
+                            errors=None):
         message = f"匯入結果：\n成功添加：{success_count} 項\n"
+        if skipped_count is not None:
+            message += f"已取消，未匯入：{skipped_count} 項\n"
         if duplicate_count > 0:
             message += f"已跳過（重複項目）：{duplicate_count} 項\n"
         if fail_count > 0:
             message += f"匯入失敗：{fail_count} 項\n"
+        if success_count > 0:
+            message += f"寫入速度：{rows_per_second:.0f} 項/秒\n"
+        if errors:
+            # 只列出前幾段的錯誤，避免訊息框過長
+            message += "\n錯誤：\n" + "\n".join(errors[:5])
+            if len(errors) > 5:
+                message += f"\n……另有 {len(errors) - 5} 段失敗"
 
         QMessageBox.information(self.parent, "匯入完成", message)
         
@@ -119,6 +171,13 @@ class ImportExportManager:
 
     # 匯出資料為Excel檔案
     def export_to_csv(self):
+        self._export_entries()
+
+    def export_filtered_data(self, filter_category=None):
+        self._export_entries(filter_category)
+
+    # 串流匯出：逐段解密並寫入檔案，不會一次把整個金庫載入記憶體
+    def _export_entries(self, filter_category=None):
         file_path, _ = QFileDialog.getSaveFileName(
             self.parent, "儲存檔案", "密碼儲存簿", 
             "Excel Files CSV Files (*.csv);;(*.xlsx);;All Files (*)"
@@ -128,50 +187,52 @@ class ImportExportManager:
             return
             
         try:
-            # 獲取所有資料
-            entries = self.db_manager.get_all_entries()
-            df = pd.DataFrame(entries, columns=['名稱', '帳號', '密碼', '備註', '類別'])
-            
+            # 根據篩選條件逐段取得資料
+            category = filter_category if filter_category and filter_category != "全部" else None
+            entries = self.db_manager.iter_entries(category)
+
             # 根據檔案擴展名決定匯出格式
             if file_path.endswith('.csv'):
-                df.to_csv(file_path, index=False, encoding='utf-8-sig')
+                self._write_atomically(file_path, self._write_csv, entries)
             else:
                 if not file_path.endswith('.xlsx'):
                     file_path += '.xlsx'
-                df.to_excel(file_path, index=False)
+                self._write_atomically(file_path, self._write_xlsx, entries)
 
             QMessageBox.information(self.parent, "訊息", f"資料成功匯出至 {file_path}")
             
         except Exception as e:
             QMessageBox.critical(self.parent, "匯出錯誤", f"檔案匯出過程中發生錯誤：\n{str(e)}")
 
-    def export_filtered_data(self, filter_category=None):
-        file_path, _ = QFileDialog.getSaveFileName(
-            self.parent, "儲存檔案", "密碼儲存簿", 
-            "Excel Files CSV Files (*.csv);;(*.xlsx);;All Files (*)"
-        )
-
-        if not file_path:
-            return
-            
+    # 先寫到同一目錄的暫存檔，全部寫完才取代目標檔案；中途失敗（例如條目無法解密）時刪除暫存檔，
+    # 不會在使用者選擇的位置留下只寫了一半的明文檔案
+    def _write_atomically(self, file_path, write, entries):
+        directory, file_name = os.path.split(os.path.abspath(file_path))
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{file_name}.", suffix=".tmp", dir=directory)
+        os.close(fd)
         try:
-            # 根據篩選條件獲取資料
-            if filter_category and filter_category != "全部":
-                entries = self.db_manager.get_entries_by_category(filter_category)
-            else:
-                entries = self.db_manager.get_all_entries()
-                
-            df = pd.DataFrame(entries, columns=['名稱', '帳號', '密碼', '備註', '類別'])
-            
-            # 根據檔案擴展名決定匯出格式
-            if file_path.endswith('.csv'):
-                df.to_csv(file_path, index=False, encoding='utf-8-sig')
-            else:
-                if not file_path.endswith('.xlsx'):
-                    file_path += '.xlsx'
-                df.to_excel(file_path, index=False)
-
-            QMessageBox.information(self.parent, "訊息", f"資料成功匯出至 {file_path}")
-            
-        except Exception as e:
-            QMessageBox.critical(self.parent, "匯出錯誤", f"檔案匯出過程中發生錯誤：\n{str(e)}")
\ No newline at end of file
+            write(tmp_path, entries)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _write_csv(self, file_path, entries):
+        with open(file_path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_COLUMNS)
+            for entry in entries:
+                writer.writerow(entry)
+
+    def _write_xlsx(self, file_path, entries):
+        # openpyxl 只在匯出 Excel 時才載入；write_only 模式逐列寫出，不在記憶體中保留整份工作表
+        from openpyxl import Workbook
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append(EXPORT_COLUMNS)
+        for entry in entries:
+            sheet.append(list(entry))
+        workbook.save(file_path)
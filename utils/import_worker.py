@@ -0,0 +1,155 @@
+import threading
+import time
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from Database.db_manager import DBManager
+
+REQUIRED_COLUMNS = ['名稱', '帳號', '密碼']
+
+class ImportWorkerSignals(QObject):
+    categories_found = pyqtSignal(list)
+    progress = pyqtSignal(int, int, float)  # 已處理筆數, 總筆數, 預估剩餘秒數
+    batch_committed = pyqtSignal()
+    finished = pyqtSignal(dict)
+    failed = pyqtSignal(str, str)  # 標題, 訊息
+
+
+# 在 QThreadPool 中執行匯入：讀檔、去除重複並分段寫入，過程中可取消
+class ImportWorker(QRunnable):
+    def __init__(self, file_path, db_manager, atomic=True, chunk_size=500):
+        super().__init__()
+        self.file_path = file_path
+        self.db_manager = db_manager
+        self.atomic = atomic
+        self.chunk_size = chunk_size
+        self.signals = ImportWorkerSignals()
+        self._cancelled = False
+        self._done = threading.Event()
+
+    def cancel(self):
+        self._cancelled = True
+
+    # 等待 run() 結束（登出時使用），逾時回傳 False
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        try:
+            self._run()
+        finally:
+            self._done.set()
+
+    def _run(self):
+        try:
+            df = self._read_file()
+        except Exception as e:
+            self.signals.failed.emit("匯入錯誤", f"檔案匯入過程中發生錯誤：\n{str(e)}")
+            return
+
+        # 檢查必要欄位
+        missing_columns = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+        if missing_columns:
+            self.signals.failed.emit("匯入錯誤",
+                                     f"檔案缺少必要欄位：{', '.join(missing_columns)}\n"
+                                     f"請確保檔案包含以下欄位：{', '.join(REQUIRED_COLUMNS)}")
+            return
+
+        # 如果沒有備註或類別欄位，添加空的欄位
+        if '備註' not in df.columns:
+            df['備註'] = ''
+        if '類別' not in df.columns:
+            df['類別'] = ''
+
+        # 分類設定需在主執行緒更新
+        self.signals.categories_found.emit([str(cat) for cat in df['類別'].dropna().unique()])
+
+        # 背景執行緒使用自己的資料庫連線
+        db_manager = DBManager.from_session(self.db_manager)
+        try:
+            self.signals.finished.emit(self._import_rows(db_manager, df))
+        except Exception as e:
+            self.signals.failed.emit("匯入錯誤", f"檔案匯入過程中發生錯誤：\n{str(e)}")
+        finally:
+            db_manager.clear_session()
+            db_manager.close()
+
+    # pandas 匯入需要數百毫秒，只在實際匯入時才載入
+    def _read_file(self):
+        import pandas as pd
+        if self.file_path.endswith('.csv'):
+            return pd.read_csv(self.file_path, encoding='utf-8-sig')
+        return pd.read_excel(self.file_path)
+
+    def _import_rows(self, db_manager, df):
+        import pandas as pd
+        # 獲取現有資料以避免重複
+        existing_entries = db_manager.get_all_entries()
+        existing_set = {(entry[0], entry[1], entry[2]) for entry in existing_entries}
+        existing_names = {entry[0] for entry in existing_entries}
+
+        duplicate_count = 0
+        fail_count = 0
+        new_entries = []
+
+        for _, row in df.iterrows():
+            name = str(row['名稱']).strip()
+            account = str(row['帳號']).strip()
+            password = str(row['密碼']).strip()
+            notes = str(row['備註']) if not pd.isna(row['備註']) else ''
+            category = str(row['類別']) if not pd.isna(row['類別']) else ''
+
+            # 檢查名稱是否為空
+            if not name:
+                fail_count += 1
+                continue
+
+            # 檢查是否重複
+            if (name, account, password) in existing_set:
+                duplicate_count += 1
+                continue
+
+            # 名稱相同但內容不同，名稱必須唯一因此無法匯入
+            if name in existing_names:
+                fail_count += 1
+                continue
+
+            new_entries.append((name, account, password, notes, category))
+            existing_set.add((name, account, password))
+            existing_names.add(name)
+
+        total = len(new_entries)
+        start = time.perf_counter()
+
+        def on_progress(processed, committed):
+            elapsed = time.perf_counter() - start
+            rate = processed / elapsed if elapsed > 0 else 0
+            eta = (total - processed) / rate if rate > 0 else 0
+            self.signals.progress.emit(processed, total, eta)
+            if committed:
+                self.signals.batch_committed.emit()
+
+        # 保留已完成部分時，失敗的段落會被略過，錯誤訊息隨結果回報
+        errors = []
+        success_count = 0
+        if new_entries:
+            success_count = db_manager.add_password_entries_bulk(
+                new_entries, chunk_size=self.chunk_size, atomic=self.atomic,
+                progress_callback=on_progress, should_cancel=self.is_cancelled, errors=errors)
+        elapsed = time.perf_counter() - start
+
+        cancelled = self._cancelled and success_count < total
+        if not cancelled:
+            fail_count += total - success_count
+
+        return {
+            'success': success_count,
+            'duplicate': duplicate_count,
+            'fail': fail_count,
+            'skipped': total - success_count if cancelled else 0,
+            'cancelled': cancelled,
+            'rows_per_second': success_count / elapsed if elapsed > 0 else 0,
+            'errors': errors,
+        }
@@ -0,0 +1,145 @@
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+# 設定 PASSWORD_MANAGER_DIAGNOSTICS=1 後啟動才會收集資料；未啟用時裝飾器直接回傳原函式，不增加任何成本
+ENABLED = os.getenv("PASSWORD_MANAGER_DIAGNOSTICS", "") not in ("", "0")
+
+# 直方圖以 2 的次方微秒分桶：第 i 桶為 [2^(i-1), 2^i) 微秒，最後一桶收集更慢的呼叫
+BUCKET_COUNT = 24
+
+_lock = threading.Lock()
+_timers = {}  # name -> [count, total_us, min_us, max_us, buckets]
+_counters = {}
+_sources = {}
+
+
+def _record(name, elapsed_us):
+    bucket = min(int(elapsed_us).bit_length(), BUCKET_COUNT - 1)
+    with _lock:
+        timer = _timers.get(name)
+        if timer is None:
+            timer = _timers[name] = [0, 0.0, elapsed_us, elapsed_us, [0] * BUCKET_COUNT]
+        timer[0] += 1
+        timer[1] += elapsed_us
+        timer[2] = min(timer[2], elapsed_us)
+        timer[3] = max(timer[3], elapsed_us)
+        timer[4][bucket] += 1
+
+
+# 裝飾器：記錄呼叫次數與耗時分布
+def timed(name):
+    def decorator(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(name, (time.perf_counter() - start) * 1_000_000)
+        return wrapper
+    return decorator
+
+
+# 為類別所有公開的一般方法加上計時，名稱為 prefix.方法名稱
+def instrument_methods(cls, prefix):
+    if not ENABLED:
+        return cls
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not callable(value) or isinstance(value, (staticmethod, classmethod)):
+            continue
+        setattr(cls, attr, timed(f"{prefix}.{attr}")(value))
+    return cls
+
+
+# 計數器：KDF 次數、條目解密次數、各快取的命中與未命中等只需計數的事件
+def increment(name, amount=1):
+    if not ENABLED:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+# 註冊額外的統計來源（例如快取命中率），快照時一併呼叫
+def register_source(name, func):
+    if ENABLED:
+        _sources[name] = func
+
+
+# 由直方圖估計百分位數，回傳該桶的上界（微秒）
+def _percentile(buckets, count, ratio):
+    target = count * ratio
+    seen = 0
+    for i, bucket_count in enumerate(buckets):
+        seen += bucket_count
+        if seen >= target:
+            return float(2 ** i)
+    return float(2 ** (BUCKET_COUNT - 1))
+
+
+def snapshot():
+    with _lock:
+        timers = {name: (timer[0], timer[1], timer[2], timer[3], list(timer[4])) for name, timer in _timers.items()}
+        counters = dict(_counters)
+
+    sources = {}
+    for name, func in list(_sources.items()):
+        try:
+            sources[name] = func()
+        except Exception as e:
+            sources[name] = {"error": str(e)}
+
+    return {
+        "enabled": ENABLED,
+        "timers": {
+            name: {
+                "count": count,
+                "total_ms": total_us / 1000,
+                "mean_us": total_us / count,
+                "min_us": min_us,
+                "max_us": max_us,
+                "p50_us": min(_percentile(buckets, count, 0.5), max_us),
+                "p95_us": min(_percentile(buckets, count, 0.95), max_us),
+                "p99_us": min(_percentile(buckets, count, 0.99), max_us),
+                "buckets": buckets,
+            }
+            for name, (count, total_us, min_us, max_us, buckets) in sorted(timers.items())
+        },
+        "counters": counters,
+        "sources": sources,
+    }
+
+
+def reset():
+    with _lock:
+        _timers.clear()
+        _counters.clear()
+
+
+def get_dump_path():
+    custom_path = os.getenv("PASSWORD_MANAGER_DIAGNOSTICS_FILE")
+    if custom_path:
+        return os.path.abspath(custom_path)
+    from utils.path_helper import get_user_settings_path
+    return os.path.join(get_user_settings_path(), "diagnostics.json")
+
+
+def dump(path=None):
+    path = path or get_dump_path()
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(snapshot(), f, ensure_ascii=False, indent=2)
+        return True
+    except OSError as e:
+        print(f"診斷資料寫入錯誤 {e}")
+        return False
+
+
+if ENABLED:
+    atexit.register(dump)
@@ -0,0 +1,63 @@
+from PyQt6.QtCore import Qt, QThreadPool
+from PyQt6.QtWidgets import QMessageBox, QProgressDialog
+
+from utils.rekey_worker import RekeyWorker
+
+
+# 資料金鑰輪替的進度視窗：重新加密在背景執行，可暫停，下次登入時自動繼續
+class KeyRotationManager:
+    def __init__(self, parent, db_manager, thread_pool=None):
+        self.parent = parent
+        self.db_manager = db_manager
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self.worker = None
+        self.progress_dialog = None
+        self.on_finished = None
+
+    def is_running(self):
+        return self.worker is not None
+
+    # on_finished 在背景工作結束（完成、暫停或失敗）後呼叫
+    def start(self, on_finished=None):
+        if self.worker is not None:
+            return
+        self.on_finished = on_finished
+
+        worker = RekeyWorker(self.db_manager)
+        worker.signals.progress.connect(self._update_progress)
+        worker.signals.finished.connect(self._on_finished)
+
+        self.progress_dialog = QProgressDialog("正在重新加密資料...", "暫停", 0, 0, self.parent)
+        self.progress_dialog.setWindowTitle("更換資料金鑰")
+        self.progress_dialog.setWindowModality(Qt.WindowModality.ApplicationModal)
+        self.progress_dialog.setMinimumDuration(0)
+        self.progress_dialog.canceled.connect(worker.cancel)
+        self.progress_dialog.show()
+
+        self.worker = worker
+        self.thread_pool.start(worker)
+
+    def _update_progress(self, done, total):
+        if not self.progress_dialog:
+            return
+        self.progress_dialog.setMaximum(total)
+        self.progress_dialog.setValue(done)
+        self.progress_dialog.setLabelText(f"已重新加密 {done} / {total} 項")
+
+    def _on_finished(self, complete, error):
+        self.worker = None
+        if self.progress_dialog:
+            self.progress_dialog.canceled.disconnect()
+            self.progress_dialog.close()
+            self.progress_dialog = None
+
+        self.db_manager.finish_key_rotation_session()
+        if complete:
+            QMessageBox.information(self.parent, "訊息", "資料已使用新的金鑰重新加密")
+        elif error:
+            QMessageBox.warning(self.parent, "訊息", f"重新加密失敗，下次登入時會再嘗試：\n{error}")
+        else:
+            QMessageBox.information(self.parent, "訊息", "已暫停重新加密，下次登入時會從中斷處繼續")
+
+        if self.on_finished:
+            self.on_finished()
@@ -0,0 +1,136 @@
+import bisect
+import itertools
+import unicodedata
+
+# 名稱之間的分隔字元，查詢字串中不會出現
+SEPARATOR = "\x00"
+
+# 比這更短的查詢通常會命中大部分名稱，逐筆比對比 str.find 加 bisect 更快
+SHORT_QUERY_LENGTH = 3
+
+
+def normalize_name(name):
+    return unicodedata.normalize("NFKC", name or "").casefold().replace(SEPARATOR, "")
+
+
+# 名稱的記憶體搜尋索引：依 order_index 排序的正規化名稱串成一個字串，子字串搜尋交給 str.find
+# 每個名稱的起始位置另存一份，找到的位置以 bisect 換回是第幾筆，結果天生維持列表順序
+# 查詢字串只是在上一次查詢後繼續輸入時，直接從上一次的結果中篩選
+class NameSearchIndex:
+    def __init__(self):
+        self._entries = {}  # name -> (正規化名稱, order_index, category)
+        self._built = False
+        self._reset_layout()
+        self._reset_last()
+
+    def is_built(self):
+        return self._built
+
+    # rows: [(name, order_index, category), ...]，已依 order_index 排序時重排幾乎不花時間
+    def build(self, rows):
+        self.clear()
+        for name, order_index, category in rows:
+            self._entries[name] = (normalize_name(name), order_index, category)
+        self._built = True
+
+    def clear(self):
+        self._entries = {}
+        self._built = False
+        self._reset_layout()
+        self._reset_last()
+
+    def add(self, name, order_index, category):
+        if not self._built:
+            return
+        self._entries[name] = (normalize_name(name), order_index, category)
+        self._changed()
+
+    def remove(self, name):
+        if not self._built:
+            return
+        self._entries.pop(name, None)
+        self._changed()
+
+    def rename(self, old_name, new_name, category):
+        if not self._built or old_name not in self._entries:
+            self.clear()
+            return
+        order_index = self._entries.pop(old_name)[1]
+        self._entries[new_name] = (normalize_name(new_name), order_index, category)
+        self._changed()
+
+    def move(self, name, order_index):
+        if not self._built or name not in self._entries:
+            self.clear()
+            return
+        normalized, _, category = self._entries[name]
+        self._entries[name] = (normalized, order_index, category)
+        self._changed()
+
+    # 回傳依 order_index 排序的名稱清單；category 為 None 或「全部」時不限分類
+    def search(self, query, category=None):
+        query = normalize_name(query)
+        if category == "全部":
+            category = None
+
+        if (self._last_result is not None and self._last_category == category
+                and self._last_query and self._last_query in query):
+            # 新的查詢包含上一次的查詢，結果必定是上一次結果的子集
+            rows = [row for row in self._last_result if query in row[1]]
+        else:
+            rows = self._scan(query, category)
+
+        self._last_query = query
+        self._last_category = category
+        self._last_result = rows
+        return [name for name, _ in rows]
+
+    # 回傳 [(name, 正規化名稱), ...]
+    def _scan(self, query, category):
+        self._ensure_layout()
+        rows = self._rows
+        if category is not None:
+            entries = self._entries
+            rows_in_category = lambda matched: [row for row in matched if entries[row[0]][2] == category]
+        else:
+            rows_in_category = lambda matched: matched
+
+        if len(query) < SHORT_QUERY_LENGTH:
+            return rows_in_category([row for row in rows if query in row[1]])
+
+        starts = self._starts
+        haystack = self._haystack
+        matched = []
+        position = haystack.find(query)
+        while position != -1:
+            index = bisect.bisect_right(starts, position) - 1
+            matched.append(rows[index])
+            # 同一個名稱只算一次，從下一個名稱開始繼續找
+            if index + 1 >= len(starts):
+                break
+            position = haystack.find(query, starts[index + 1])
+        return rows_in_category(matched)
+
+    def _ensure_layout(self):
+        if self._haystack is not None:
+            return
+        entries = self._entries
+        rows = [(name, entries[name][0]) for name in sorted(entries, key=lambda name: entries[name][1])]
+        normalized = [row[1] for row in rows]
+        self._rows = rows
+        self._starts = [0, *itertools.accumulate(len(text) + 1 for text in normalized)][:len(rows)]
+        self._haystack = SEPARATOR.join(normalized)
+
+    def _changed(self):
+        self._reset_layout()
+        self._reset_last()
+
+    def _reset_layout(self):
+        self._rows = []  # [(name, 正規化名稱), ...]，依 order_index 排序
+        self._starts = []
+        self._haystack = None
+
+    def _reset_last(self):
+        self._last_query = None
+        self._last_category = None
+        self._last_result = None
@@ -1,23 +1,32 @@
 import base64
-import bcrypt
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+import json
+
+from utils.instrumentation import increment, timed
+
+# bcrypt 與 cryptography 在第一次使用時才匯入，登入畫面顯示前不必載入
 
 # 主程式密碼加密
+@timed("crypto.hash_password")
 def hash_password(password):
+    import bcrypt
     return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
 
+@timed("crypto.verify_password")
 def verify_password(entered_password, stored_hashed_password):
     # 驗證主程式密碼是否正確
+    import bcrypt
     try:
         return bcrypt.checkpw(entered_password.encode(), stored_hashed_password.encode())
     except ValueError:
         return False
 
 # 從主密碼生成對稱加密金鑰
+@timed("crypto.generate_key_from_password")
 def generate_key_from_password(master_password, salt):
     # 使用PBKDF2將主密碼轉換為一個適合Fernet的金鑰
+    increment("crypto.kdf_runs")
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
         length=32,
@@ -27,29 +36,88 @@ def generate_key_from_password(master_password, salt):
     key = base64.urlsafe_b64encode(kdf.derive(master_password.encode()))
     return key
 
-# 使用主密碼加密用戶密碼
-def encrypt_password(password, master_password, salt):
+# 從主密碼建立可重複使用的加密器（只推導一次金鑰）
+def create_cipher(master_password, salt):
+    from cryptography.fernet import Fernet
+    return Fernet(generate_key_from_password(master_password, salt))
+
+# 使用已建立的加密器加密
+def encrypt_with_cipher(password, cipher):
     if not password:  # 處理空密碼的情況
         return ""
-    
-    key = generate_key_from_password(master_password, salt)
-    cipher = Fernet(key)
+
     encrypted_password = cipher.encrypt(password.encode())
     # 返回加密後的密碼(轉為字符串存儲)
     return base64.urlsafe_b64encode(encrypted_password).decode()
 
-# 使用主密碼解密用戶密碼
-def decrypt_password(encrypted_password, master_password, salt):
+# 使用已建立的加密器解密
+def decrypt_with_cipher(encrypted_password, cipher):
     if not encrypted_password:  # 處理空加密密碼的情況
         return ""
-    
+
     try:
-        key = generate_key_from_password(master_password, salt)
-        cipher = Fernet(key)
         # 先將字符串轉回二進制格式
         encrypted_bytes = base64.urlsafe_b64decode(encrypted_password.encode())
-        decrypted_password = cipher.decrypt(encrypted_bytes).decode()
-        return decrypted_password
-    except Exception as e:
+        return cipher.decrypt(encrypted_bytes).decode()
+    except Exception:
         # 解密失敗的情況
-        return ""
\ No newline at end of file
+        return ""
+
+# 產生隨機的金庫資料金鑰，實際用來加密所有條目
+def generate_vault_key():
+    from cryptography.fernet import Fernet
+    return Fernet.generate_key()
+
+# 以主密碼推導出的加密器包裝資料金鑰
+def wrap_vault_key(vault_key, master_cipher):
+    return master_cipher.encrypt(vault_key).decode()
+
+# 以主密碼推導出的加密器解開資料金鑰
+def unwrap_vault_key(wrapped_key, master_cipher):
+    return master_cipher.decrypt(wrapped_key.encode())
+
+# 資料金鑰輪替期間傳入 (新金鑰, 舊金鑰)：以新金鑰加密，新舊金鑰加密的內容都能解密
+def create_vault_cipher(vault_key):
+    from cryptography.fernet import Fernet, MultiFernet
+    if isinstance(vault_key, (list, tuple)):
+        return MultiFernet([Fernet(key) for key in vault_key])
+    return Fernet(vault_key)
+
+# 加密整筆條目的序列化內容（Fernet token 本身即為 base64，不再重複編碼）
+def encrypt_record(payload, cipher):
+    return cipher.encrypt(payload.encode()).decode()
+
+def decrypt_record(token, cipher):
+    return cipher.decrypt(token.encode()).decode()
+
+# 帳號、密碼、備註序列化成一份內容後一次加密
+@timed("crypto.encrypt_entry")
+def encrypt_entry(account, password, notes, cipher):
+    payload = json.dumps([account or "", password or "", notes or ""],
+                         ensure_ascii=False, separators=(",", ":"))
+    return encrypt_record(payload, cipher)
+
+@timed("crypto.decrypt_entry")
+def decrypt_entry(token, cipher):
+    account, password, notes = json.loads(decrypt_record(token, cipher))
+    return account, password, notes
+
+# 使用主密碼加密用戶密碼
+@timed("crypto.encrypt_password")
+def encrypt_password(password, master_password, salt):
+    if not password:  # 處理空密碼的情況
+        return ""
+
+    return encrypt_with_cipher(password, create_cipher(master_password, salt))
+
+# 使用主密碼解密用戶密碼
+@timed("crypto.decrypt_password")
+def decrypt_password(encrypted_password, master_password, salt):
+    if not encrypted_password:  # 處理空加密密碼的情況
+        return ""
+
+    try:
+        cipher = create_cipher(master_password, salt)
+    except Exception:
+        return ""
+    return decrypt_with_cipher(encrypted_password, cipher)
\ No newline at end of file
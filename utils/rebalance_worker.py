@@ -0,0 +1,26 @@
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from Database.db_manager import DBManager
+
+
+class RebalanceWorkerSignals(QObject):
+    finished = pyqtSignal(bool, str)  # 是否成功, 錯誤訊息
+
+
+# 在 QThreadPool 中重新編排全部條目的 order_index，條目很多時需要數百毫秒，不在 UI 執行緒執行
+class RebalanceWorker(QRunnable):
+    def __init__(self, db_manager):
+        super().__init__()
+        self.db_manager = db_manager
+        self.signals = RebalanceWorkerSignals()
+
+    def run(self):
+        # 背景執行緒使用自己的資料庫連線；只更新順序欄位，不需要資料金鑰
+        db_manager = DBManager(profile=self.db_manager.profile)
+        try:
+            db_manager.rebalance_order_indices()
+            self.signals.finished.emit(True, "")
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+        finally:
+            db_manager.close()
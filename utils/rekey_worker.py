@@ -0,0 +1,41 @@
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from Database.db_manager import DBManager
+
+
+class RekeyWorkerSignals(QObject):
+    progress = pyqtSignal(int, int)  # 已完成筆數, 總筆數
+    finished = pyqtSignal(bool, str)  # 是否全部完成, 錯誤訊息
+
+
+# 在 QThreadPool 中分批重新加密，每批與進度記錄一起提交，取消或中斷後可從最後一批繼續
+class RekeyWorker(QRunnable):
+    def __init__(self, db_manager, batch_size=1024):
+        super().__init__()
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.signals = RekeyWorkerSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        # 背景執行緒使用自己的資料庫連線
+        db_manager = DBManager.from_session(self.db_manager)
+        try:
+            while not self._cancelled:
+                result = db_manager.rotate_key_batch(self.batch_size)
+                if result is None:
+                    self.signals.finished.emit(True, "")
+                    return
+                done, total, complete = result
+                self.signals.progress.emit(done, total)
+                if complete:
+                    self.signals.finished.emit(True, "")
+                    return
+            self.signals.finished.emit(False, "")
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+        finally:
+            db_manager.close()
@@ -3,7 +3,25 @@ from PyQt6.QtCore import QSize
 from PyQt6.QtWidgets import QWidget
 from .svg_icon_set import SvgIconManager
 
+# 登入後選單、搜尋框與密碼欄位會用到的圖示，啟動時預先繪製
+PREWARM_ICONS = [
+    ("account.svg", QSize(60, 60)),
+    ("logout.svg", QSize(60, 60)),
+    ("import.svg", QSize(60, 60)),
+    ("export.svg", QSize(60, 60)),
+    ("settings.svg", QSize(60, 60)),
+    ("about.svg", QSize(60, 60)),
+    ("clear.svg", QSize(20, 20)),
+    ("show_eye.svg", QSize(20, 20)),
+    ("hide_eye.svg", QSize(20, 20)),
+]
+
 class IconHelper:
+    @staticmethod
+    def prewarm(widget: QWidget):
+        for icon_name, size in PREWARM_ICONS:
+            SvgIconManager.create_icon(icon_name, color=None, size=size, widget=widget)
+
     @staticmethod
     def get_user_icon(widget: QWidget, size: QSize) -> QIcon:
         # 獲取用戶圖標
@@ -62,4 +80,4 @@ class IconHelper:
     @staticmethod
     def get_eye_hide_icon(widget: QWidget, size: QSize) -> QIcon:
         # 獲取隱藏密碼圖標（眼睛關閉）
-        return SvgIconManager.create_icon("hide_eye.svg", color=None, size=size, widget=widget)
\ No newline at end of file
+        return SvgIconManager.create_icon("hide_eye.svg", color=None, size=size, widget=widget)
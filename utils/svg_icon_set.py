@@ -3,15 +3,58 @@ from PyQt6.QtCore import QSize, Qt, QTimer
 from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtWidgets import QLineEdit, QWidget
 from utils.path_helper import resource_path
+from utils.instrumentation import increment, timed
 
 class SvgIconManager:
+    # 全程式共用的圖示快取：(icon_name, 寬, 高, color, devicePixelRatio) -> QIcon
+    _icon_cache = {}
+    _renderer_cache = {}
+    hits = 0
+    misses = 0
+
     @staticmethod
     def create_icon(icon_name: str, size: QSize, color: str = None, widget: QWidget = None) -> QIcon:
-        icon_path = resource_path(f"icon/{icon_name}")
-        
-        color = SvgIconManager.get_theme_color(widget)
+        if color is None:
+            color = SvgIconManager.get_theme_color(widget)
+        device_pixel_ratio = widget.devicePixelRatioF() if widget else 1.0
+
+        key = (icon_name, size.width(), size.height(), color, device_pixel_ratio)
+        icon = SvgIconManager._icon_cache.get(key)
+        if icon is not None:
+            SvgIconManager.hits += 1
+            increment("icon_cache.hits")
+            return icon
+
+        SvgIconManager.misses += 1
+        increment("icon_cache.misses")
+        icon = SvgIconManager._colored_svg_icon(SvgIconManager._get_renderer(icon_name), color, size,
+                                                device_pixel_ratio)
+        SvgIconManager._icon_cache[key] = icon
+        return icon
+
+    # 主題切換後舊顏色的圖示不再使用，只移除該顏色的版本
+    @staticmethod
+    def invalidate_color(color: str):
+        for key in [key for key in SvgIconManager._icon_cache if key[3] == color]:
+            del SvgIconManager._icon_cache[key]
 
-        return SvgIconManager._colored_svg_icon(icon_path, color, size)
+    @staticmethod
+    def stats():
+        return {'entries': len(SvgIconManager._icon_cache), 'hits': SvgIconManager.hits,
+                'misses': SvgIconManager.misses}
+
+    @staticmethod
+    def clear_cache():
+        SvgIconManager._icon_cache.clear()
+        SvgIconManager._renderer_cache.clear()
+
+    @staticmethod
+    def _get_renderer(icon_name: str) -> QSvgRenderer:
+        renderer = SvgIconManager._renderer_cache.get(icon_name)
+        if renderer is None:
+            renderer = QSvgRenderer(resource_path(f"icon/{icon_name}"))
+            SvgIconManager._renderer_cache[icon_name] = renderer
+        return renderer
     
     @staticmethod  
     def get_theme_color(widget: QWidget) -> str:
@@ -22,10 +65,12 @@ class SvgIconManager:
         
         return icon_color
     
+    # 依裝置像素比例放大繪製，高解析度螢幕上不會模糊
     @staticmethod
-    def _colored_svg_icon(svg_path: str, color: str, size: QSize) -> QIcon:
-        renderer = QSvgRenderer(svg_path)
-        pixmap = QPixmap(size)
+    @timed("icon.render")
+    def _colored_svg_icon(renderer: QSvgRenderer, color: str, size: QSize, device_pixel_ratio: float = 1.0) -> QIcon:
+        pixmap = QPixmap(size * device_pixel_ratio)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
         pixmap.fill(Qt.GlobalColor.transparent)
 
         painter = QPainter(pixmap)
@@ -0,0 +1,125 @@
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+
+from PyQt6.QtCore import QDir
+from PyQt6.QtGui import QColor, QFontDatabase, QGuiApplication, QPalette
+
+from utils.instrumentation import increment
+from utils.path_helper import get_user_settings_path
+
+# 快取格式改變時遞增，舊的快取目錄會被忽略
+CACHE_FORMAT = 1
+
+
+def _get_qt_material_dir():
+    spec = importlib.util.find_spec("qt_material")
+    return spec.submodule_search_locations[0]
+
+
+# qt_material 編譯好的 QSS 與產生的圖示存放在 ~/.password_manager/theme_cache
+# 快取鍵包含主題檔與 qt_material 本身的檔案資訊，升級套件後會自動重新產生
+# 命中時只需讀檔與 setStyleSheet，不必匯入 qt_material、渲染 Jinja 樣板或重寫圖示
+class ThemeStylesheetCache:
+    _fonts_loaded = False
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or os.path.join(get_user_settings_path(), "theme_cache")
+        self.qt_material_dir = _get_qt_material_dir()
+        self.hits = 0
+        self.misses = 0
+
+    def apply(self, widget, theme_file):
+        theme_dir = os.path.join(self.cache_dir, self.get_cache_key(theme_file))
+        stylesheet, meta = self._load(theme_dir)
+        if stylesheet is None:
+            self.misses += 1
+            increment("theme_cache.misses")
+            try:
+                stylesheet, meta = self._build(theme_dir, theme_file)
+            except OSError as e:
+                # 快取目錄無法寫入時直接交給 qt_material 套用
+                print(f"主題快取寫入錯誤 {e}")
+                from qt_material import apply_stylesheet
+                apply_stylesheet(widget, theme=theme_file)
+                return
+        else:
+            self.hits += 1
+            increment("theme_cache.hits")
+
+        self._load_fonts()
+        # 以 setSearchPaths 取代 addSearchPath，切換主題時不會沿用前一個主題的圖示
+        QDir.setSearchPaths("icon", [os.path.join(theme_dir, "icons")])
+        self._set_text_color(meta["primary_color"])
+        widget.setStyleSheet(stylesheet)
+
+    def get_cache_key(self, theme_file):
+        digest = hashlib.sha1(f"{CACHE_FORMAT}:{theme_file}".encode("utf-8"))
+        for path in (os.path.join(self.qt_material_dir, "themes", theme_file),
+                     os.path.join(self.qt_material_dir, "material.qss.template"),
+                     os.path.join(self.qt_material_dir, "__init__.py")):
+            stat = os.stat(path)
+            digest.update(f":{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+        return f"{os.path.splitext(theme_file)[0]}-{digest.hexdigest()[:16]}"
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _load(self, theme_dir):
+        try:
+            with open(os.path.join(theme_dir, "style.qss"), encoding="utf-8") as f:
+                stylesheet = f.read()
+            with open(os.path.join(theme_dir, "meta.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+            return stylesheet, meta
+        except (OSError, ValueError):
+            return None, None
+
+    # 先寫到暫存目錄，完成後再改名，中途失敗不會留下不完整的快取
+    def _build(self, theme_dir, theme_file):
+        from qt_material import build_stylesheet, get_theme
+
+        tmp_dir = f"{theme_dir}.tmp-{os.getpid()}"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        try:
+            stylesheet = build_stylesheet(theme_file, parent=os.path.join(tmp_dir, "icons"))
+            if stylesheet is None:
+                raise ValueError(f"找不到主題檔 {theme_file}")
+            # build_stylesheet 已註冊過字型
+            ThemeStylesheetCache._fonts_loaded = True
+            meta = {"theme_file": theme_file, "primary_color": get_theme(theme_file)["primaryColor"]}
+
+            with open(os.path.join(tmp_dir, "style.qss"), "w", encoding="utf-8") as f:
+                f.write(stylesheet)
+            with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+
+            shutil.rmtree(theme_dir, ignore_errors=True)
+            os.replace(tmp_dir, theme_dir)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return stylesheet, meta
+
+    # 與 qt_material.add_fonts 相同，每個行程只需註冊一次
+    def _load_fonts(self):
+        if ThemeStylesheetCache._fonts_loaded:
+            return
+        fonts_dir = os.path.join(self.qt_material_dir, "fonts", "roboto")
+        for font in os.listdir(fonts_dir):
+            if font.endswith(".ttf"):
+                QFontDatabase.addApplicationFont(os.path.join(fonts_dir, font))
+        ThemeStylesheetCache._fonts_loaded = True
+
+    # 與 qt_material.build_stylesheet 相同，把應用程式調色盤的文字顏色設為半透明的主色
+    @staticmethod
+    def _set_text_color(primary_color):
+        palette = QGuiApplication.palette()
+        color = QColor(*[int(primary_color[i:i + 2], 16) for i in range(1, 6, 2)], 92)
+        palette.setColor(QPalette.ColorRole.Text, color)
+        QGuiApplication.setPalette(palette)